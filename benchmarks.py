@@ -0,0 +1,330 @@
+"""
+BENCHMARKS DE ESTRUCTURAS DE DATOS
+Mide el rendimiento de Cola y Grafo con distintos tamaños y cargas
+
+Uso:
+    python benchmarks.py --tamanos 1000 10000 --salida resultados.json
+    python benchmarks.py --baseline resultados.json --umbral 0.25
+
+Cada tiempo es el mejor de --repeticiones ejecuciones. Con --baseline el
+proceso termina con código 1 si alguna medición es más lenta que la de
+referencia en más del umbral indicado, también en una segunda pasada de
+confirmación; las de referencia menores a --minimo milisegundos se
+ignoran por ruidosas.
+"""
+
+import argparse
+import bisect
+import json
+import random
+import sys
+import threading
+import time
+import timeit
+
+from ejercicio import Cola, ColaConcurrente, ColaPrioridad
+from grafo_ejemplos import EstadisticasBusqueda, Grafo
+
+
+# Generadores de grafos sintéticos (deterministas con la misma semilla)
+
+def generar_aleatorio(n, grado_medio=4, semilla=0):
+    """Aristas de un grafo aleatorio uniforme con n vértices"""
+    azar = random.Random(semilla)
+    return [(azar.randrange(n), azar.randrange(n), azar.randint(1, 100))
+            for _ in range(n * grado_medio // 2)]
+
+
+def generar_rejilla(n, semilla=0):
+    """Aristas de una rejilla cuadrada de aproximadamente n vértices"""
+    azar = random.Random(semilla)
+    lado = max(1, int(n ** 0.5))
+    aristas = []
+    for i in range(lado):
+        for j in range(lado):
+            vertice = i * lado + j
+            if j + 1 < lado:
+                aristas.append((vertice, vertice + 1, azar.randint(1, 100)))
+            if i + 1 < lado:
+                aristas.append((vertice, vertice + lado, azar.randint(1, 100)))
+    return aristas
+
+
+def generar_ley_potencias(n, m=2, semilla=0):
+    """Aristas de un grafo con grados en ley de potencias (Barabási-Albert)"""
+    azar = random.Random(semilla)
+    aristas = []
+    extremos = []  # cada vértice aparece tantas veces como su grado
+    for vertice in range(1, n):
+        for _ in range(min(m, vertice)):
+            destino = azar.choice(extremos) if extremos else 0
+            aristas.append((vertice, destino, azar.randint(1, 100)))
+            extremos.extend((vertice, destino))
+    return aristas
+
+
+def generar_cadena(n, semilla=0):
+    """Aristas de una cadena 0-1-2-...-(n-1), el peor caso de profundidad"""
+    azar = random.Random(semilla)
+    return [(i, i + 1, azar.randint(1, 100)) for i in range(n - 1)]
+
+
+GENERADORES = {
+    'aleatorio': generar_aleatorio,
+    'rejilla': generar_rejilla,
+    'ley_potencias': generar_ley_potencias,
+    'cadena': generar_cadena,
+}
+
+
+# Mediciones
+
+REPETICIONES = 5
+
+
+def medir(funcion, *argumentos, repeticiones=REPETICIONES):
+    """Retorna los segundos de la ejecución más rápida de funcion(*argumentos)
+
+    El mínimo de varias repeticiones descarta las interrupciones del
+    sistema, que solo pueden hacer más lenta una medición.
+    """
+    return min(timeit.repeat(lambda: funcion(*argumentos), repeat=repeticiones, number=1))
+
+
+def _agregar_una_a_una(aristas):
+    grafo = Grafo()
+    for u, v, peso in aristas:
+        grafo.agregar_arista(u, v, peso)
+    return grafo
+
+
+def benchmark_grafo(nombre, n, semilla=0, repeticiones=REPETICIONES):
+    """Mide construcción y recorridos de un grafo generado; retorna {clave: segundos}"""
+    aristas = GENERADORES[nombre](n, semilla=semilla)
+    resultados = {f'grafo/{nombre}/{n}/agregar_arista':
+                  medir(_agregar_una_a_una, aristas, repeticiones=repeticiones)}
+    grafo = _agregar_una_a_una(aristas)
+    origen = aristas[0][0] if aristas else 0
+    for operacion in ('bfs', 'dfs', 'dijkstra'):
+        segundos = medir(getattr(grafo, operacion), origen, repeticiones=repeticiones)
+        resultados[f'grafo/{nombre}/{n}/{operacion}'] = segundos
+    return resultados
+
+
+def benchmark_cola(n, repeticiones=REPETICIONES):
+    """Mide encolar y desencolar n elementos (mejor de varias); retorna {clave: segundos}"""
+    encolar = desencolar = float('inf')
+    for _ in range(repeticiones):
+        cola = Cola()
+        inicio = time.perf_counter()
+        for i in range(n):
+            cola.encolar(i)
+        medio = time.perf_counter()
+        while not cola.esta_vacia():
+            cola.desencolar()
+        fin = time.perf_counter()
+        encolar = min(encolar, medio - inicio)
+        desencolar = min(desencolar, fin - medio)
+    return {f'cola/{n}/encolar': encolar, f'cola/{n}/desencolar': desencolar}
+
+
+def benchmark_landmarks(n, k=8, consultas=100, semilla=0):
+    """Vértices fijados por consulta: dijkstra con destino frente a ALT
+
+    Usa una rejilla ponderada (similar a un mapa de carreteras). Retorna
+    {clave: promedio de vértices fijados por consulta}.
+    """
+    grafo = Grafo.desde_aristas(generar_rejilla(n, semilla=semilla))
+    indice = grafo.preparar_landmarks(k, semilla)
+    azar = random.Random(semilla)
+    vertices = list(grafo.grafo)
+    fijados_dijkstra = fijados_alt = 0
+    for _ in range(consultas):
+        origen, destino = azar.choice(vertices), azar.choice(vertices)
+        medidas = EstadisticasBusqueda()
+        grafo.dijkstra(origen, destino, estadisticas=medidas)
+        fijados_dijkstra += medidas.extraidos - medidas.descartados
+        fijados_alt += indice.ruta(origen, destino)[2]
+    return {f'landmarks/{n}/fijados_dijkstra': fijados_dijkstra / consultas,
+            f'landmarks/{n}/fijados_alt': fijados_alt / consultas}
+
+
+def benchmark_prioridad(n, semilla=0, repeticiones=REPETICIONES):
+    """Compara ColaPrioridad con ordenar una lista en cada inserción
+
+    Ordenar al insertar cuesta O(n log n) por operación, así que solo se
+    mide hasta 10^4 elementos. Retorna {clave: segundos}.
+    """
+    azar = random.Random(semilla)
+    prioridades = [azar.random() for _ in range(n)]
+    
+    def con_monticulo():
+        cola = ColaPrioridad()
+        for i, prioridad in enumerate(prioridades):
+            cola.encolar(i, prioridad)
+        while not cola.esta_vacia():
+            cola.desencolar()
+    
+    def ordenando():
+        lista = []
+        for i, prioridad in enumerate(prioridades):
+            lista.append((prioridad, i))
+            lista.sort()
+        while lista:
+            lista.pop(0)
+    
+    def con_bisect():
+        lista = []
+        for i, prioridad in enumerate(prioridades):
+            bisect.insort(lista, (prioridad, i))
+        while lista:
+            lista.pop(0)
+    
+    resultados = {
+        f'prioridad/{n}/colaprioridad': medir(con_monticulo, repeticiones=repeticiones),
+        f'prioridad/{n}/insercion_bisect': medir(con_bisect, repeticiones=repeticiones),
+    }
+    if n <= 10_000:
+        resultados[f'prioridad/{n}/ordenar_al_insertar'] = medir(ordenando,
+                                                                 repeticiones=repeticiones)
+    return resultados
+
+
+def benchmark_concurrente(productores, consumidores, n=100_000, capacidad=1024):
+    """Mide el rendimiento de ColaConcurrente con varios productores y consumidores
+
+    Cada productor encola n // productores elementos; los consumidores
+    desencolan hasta recibir una marca de fin. Retorna operaciones por segundo.
+    """
+    cola = ColaConcurrente(capacidad=capacidad)
+    por_productor = n // productores
+    fin = object()
+    
+    def producir():
+        for i in range(por_productor):
+            cola.encolar(i)
+    
+    def consumir():
+        while cola.desencolar() is not fin:
+            pass
+    
+    hilos_consumidores = [threading.Thread(target=consumir) for _ in range(consumidores)]
+    hilos_productores = [threading.Thread(target=producir) for _ in range(productores)]
+    
+    inicio = time.perf_counter()
+    for hilo in hilos_consumidores + hilos_productores:
+        hilo.start()
+    for hilo in hilos_productores:
+        hilo.join()
+    for _ in range(consumidores):
+        cola.encolar(fin)
+    for hilo in hilos_consumidores:
+        hilo.join()
+    segundos = time.perf_counter() - inicio
+    
+    return por_productor * productores / segundos
+
+
+def ejecutar(tamanos, generadores, semilla=0, repeticiones=REPETICIONES):
+    """Ejecuta la suite completa; retorna {clave: segundos}"""
+    resultados = {}
+    for n in tamanos:
+        for nombre in generadores:
+            resultados.update(benchmark_grafo(nombre, n, semilla, repeticiones))
+        resultados.update(benchmark_cola(n, repeticiones))
+        if n <= 100_000:
+            resultados.update(benchmark_prioridad(n, semilla, repeticiones))
+    return resultados
+
+
+def comparar(resultados, referencia, umbral=0.25, minimo=5e-3):
+    """Lista de (clave, antes, ahora) más lentos que referencia * (1 + umbral)
+
+    Se ignoran mediciones de referencia menores a `minimo` segundos, que
+    son demasiado ruidosas para comparar.
+    """
+    regresiones = []
+    for clave, antes in referencia.items():
+        ahora = resultados.get(clave)
+        if ahora is None or antes < minimo:
+            continue
+        if ahora > antes * (1 + umbral):
+            regresiones.append((clave, antes, ahora))
+    return regresiones
+
+
+def main(argumentos=None):
+    """Ejecuta los benchmarks y muestra los resultados; retorna el código de salida"""
+    parser = argparse.ArgumentParser(description="Benchmarks de Cola y Grafo")
+    parser.add_argument('--tamanos', type=int, nargs='+', default=[1000, 10_000, 100_000],
+                        help="cantidades de elementos (hasta 10^7)")
+    parser.add_argument('--generadores', nargs='+', default=list(GENERADORES),
+                        choices=list(GENERADORES))
+    parser.add_argument('--semilla', type=int, default=0)
+    parser.add_argument('--salida', help="archivo JSON donde guardar los resultados")
+    parser.add_argument('--baseline', help="archivo JSON de referencia para comparar")
+    parser.add_argument('--umbral', type=float, default=0.25,
+                        help="lentitud relativa tolerada frente al baseline (0.25 = 25%%)")
+    parser.add_argument('--repeticiones', type=int, default=REPETICIONES,
+                        help="ejecuciones por medición; se guarda la más rápida")
+    parser.add_argument('--minimo', type=float, default=5.0,
+                        help="ms de referencia por debajo de los cuales no se compara")
+    parser.add_argument('--landmarks', action='store_true',
+                        help="mide vértices fijados por consulta con y sin ALT")
+    parser.add_argument('--concurrente', action='store_true',
+                        help="mide también ColaConcurrente con 1, 2, 4 y 8 hilos")
+    opciones = parser.parse_args(argumentos)
+    if opciones.repeticiones < 1:
+        parser.error("--repeticiones debe ser al menos 1")
+    
+    print("\n" + "="*60)
+    print("BENCHMARKS DE COLA Y GRAFO")
+    print("="*60)
+    resultados = ejecutar(opciones.tamanos, opciones.generadores, opciones.semilla,
+                          opciones.repeticiones)
+    for clave, segundos in resultados.items():
+        print(f"{clave:<45} {segundos * 1000:>12.2f} ms")
+    
+    if opciones.landmarks:
+        print("\n--- Landmarks (ALT): vértices fijados por consulta ---")
+        for n in opciones.tamanos:
+            for clave, promedio in benchmark_landmarks(n, semilla=opciones.semilla).items():
+                print(f"{clave:<45} {promedio:>12.1f}")
+    
+    if opciones.concurrente:
+        print("\n--- ColaConcurrente (productores/consumidores) ---")
+        for trabajadores in (1, 2, 4, 8):
+            operaciones = benchmark_concurrente(trabajadores, trabajadores)
+            print(f"{trabajadores} productores / {trabajadores} consumidores: "
+                  f"{operaciones:,.0f} elementos/s")
+    
+    if opciones.salida:
+        with open(opciones.salida, 'w', encoding='utf-8') as archivo:
+            json.dump({'semilla': opciones.semilla, 'resultados': resultados},
+                      archivo, indent=2)
+    
+    if opciones.baseline:
+        with open(opciones.baseline, encoding='utf-8') as archivo:
+            referencia = json.load(archivo)['resultados']
+        regresiones = comparar(resultados, referencia, opciones.umbral,
+                               opciones.minimo / 1000)
+        if regresiones:
+            # Una segunda pasada descarta las lentitudes pasajeras de la máquina
+            print("\nPosibles regresiones; repitiendo la suite para confirmarlas...")
+            repeticion = ejecutar(opciones.tamanos, opciones.generadores, opciones.semilla,
+                                  opciones.repeticiones)
+            mejores = {clave: min(segundos, repeticion.get(clave, segundos))
+                       for clave, segundos in resultados.items()}
+            regresiones = comparar(mejores, referencia, opciones.umbral,
+                                   opciones.minimo / 1000)
+        if regresiones:
+            print("\n✗ Regresiones de rendimiento:")
+            for clave, antes, ahora in regresiones:
+                print(f"  {clave}: {antes * 1000:.2f} ms → {ahora * 1000:.2f} ms")
+            return 1
+        print("\n✓ Sin regresiones frente al baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
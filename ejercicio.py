@@ -4,41 +4,185 @@ Una Cola es una estructura de datos que sigue el principio FIFO (First In, First
 El primer elemento en entrar es el primero en salir.
 """
 
-class Cola:
-    """Implementación de una Cola (Queue) usando una lista"""
+import asyncio
+import json
+import os
+import pickle
+import shutil
+import tempfile
+import threading
+from collections import Counter, deque
+
+
+def imprimir_evento(evento, elemento, cola):
+    """Escucha que imprime cada operación como lo hacía la Cola original"""
+    if evento == 'encolar':
+        print(f"✓ {elemento} encolado. Cola: {cola.elementos}")
+    elif evento == 'desencolar':
+        print(f"✓ {elemento} desencolado. Cola: {cola.elementos}")
+    elif elemento == 'desencolar':
+        print("✗ Error: La cola está vacía. No se puede desencolar.")
+    else:
+        print("✗ La cola está vacía")
+
+
+class ContadorEventos:
+    """Escucha que solo cuenta eventos, sin formatear ni imprimir"""
+    
+    def __init__(self):
+        self.conteo = Counter()
+    
+    def __call__(self, evento, elemento, cola):
+        self.conteo[evento] += 1
+
+
+class ColaObservable:
+    """Base con el registro de escuchas compartido por las colas"""
+    
+    def __init__(self):
+        """Inicializa sin escuchas (modo silencioso)"""
+        self._escuchas = []
+    
+    def agregar_escucha(self, escucha):
+        """Registra escucha(evento, elemento, cola) para cada operación
+
+        Los eventos son 'encolar', 'desencolar' y 'vacia' (en este último
+        `elemento` es el nombre de la operación que encontró la cola vacía).
+        Sin escuchas la cola es silenciosa y no formatea nada.
+        """
+        self._escuchas.append(escucha)
+    
+    def quitar_escucha(self, escucha):
+        """Elimina una escucha registrada"""
+        self._escuchas.remove(escucha)
+    
+    def _notificar(self, evento, elemento):
+        for escucha in self._escuchas:
+            escucha(evento, elemento, self)
+
+
+class Cola(ColaObservable):
+    """Implementación de una Cola (Queue) usando un búfer circular"""
+    
+    CAPACIDAD_INICIAL = 8
     
     def __init__(self):
         """Inicializa una cola vacía"""
-        self.elementos = []
+        super().__init__()
+        self._bufer = [None] * self.CAPACIDAD_INICIAL
+        self._cabeza = 0  # índice del primer elemento
+        self._cantidad = 0
+    
+    @property
+    def elementos(self):
+        """Lista con los elementos en orden FIFO (copia, O(n))"""
+        capacidad = len(self._bufer)
+        return [self._bufer[(self._cabeza + i) % capacidad]
+                for i in range(self._cantidad)]
+    
+    def _redimensionar(self, capacidad):
+        """Copia los elementos a un búfer nuevo, dejando la cabeza en 0"""
+        elementos = self.elementos
+        self._bufer = elementos + [None] * (capacidad - len(elementos))
+        self._cabeza = 0
     
     def encolar(self, elemento):
         """Agrega un elemento al final de la cola (enqueue)"""
-        self.elementos.append(elemento)
-        print(f"✓ {elemento} encolado. Cola: {self.elementos}")
+        if self._cantidad == len(self._bufer):
+            self._redimensionar(2 * len(self._bufer))
+        indice = (self._cabeza + self._cantidad) % len(self._bufer)
+        self._bufer[indice] = elemento
+        self._cantidad += 1
+        if self._escuchas:
+            self._notificar('encolar', elemento)
     
     def desencolar(self):
         """Elimina y retorna el primer elemento de la cola (dequeue)"""
         if self.esta_vacia():
-            print("✗ Error: La cola está vacía. No se puede desencolar.")
+            if self._escuchas:
+                self._notificar('vacia', 'desencolar')
             return None
-        elemento = self.elementos.pop(0)
-        print(f"✓ {elemento} desencolado. Cola: {self.elementos}")
+        elemento = self._extraer()
+        if self._escuchas:
+            self._notificar('desencolar', elemento)
+        return elemento
+    
+    def _extraer(self):
+        """Quita el primer elemento sin comprobaciones ni mensajes"""
+        elemento = self._bufer[self._cabeza]
+        self._bufer[self._cabeza] = None  # libera la referencia
+        self._cabeza = (self._cabeza + 1) % len(self._bufer)
+        self._cantidad -= 1
+        self._reducir_si_sobra()
         return elemento
     
+    def _reducir_si_sobra(self):
+        """Reduce el búfer cuando está ocupado a un cuarto o menos
+        
+        Salta directo a la menor potencia de dos que deja al menos la mitad
+        libre, así un desencolar_muchos grande no conserva la capacidad pico.
+        """
+        capacidad = len(self._bufer)
+        if capacidad > self.CAPACIDAD_INICIAL and self._cantidad <= capacidad // 4:
+            nueva = self.CAPACIDAD_INICIAL
+            while nueva < 2 * self._cantidad:
+                nueva *= 2
+            self._redimensionar(nueva)
+    
+    def encolar_muchos(self, iterable):
+        """Agrega todos los elementos de un iterable al final de la cola"""
+        nuevos = list(iterable)
+        if self._escuchas:
+            for elemento in nuevos:
+                self.encolar(elemento)
+            return len(nuevos)
+        necesaria = self._cantidad + len(nuevos)
+        capacidad = len(self._bufer)
+        if necesaria > capacidad:
+            while capacidad < necesaria:
+                capacidad *= 2
+            self._redimensionar(capacidad)
+        inicio = (self._cabeza + self._cantidad) % capacidad
+        primer_tramo = min(len(nuevos), capacidad - inicio)
+        self._bufer[inicio:inicio + primer_tramo] = nuevos[:primer_tramo]
+        self._bufer[:len(nuevos) - primer_tramo] = nuevos[primer_tramo:]
+        self._cantidad = necesaria
+        return len(nuevos)
+    
+    def desencolar_muchos(self, n):
+        """Elimina y retorna hasta n elementos del frente de la cola"""
+        if self._escuchas:
+            return [self.desencolar() for _ in range(min(n, self._cantidad))]
+        n = max(0, min(n, self._cantidad))
+        capacidad = len(self._bufer)
+        primer_tramo = min(n, capacidad - self._cabeza)
+        fin = self._cabeza + primer_tramo
+        resultado = self._bufer[self._cabeza:fin]
+        self._bufer[self._cabeza:fin] = [None] * primer_tramo
+        resto = n - primer_tramo
+        if resto:
+            resultado += self._bufer[:resto]
+            self._bufer[:resto] = [None] * resto
+        self._cabeza = (self._cabeza + n) % capacidad
+        self._cantidad -= n
+        self._reducir_si_sobra()
+        return resultado
+    
     def primero(self):
         """Retorna el primer elemento sin eliminarlo (peek)"""
         if self.esta_vacia():
-            print("✗ La cola está vacía")
+            if self._escuchas:
+                self._notificar('vacia', 'primero')
             return None
-        return self.elementos[0]
+        return self._bufer[self._cabeza]
     
     def esta_vacia(self):
         """Verifica si la cola está vacía"""
-        return len(self.elementos) == 0
+        return self._cantidad == 0
     
     def tamano(self):
         """Retorna la cantidad de elementos en la cola"""
-        return len(self.elementos)
+        return self._cantidad
     
     def mostrar(self):
         """Muestra todos los elementos de la cola"""
@@ -48,6 +192,512 @@ class Cola:
             print(f"Cola: {self.elementos}")
 
 
+class ColaPrioridad(ColaObservable):
+    """Cola de prioridad con montículo d-ario indexado
+
+    Sale primero el elemento de menor prioridad; a igual prioridad, el que
+    entró antes (FIFO). encolar retorna un manejador con el que luego se
+    puede consultar o cambiar la prioridad en O(log n).
+    """
+    
+    def __init__(self, aridad=2):
+        """Inicializa una cola vacía; aridad es la cantidad de hijos por nodo"""
+        super().__init__()
+        self.aridad = aridad
+        self._monticulo = []  # entradas [(prioridad, secuencia), elemento]
+        self._posiciones = {}  # manejador (secuencia) -> índice en el montículo
+        self._secuencia = 0
+    
+    @property
+    def elementos(self):
+        """Lista con los elementos en el orden en que saldrían (copia, O(n log n))"""
+        return [elemento for _, elemento in sorted(self._monticulo, key=lambda e: e[0])]
+    
+    def _mover(self, entrada, indice):
+        self._monticulo[indice] = entrada
+        self._posiciones[entrada[0][1]] = indice
+    
+    def _subir(self, indice):
+        monticulo, aridad = self._monticulo, self.aridad
+        entrada = monticulo[indice]
+        while indice > 0:
+            padre = (indice - 1) // aridad
+            if not entrada[0] < monticulo[padre][0]:
+                break
+            self._mover(monticulo[padre], indice)
+            indice = padre
+        self._mover(entrada, indice)
+    
+    def _bajar(self, indice):
+        monticulo, aridad = self._monticulo, self.aridad
+        cantidad = len(monticulo)
+        entrada = monticulo[indice]
+        while True:
+            primero_hijo = aridad * indice + 1
+            if primero_hijo >= cantidad:
+                break
+            menor = primero_hijo
+            for hijo in range(primero_hijo + 1, min(primero_hijo + aridad, cantidad)):
+                if monticulo[hijo][0] < monticulo[menor][0]:
+                    menor = hijo
+            if not monticulo[menor][0] < entrada[0]:
+                break
+            self._mover(monticulo[menor], indice)
+            indice = menor
+        self._mover(entrada, indice)
+    
+    def encolar(self, elemento, prioridad=0):
+        """Agrega un elemento con su prioridad; retorna su manejador"""
+        manejador = self._secuencia
+        self._secuencia += 1
+        self._monticulo.append([(prioridad, manejador), elemento])
+        self._subir(len(self._monticulo) - 1)
+        if self._escuchas:
+            self._notificar('encolar', elemento)
+        return manejador
+    
+    def desencolar(self):
+        """Elimina y retorna el elemento de menor prioridad"""
+        if not self._monticulo:
+            if self._escuchas:
+                self._notificar('vacia', 'desencolar')
+            return None
+        entrada = self._monticulo[0]
+        ultima = self._monticulo.pop()
+        del self._posiciones[entrada[0][1]]
+        if self._monticulo:
+            self._mover(ultima, 0)
+            self._bajar(0)
+        if self._escuchas:
+            self._notificar('desencolar', entrada[1])
+        return entrada[1]
+    
+    def encolar_muchos(self, pares):
+        """Encola pares (elemento, prioridad); retorna la lista de manejadores"""
+        return [self.encolar(elemento, prioridad) for elemento, prioridad in pares]
+    
+    def desencolar_muchos(self, n):
+        """Elimina y retorna hasta n elementos en orden de prioridad"""
+        return [self.desencolar() for _ in range(min(n, len(self._monticulo)))]
+    
+    def primero(self):
+        """Retorna el elemento de menor prioridad sin eliminarlo (peek)"""
+        if not self._monticulo:
+            if self._escuchas:
+                self._notificar('vacia', 'primero')
+            return None
+        return self._monticulo[0][1]
+    
+    def contiene(self, manejador):
+        """Verifica si el elemento del manejador sigue en la cola"""
+        return manejador in self._posiciones
+    
+    def prioridad(self, manejador):
+        """Retorna la prioridad actual del elemento del manejador"""
+        return self._monticulo[self._posiciones[manejador]][0][0]
+    
+    def cambiar_prioridad(self, manejador, prioridad):
+        """Cambia la prioridad de un elemento que sigue en la cola"""
+        indice = self._posiciones[manejador]
+        entrada = self._monticulo[indice]
+        anterior = entrada[0][0]
+        entrada[0] = (prioridad, manejador)
+        if prioridad < anterior:
+            self._subir(indice)
+        else:
+            self._bajar(indice)
+    
+    def esta_vacia(self):
+        """Verifica si la cola está vacía"""
+        return not self._monticulo
+    
+    def tamano(self):
+        """Retorna la cantidad de elementos en la cola"""
+        return len(self._monticulo)
+    
+    def mostrar(self):
+        """Muestra los elementos en orden de salida"""
+        if self.esta_vacia():
+            print("Cola vacía: []")
+        else:
+            print(f"Cola: {self.elementos}")
+
+
+class ColaDisco(ColaObservable):
+    """Cola FIFO que desborda a disco cuando no cabe en memoria
+
+    Mantiene en memoria como máximo `limite_memoria` elementos al frente y
+    otros tantos al final; el medio se escribe en segmentos de solo
+    agregado que se leen en orden y se borran al consumirse.
+
+    Con `durable=True` todo elemento se escribe en disco al encolarse y la
+    posición de lectura se guarda en cada desencolar, así que al abrir
+    de nuevo el mismo directorio la cola continúa donde quedó.
+    """
+    
+    def __init__(self, directorio=None, limite_memoria=10000, durable=False, fsync=False):
+        """Abre (o crea) la cola en directorio; sin directorio usa uno temporal"""
+        super().__init__()
+        self._temporal = directorio is None
+        self.directorio = tempfile.mkdtemp(prefix='cola_') if directorio is None else directorio
+        os.makedirs(self.directorio, exist_ok=True)
+        self.limite_memoria = limite_memoria
+        self.durable = durable
+        self.fsync = fsync
+        self._frente = Cola()  # próximos en salir
+        self._final = []  # recién llegados aún no escritos (modo no durable)
+        self._segmentos = deque()  # números de segmentos cerrados, el más antiguo primero
+        self._activo = None  # segmento abierto para escribir (modo durable)
+        self._en_activo = 0
+        self._siguiente = 0
+        self._cursor = (-1, 0)  # (segmento, elementos ya entregados de él)
+        self._cantidad = 0
+        if durable:
+            self._recuperar()
+    
+    def _ruta(self, numero):
+        return os.path.join(self.directorio, f'segmento-{numero:010d}.bin')
+    
+    def _ruta_cursor(self):
+        return os.path.join(self.directorio, 'cursor.json')
+    
+    @staticmethod
+    def _leer_segmento(ruta):
+        """Lee todos los elementos completos de un segmento"""
+        elementos = []
+        with open(ruta, 'rb') as archivo:
+            while True:
+                try:
+                    elementos.append(pickle.load(archivo))
+                except (EOFError, pickle.UnpicklingError):
+                    # Fin del archivo o último registro truncado por una caída
+                    return elementos
+    
+    def _recuperar(self):
+        """Retoma una cola durable existente a partir de sus archivos"""
+        numeros = sorted(int(nombre[len('segmento-'):-len('.bin')])
+                         for nombre in os.listdir(self.directorio)
+                         if nombre.startswith('segmento-'))
+        if os.path.exists(self._ruta_cursor()):
+            with open(self._ruta_cursor(), encoding='utf-8') as archivo:
+                cursor = json.load(archivo)
+            self._cursor = (cursor['segmento'], cursor['consumidos'])
+        for numero in numeros:
+            if numero < self._cursor[0]:
+                os.remove(self._ruta(numero))
+                continue
+            cantidad = len(self._leer_segmento(self._ruta(numero)))
+            if numero == self._cursor[0]:
+                cantidad -= self._cursor[1]
+            self._segmentos.append(numero)
+            self._cantidad += cantidad
+        # Tras vaciarse no quedan segmentos, pero el cursor ya apunta más allá
+        self._siguiente = max(numeros[-1] + 1 if numeros else 0, self._cursor[0])
+    
+    def _guardar_cursor(self, numero, consumidos):
+        self._cursor = (numero, consumidos)
+        temporal = self._ruta_cursor() + '.tmp'
+        with open(temporal, 'w', encoding='utf-8') as archivo:
+            json.dump({'segmento': numero, 'consumidos': consumidos}, archivo)
+        os.replace(temporal, self._ruta_cursor())
+    
+    def _cerrar_activo(self):
+        """Cierra el segmento en escritura y lo pasa a la lista de pendientes"""
+        if self._activo is not None:
+            self._activo.close()
+            self._activo = None
+            self._segmentos.append(self._siguiente - 1)
+            self._en_activo = 0
+    
+    def _volcar_final(self):
+        """Escribe los recién llegados en un segmento nuevo (modo no durable)"""
+        with open(self._ruta(self._siguiente), 'wb') as archivo:
+            for elemento in self._final:
+                pickle.dump(elemento, archivo, pickle.HIGHEST_PROTOCOL)
+        self._segmentos.append(self._siguiente)
+        self._siguiente += 1
+        self._final = []
+    
+    def encolar(self, elemento):
+        """Agrega un elemento al final de la cola (enqueue)"""
+        if self.durable:
+            if self._activo is None:
+                self._activo = open(self._ruta(self._siguiente), 'ab')
+                self._siguiente += 1
+            pickle.dump(elemento, self._activo, pickle.HIGHEST_PROTOCOL)
+            self._activo.flush()
+            if self.fsync:
+                os.fsync(self._activo.fileno())
+            self._en_activo += 1
+            if self._en_activo >= self.limite_memoria:
+                self._cerrar_activo()
+        elif (not self._segmentos and not self._final
+              and self._frente.tamano() < self.limite_memoria):
+            self._frente.encolar(elemento)
+        else:
+            self._final.append(elemento)
+            if len(self._final) >= self.limite_memoria:
+                self._volcar_final()
+        self._cantidad += 1
+        if self._escuchas:
+            self._notificar('encolar', elemento)
+    
+    def _recargar_frente(self):
+        """Llena el frente con el siguiente tramo en orden FIFO"""
+        if self.durable and not self._segmentos:
+            self._cerrar_activo()
+        if self._segmentos:
+            numero = self._segmentos[0]
+            elementos = self._leer_segmento(self._ruta(numero))
+            if self.durable:
+                if self._cursor[0] == numero:
+                    elementos = elementos[self._cursor[1]:]
+                else:
+                    self._cursor = (numero, 0)
+            else:
+                self._segmentos.popleft()
+                os.remove(self._ruta(numero))
+            self._frente.encolar_muchos(elementos)
+        elif self._final:
+            self._frente.encolar_muchos(self._final)
+            self._final = []
+    
+    def desencolar(self):
+        """Elimina y retorna el primer elemento de la cola (dequeue)"""
+        if self._cantidad == 0:
+            if self._escuchas:
+                self._notificar('vacia', 'desencolar')
+            return None
+        if self._frente.esta_vacia():
+            self._recargar_frente()
+        elemento = self._frente.desencolar()
+        self._cantidad -= 1
+        if self.durable:
+            self._avanzar_cursor()
+        if self._escuchas:
+            self._notificar('desencolar', elemento)
+        return elemento
+    
+    def _avanzar_cursor(self):
+        """Registra el consumo en disco y borra el segmento si se agotó"""
+        numero, consumidos = self._cursor
+        if self._frente.esta_vacia():
+            self._segmentos.popleft()
+            # El próximo a leer es el pendiente más antiguo, el abierto o el que se creará
+            if self._segmentos:
+                proximo = self._segmentos[0]
+            elif self._activo is not None:
+                proximo = self._siguiente - 1
+            else:
+                proximo = self._siguiente
+            self._guardar_cursor(proximo, 0)
+            os.remove(self._ruta(numero))
+        else:
+            self._guardar_cursor(numero, consumidos + 1)
+    
+    def primero(self):
+        """Retorna el primer elemento sin eliminarlo (peek)"""
+        if self._cantidad == 0:
+            if self._escuchas:
+                self._notificar('vacia', 'primero')
+            return None
+        if self._frente.esta_vacia():
+            self._recargar_frente()
+        return self._frente.primero()
+    
+    @property
+    def elementos(self):
+        """Lista con todos los elementos en orden FIFO (lee el disco, O(n))"""
+        resultado = self._frente.elementos
+        pendientes = list(self._segmentos)
+        if self.durable and self._activo is not None:
+            self._activo.flush()
+            pendientes.append(self._siguiente - 1)
+        for i, numero in enumerate(pendientes):
+            if self.durable and i == 0 and self._frente.tamano():
+                continue  # el segmento de frente ya está en memoria
+            elementos = self._leer_segmento(self._ruta(numero))
+            if numero == self._cursor[0]:
+                elementos = elementos[self._cursor[1]:]
+            resultado += elementos
+        return resultado + self._final
+    
+    def esta_vacia(self):
+        """Verifica si la cola está vacía"""
+        return self._cantidad == 0
+    
+    def tamano(self):
+        """Retorna la cantidad de elementos en la cola"""
+        return self._cantidad
+    
+    def en_memoria(self):
+        """Retorna cuántos elementos están cargados en memoria"""
+        return self._frente.tamano() + len(self._final)
+    
+    def mostrar(self):
+        """Muestra un resumen de la cola (sin leer el disco)"""
+        print(f"Cola: {self._cantidad} elementos ({self.en_memoria()} en memoria, "
+              f"{len(self._segmentos)} segmentos en disco)")
+    
+    def cerrar(self):
+        """Cierra los archivos; borra los datos salvo en modo durable"""
+        if self._activo is not None:
+            self._activo.close()
+            self._activo = None
+        if self._temporal:
+            shutil.rmtree(self.directorio, ignore_errors=True)
+        elif not self.durable:
+            for numero in self._segmentos:
+                os.remove(self._ruta(numero))
+            self._segmentos.clear()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *excepcion):
+        self.cerrar()
+
+
+class ColaConcurrente(Cola):
+    """Cola segura entre hilos, con capacidad opcional y espera bloqueante
+
+    Con `capacidad` los productores esperan cuando la cola está llena
+    (contrapresión) y los consumidores esperan cuando está vacía.
+    """
+    
+    def __init__(self, capacidad=None):
+        """Inicializa una cola vacía; capacidad None significa sin límite"""
+        super().__init__()
+        self.capacidad = capacidad
+        self._candado = threading.RLock()
+        self._no_vacia = threading.Condition(self._candado)
+        self._no_llena = threading.Condition(self._candado)
+    
+    def esta_llena(self):
+        """Verifica si la cola alcanzó su capacidad"""
+        return self.capacidad is not None and self._cantidad >= self.capacidad
+    
+    def encolar(self, elemento, bloquear=True, timeout=None):
+        """Agrega un elemento; retorna False si no hubo lugar a tiempo"""
+        with self._no_llena:
+            if self.esta_llena():
+                if not bloquear:
+                    return False
+                if not self._no_llena.wait_for(lambda: not self.esta_llena(), timeout):
+                    return False
+            super().encolar(elemento)
+            self._no_vacia.notify()
+        return True
+    
+    def desencolar(self, bloquear=True, timeout=None):
+        """Elimina y retorna el primer elemento; None si no llegó ninguno a tiempo"""
+        with self._no_vacia:
+            if bloquear and not self._no_vacia.wait_for(lambda: self._cantidad > 0, timeout):
+                return None
+            elemento = super().desencolar()
+            self._no_llena.notify()
+        return elemento
+    
+    def encolar_muchos(self, iterable, timeout=None):
+        """Encola uno a uno respetando la capacidad; retorna cuántos entraron"""
+        cantidad = 0
+        for elemento in iterable:
+            if not self.encolar(elemento, timeout=timeout):
+                break
+            cantidad += 1
+        return cantidad
+    
+    def desencolar_muchos(self, n):
+        """Elimina y retorna hasta n elementos disponibles, sin esperar"""
+        with self._candado:
+            resultado = super().desencolar_muchos(n)
+            self._no_llena.notify_all()
+        return resultado
+    
+    def primero(self):
+        """Retorna el primer elemento sin eliminarlo (peek)"""
+        with self._candado:
+            return super().primero()
+
+
+class ColaAsincrona:
+    """Contraparte de ColaConcurrente para asyncio (mismos nombres, con await)"""
+    
+    def __init__(self, capacidad=None):
+        """Inicializa una cola vacía; capacidad None significa sin límite"""
+        self._cola = Cola()
+        self.capacidad = capacidad
+        self._condicion = asyncio.Condition()
+    
+    def agregar_escucha(self, escucha):
+        """Registra una escucha de eventos (ver Cola.agregar_escucha)"""
+        self._cola.agregar_escucha(escucha)
+    
+    def quitar_escucha(self, escucha):
+        """Elimina una escucha registrada"""
+        self._cola.quitar_escucha(escucha)
+    
+    def esta_llena(self):
+        """Verifica si la cola alcanzó su capacidad"""
+        return self.capacidad is not None and self._cola.tamano() >= self.capacidad
+    
+    async def encolar(self, elemento, timeout=None):
+        """Agrega un elemento; retorna False si no hubo lugar a tiempo"""
+        async with self._condicion:
+            try:
+                await asyncio.wait_for(
+                    self._condicion.wait_for(lambda: not self.esta_llena()), timeout)
+            except asyncio.TimeoutError:
+                return False
+            self._cola.encolar(elemento)
+            self._condicion.notify_all()
+        return True
+    
+    async def desencolar(self, timeout=None):
+        """Elimina y retorna el primer elemento; None si no llegó ninguno a tiempo"""
+        async with self._condicion:
+            try:
+                await asyncio.wait_for(
+                    self._condicion.wait_for(lambda: not self._cola.esta_vacia()), timeout)
+            except asyncio.TimeoutError:
+                return None
+            elemento = self._cola.desencolar()
+            self._condicion.notify_all()
+        return elemento
+    
+    async def encolar_muchos(self, iterable, timeout=None):
+        """Encola uno a uno respetando la capacidad; retorna cuántos entraron"""
+        cantidad = 0
+        for elemento in iterable:
+            if not await self.encolar(elemento, timeout=timeout):
+                break
+            cantidad += 1
+        return cantidad
+    
+    async def desencolar_muchos(self, n):
+        """Elimina y retorna hasta n elementos disponibles, sin esperar"""
+        async with self._condicion:
+            resultado = self._cola.desencolar_muchos(n)
+            self._condicion.notify_all()
+        return resultado
+    
+    def primero(self):
+        """Retorna el primer elemento sin eliminarlo (peek)"""
+        return self._cola.primero()
+    
+    def esta_vacia(self):
+        """Verifica si la cola está vacía"""
+        return self._cola.esta_vacia()
+    
+    def tamano(self):
+        """Retorna la cantidad de elementos en la cola"""
+        return self._cola.tamano()
+    
+    def mostrar(self):
+        """Muestra todos los elementos de la cola"""
+        self._cola.mostrar()
+
+
 def ejemplo_basico():
     """Ejemplo básico de operaciones en una cola"""
     print("\n" + "="*60)
@@ -55,6 +705,7 @@ def ejemplo_basico():
     print("="*60)
     
     cola = Cola()
+    cola.agregar_escucha(imprimir_evento)
     
     # Encolar elementos
     print("\n--- Encolando elementos ---")
@@ -83,6 +734,7 @@ def ejemplo_simulacion_banco():
     print("="*60)
     
     cola_banco = Cola()
+    cola_banco.agregar_escucha(imprimir_evento)
     
     print("\n--- Clientes llegando al banco ---")
     clientes = ["Carlos", "María", "Juan", "Ana", "Pedro"]
@@ -106,6 +758,7 @@ def ejemplo_simulacion_impresora():
     print("="*60)
     
     cola_impresion = Cola()
+    cola_impresion.agregar_escucha(imprimir_evento)
     
     print("\n--- Enviando documentos a imprimir ---")
     documentos = [
@@ -138,6 +791,7 @@ def ejemplo_comparacion():
     # COLA (FIFO)
     print("\n--- COLA (First In, First Out) ---")
     cola = Cola()
+    cola.agregar_escucha(imprimir_evento)
     numeros = [1, 2, 3, 4, 5]
     for num in numeros:
         cola.encolar(num)
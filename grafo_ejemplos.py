@@ -3,79 +3,829 @@ EJEMPLOS DE GRAFOS EN PYTHON
 Implementación de varios tipos de grafos y algoritmos
 """
 
-from collections import deque, defaultdict
+from array import array
+from collections import OrderedDict, deque, defaultdict
+from itertools import islice
+import csv
+import heapq
 import json
+import mmap
+import multiprocessing
+import random
+import sqlite3
+import struct
+import sys
+import time
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional
+    np = None
 
 
 class Grafo:
     """Implementación de un Grafo No Dirigido"""
     
-    def __init__(self, dirigido=False):
-        """Inicializa el grafo"""
-        self.grafo = defaultdict(list)
+    def __init__(self, dirigido=False, indexado=False):
+        """Inicializa el grafo
+
+        Con `indexado=True` la adyacencia de cada vértice es un
+        VecinosIndexados (diccionario vecino -> peso) en vez de una lista:
+        las aristas repetidas se fusionan y tiene_arista, peso,
+        actualizar_peso y eliminar_arista cuestan O(1).
+        """
+        self.grafo = defaultdict(VecinosIndexados if indexado else list)
         self.dirigido = dirigido
+        self.indexado = indexado
+        self.version = 0  # aumenta con cada cambio; invalida cachés
+        self.cache_rutas = None
+        self._congelado = None  # (versión, GrafoCompacto)
+        self._inversa = None  # (versión, adyacencia inversa)
+        self.componentes = None  # ConjuntosDisjuntos, se crea al primer uso
+        self._alcanzabilidad = None  # (versión, IndiceAlcanzabilidad)
+        self.proveedor = None  # ProveedorAdyacencia si las aristas están fuera de memoria
     
     def agregar_arista(self, u, v, peso=1):
         """Agrega una arista al grafo"""
+        if self.proveedor is not None:
+            raise TypeError("el grafo es de solo lectura: sus aristas vienen de un proveedor")
         self.grafo[u].append((v, peso))
         if not self.dirigido:
             self.grafo[v].append((u, peso))
+        self.version += 1
+        if self.componentes is not None:
+            self.componentes.unir(u, v)
     
-    def bfs(self, inicio):
-        """Búsqueda en Amplitud (BFS)"""
-        visitados = set()
+    def agregar_aristas(self, aristas):
+        """Agrega muchas aristas (u, v) o (u, v, peso) en una sola pasada"""
+        if self.proveedor is not None:
+            raise TypeError("el grafo es de solo lectura: sus aristas vienen de un proveedor")
+        grafo = self.grafo
+        dirigido = self.dirigido
+        componentes = self.componentes
+        cantidad = 0
+        try:
+            for arista in aristas:
+                u, v = arista[0], arista[1]
+                peso = arista[2] if len(arista) > 2 else 1
+                grafo[u].append((v, peso))
+                if not dirigido:
+                    grafo[v].append((u, peso))
+                if componentes is not None:
+                    componentes.unir(u, v)
+                cantidad += 1
+        finally:
+            # También si una arista falla a mitad: lo ya agregado invalida las cachés
+            if cantidad:
+                self.version += 1
+        return cantidad
+    
+    @classmethod
+    def desde_aristas(cls, aristas, dirigido=False, indexado=False):
+        """Construye un grafo a partir de un iterable de aristas"""
+        grafo = cls(dirigido=dirigido, indexado=indexado)
+        grafo.agregar_aristas(aristas)
+        return grafo
+    
+    def tiene_arista(self, u, v):
+        """Verifica si existe la arista u -> v (O(1) si el grafo es indexado)"""
+        vecinos = self.grafo.get(u, ())
+        if self.indexado:
+            return v in vecinos
+        return any(vecino == v for vecino, _ in vecinos)
+    
+    def peso(self, u, v):
+        """Retorna el peso de la arista u -> v (el menor si hay repetidas)
+
+        Lanza KeyError si la arista no existe.
+        """
+        vecinos = self.grafo.get(u, ())
+        if self.indexado:
+            if v in vecinos:
+                return vecinos.pesos[v]
+        else:
+            pesos = [peso for vecino, peso in vecinos if vecino == v]
+            if pesos:
+                return min(pesos)
+        raise KeyError((u, v))
+    
+    def actualizar_peso(self, u, v, peso):
+        """Cambia el peso de una arista existente; lanza KeyError si no existe"""
+        if not self.tiene_arista(u, v):
+            raise KeyError((u, v))
+        self._cambiar_adyacencia(u, v, peso)
+        if not self.dirigido:
+            self._cambiar_adyacencia(v, u, peso)
+        self.version += 1
+    
+    def eliminar_arista(self, u, v):
+        """Elimina la arista u -> v (y sus repetidas); lanza KeyError si no existe"""
+        if not self.tiene_arista(u, v):
+            raise KeyError((u, v))
+        self._cambiar_adyacencia(u, v, None)
+        if not self.dirigido:
+            self._cambiar_adyacencia(v, u, None)
+        self.version += 1
+        self.componentes = None  # la unión-búsqueda no admite borrados; se reconstruye
+    
+    def _cambiar_adyacencia(self, u, v, peso):
+        """Asigna peso a las aristas u -> v, o las quita si peso es None"""
+        if self.proveedor is not None:
+            raise TypeError("el grafo es de solo lectura: sus aristas vienen de un proveedor")
+        vecinos = self.grafo[u]
+        if self.indexado:
+            if peso is None:
+                vecinos.pesos.pop(v, None)
+            else:
+                vecinos.pesos[v] = peso
+        elif peso is None:
+            vecinos[:] = [arista for arista in vecinos if arista[0] != v]
+        else:
+            vecinos[:] = [(vecino, peso if vecino == v else anterior)
+                          for vecino, anterior in vecinos]
+    
+    @classmethod
+    def desde_csv(cls, ruta, dirigido=False, delimitador=',', encabezado=False,
+                  tipo_vertice=str, tipo_peso=float, tamano_bloque=65536, indexado=False):
+        """Construye un grafo leyendo un archivo CSV/TSV de aristas por bloques
+
+        Cada fila es `u,v` o `u,v,peso` (usar delimitador='\t' para TSV).
+        El archivo se procesa en bloques de `tamano_bloque` filas, así la
+        memoria extra no depende del tamaño del archivo.
+        """
+        grafo = cls(dirigido=dirigido, indexado=indexado)
+        etiquetas = {}
+        with open(ruta, newline='', encoding='utf-8') as archivo:
+            filas = csv.reader(archivo, delimiter=delimitador)
+            if encabezado:
+                next(filas, None)
+            for bloque in _bloques(filas, tamano_bloque):
+                grafo.agregar_aristas(
+                    _convertir_aristas(bloque, tipo_vertice, tipo_peso, etiquetas))
+        return grafo
+    
+    @classmethod
+    def desde_jsonl(cls, ruta, dirigido=False, tamano_bloque=65536, indexado=False):
+        """Construye un grafo leyendo un archivo JSON-lines de aristas por bloques
+
+        Cada línea es una lista [u, v] / [u, v, peso] o un objeto
+        {"origen": u, "destino": v, "peso": p}. Como en desde_csv, cada
+        etiqueta se guarda una sola vez en memoria.
+        """
+        grafo = cls(dirigido=dirigido, indexado=indexado)
+        internar = {}.setdefault
+        with open(ruta, encoding='utf-8') as archivo:
+            for bloque in _bloques(archivo, tamano_bloque):
+                aristas = []
+                for linea in bloque:
+                    if not linea.strip():
+                        continue
+                    dato = json.loads(linea)
+                    if isinstance(dato, dict):
+                        dato = (dato['origen'], dato['destino'], dato.get('peso', 1))
+                    u, v = internar(dato[0], dato[0]), internar(dato[1], dato[1])
+                    aristas.append((u, v, dato[2]) if len(dato) > 2 else (u, v))
+                grafo.agregar_aristas(aristas)
+        return grafo
+    
+    @classmethod
+    def desde_proveedor(cls, proveedor, dirigido=False, capacidad_cache=4096):
+        """Construye un grafo de solo lectura cuyas aristas vienen de un proveedor
+
+        `proveedor` es un ProveedorAdyacencia (por ejemplo ProveedorSQLite);
+        delante se pone una CacheVecinos LRU de `capacidad_cache` vértices
+        (None para no usarla). bfs y dijkstra piden los vecinos por lotes;
+        el resto de los métodos funciona igual, con una consulta por vértice.
+        """
+        grafo = cls(dirigido=dirigido)
+        if capacidad_cache:
+            proveedor = CacheVecinos(proveedor, capacidad_cache)
+        grafo.proveedor = proveedor
+        grafo.grafo = _AdyacenciaExterna(proveedor)
+        return grafo
+    
+    def activar_componentes(self):
+        """Crea el índice de componentes conexas, que luego se actualiza solo
+
+        En grafos dirigidos las componentes son débilmente conexas (se
+        ignora el sentido de las aristas). Las consultas lo activan solas.
+        """
+        if self.componentes is None:
+            componentes = ConjuntosDisjuntos()
+            for vertice, vecinos in self.grafo.items():
+                componentes.agregar(vertice)
+                for vecino, _ in vecinos:
+                    componentes.unir(vertice, vecino)
+            self.componentes = componentes
+        return self.componentes
+    
+    def conectados(self, u, v):
+        """Verifica si u y v están en la misma componente conexa"""
+        return self.activar_componentes().conectados(u, v)
+    
+    def componente(self, u):
+        """Retorna el representante de la componente de u"""
+        return self.activar_componentes().encontrar(u)
+    
+    def tamano_componente(self, u):
+        """Retorna la cantidad de vértices en la componente de u"""
+        return self.activar_componentes().tamano(u)
+    
+    def numero_componentes(self):
+        """Retorna la cantidad de componentes conexas"""
+        return self.activar_componentes().cantidad
+    
+    def activar_cache(self, capacidad=128):
+        """Guarda los resultados de dijkstra de hasta `capacidad` orígenes
+
+        Las entradas se descartan en cuanto cambia la versión del grafo.
+        Retorna la CacheRutas para consultar sus estadísticas.
+        """
+        self.cache_rutas = CacheRutas(capacidad)
+        return self.cache_rutas
+    
+    def bfs(self, inicio, estadisticas=None):
+        """Búsqueda en Amplitud (BFS)
+
+        `estadisticas` (opcional) es una EstadisticasBusqueda a completar o
+        una función que la recibe al terminar; sin ella no se mide nada.
+        Con un proveedor se recorre por niveles (una consulta por nivel) y
+        `estadisticas` no se admite.
+        """
+        if self.proveedor is not None:
+            if estadisticas is not None:
+                raise ValueError("estadisticas no se admite con un proveedor")
+            return self._bfs_por_lotes(inicio)
+        if estadisticas is not None:
+            return self._bfs_instrumentado(inicio, estadisticas)
+        # El resultado hace de cola: se recorre mientras se le agregan vértices
+        grafo = self.grafo
+        visitados = {inicio}
+        resultado = [inicio]
+        for vertice in resultado:
+            for vecino, _ in grafo.get(vertice, ()):
+                if vecino not in visitados:
+                    visitados.add(vecino)
+                    resultado.append(vecino)
+        return resultado
+    
+    def _bfs_instrumentado(self, inicio, estadisticas):
+        """BFS que cuenta vértices, aristas y tamaño máximo de la frontera"""
+        medidas, avisar = _preparar_estadisticas(estadisticas, 'bfs')
+        comienzo = time.perf_counter()
+        visitados = {inicio}
         cola = deque([inicio])
         resultado = []
-        visitados.add(inicio)
         
         while cola:
+            if len(cola) > medidas.frontera_maxima:
+                medidas.frontera_maxima = len(cola)
             vertice = cola.popleft()
+            medidas.extraidos += 1
             resultado.append(vertice)
-            
-            for vecino, _ in self.grafo[vertice]:
+            for vecino, _ in self.grafo.get(vertice, ()):
+                medidas.aristas_examinadas += 1
                 if vecino not in visitados:
                     visitados.add(vecino)
                     cola.append(vecino)
         
+        medidas.tiempos['busqueda'] = time.perf_counter() - comienzo
+        avisar()
+        return resultado
+    
+    def _bfs_por_lotes(self, inicio):
+        """BFS por niveles que pide al proveedor los vecinos de todo un nivel a la vez"""
+        proveedor = self.proveedor
+        visitados = {inicio}
+        resultado = [inicio]
+        nivel = [inicio]
+        
+        while nivel:
+            lote = proveedor.vecinos_lote(nivel)
+            siguiente = []
+            for vertice in nivel:
+                for vecino, _ in lote.get(vertice, ()):
+                    if vecino not in visitados:
+                        visitados.add(vecino)
+                        siguiente.append(vecino)
+            resultado.extend(siguiente)
+            nivel = siguiente
+        
         return resultado
     
+    def iter_bfs(self, inicio, profundidad=False):
+        """Genera los vértices en orden BFS a medida que se descubren
+
+        Con `profundidad=True` genera pares (vértice, saltos desde inicio).
+        """
+        visitados = {inicio}
+        if not profundidad:
+            cola = deque([inicio])
+            while cola:
+                vertice = cola.popleft()
+                yield vertice
+                for vecino, _ in self.grafo.get(vertice, ()):
+                    if vecino not in visitados:
+                        visitados.add(vecino)
+                        cola.append(vecino)
+            return
+        
+        cola = deque([(inicio, 0)])
+        while cola:
+            vertice, nivel = cola.popleft()
+            yield vertice, nivel
+            
+            for vecino, _ in self.grafo.get(vertice, ()):
+                if vecino not in visitados:
+                    visitados.add(vecino)
+                    cola.append((vecino, nivel + 1))
+    
     def dfs(self, inicio):
         """Búsqueda en Profundidad (DFS)"""
-        visitados = set()
-        resultado = []
+        return list(self.iter_dfs(inicio))
+    
+    def iter_dfs(self, inicio, profundidad=False):
+        """Genera los vértices en orden DFS (preorden) con una pila explícita
+
+        Visita en el mismo orden que la versión recursiva, sin límite de
+        profundidad. Con `profundidad=True` genera pares (vértice, nivel).
+        """
+        visitados = {inicio}
+        yield (inicio, 0) if profundidad else inicio
+        pila = [iter(self.grafo.get(inicio, ()))]
         
-        def _dfs(vertice):
-            visitados.add(vertice)
-            resultado.append(vertice)
-            
-            for vecino, _ in self.grafo[vertice]:
+        while pila:
+            for vecino, _ in pila[-1]:
                 if vecino not in visitados:
-                    _dfs(vecino)
+                    visitados.add(vecino)
+                    yield (vecino, len(pila)) if profundidad else vecino
+                    pila.append(iter(self.grafo.get(vecino, ())))
+                    break
+            else:
+                pila.pop()
+    
+    def dijkstra(self, inicio, destino=None, predecesores=False, estadisticas=None,
+                 frontera=None):
+        """Algoritmo de Dijkstra para camino más corto (montículo binario)
+
+        Con `destino` la búsqueda se detiene en cuanto ese vértice queda
+        fijado; solo su distancia (y su camino) son definitivos entonces, y
+        `distancias` incluye solo los vértices alcanzados (sin destino trae
+        todos, con inf para los inalcanzables).
+        Con `predecesores=True` retorna (distancias, predecesores).
+        Si hay caché activa, los resultados completos se reutilizan.
+        `estadisticas` funciona como en bfs y siempre ejecuta la búsqueda.
+        `frontera` es una clase de cola de prioridad indexada (como
+        ejercicio.ColaPrioridad) para usar decremento de clave en vez del
+        montículo con entradas repetidas.
+        Con un proveedor de adyacencia los vecinos se piden por lotes,
+        `distancias` solo incluye los vértices alcanzados y la caché de
+        rutas no se usa; `estadisticas` y `frontera` no se admiten ahí
+        (recorrerían todo el almacén y pedirían un vértice por consulta).
+        """
+        cache = self.cache_rutas
+        if self.proveedor is not None:
+            if estadisticas is not None or frontera is not None:
+                raise ValueError("estadisticas y frontera no se admiten con un proveedor")
+            distancias, previos = self._dijkstra_por_lotes(inicio, destino)
+        elif estadisticas is not None:
+            distancias, previos = self._dijkstra_instrumentado(inicio, destino, estadisticas)
+        elif frontera is not None:
+            distancias, previos = self._dijkstra_con_frontera(inicio, destino, frontera)
+        elif cache is None:
+            distancias, previos = self._dijkstra(inicio, destino)
+        else:
+            resultado = cache.obtener(inicio, self.version)
+            if resultado is None:
+                resultado = self._dijkstra(inicio)
+                cache.guardar(inicio, self.version, resultado)
+            # Copias para que el llamador no altere la caché; previos solo si se pide
+            distancias = dict(resultado[0])
+            previos = dict(resultado[1]) if predecesores else None
         
-        _dfs(inicio)
-        return resultado
+        if predecesores:
+            return distancias, previos
+        return distancias
     
-    def dijkstra(self, inicio):
-        """Algoritmo de Dijkstra para camino más corto"""
-        distancias = {vertice: float('inf') for vertice in self.grafo}
+    def _dijkstra(self, inicio, destino=None):
+        """Dijkstra con montículo; retorna (distancias, predecesores)"""
+        # Con destino solo se guardan los alcanzados: la salida temprana no cuesta O(V)
+        distancias = {} if destino is not None else {v: float('inf') for v in self.grafo}
         distancias[inicio] = 0
+        previos = {inicio: None}
+        visitados = set()
+        monticulo = [(0, 0, inicio)]
+        contador = 1  # desempata sin comparar vértices
+        
+        while monticulo:
+            distancia_actual, _, vertice_actual = heapq.heappop(monticulo)
+            if vertice_actual in visitados:
+                continue
+            visitados.add(vertice_actual)
+            if vertice_actual == destino:
+                break
+            
+            for vecino, peso in self.grafo.get(vertice_actual, ()):
+                if vecino in visitados:
+                    continue
+                nueva_distancia = distancia_actual + peso
+                if nueva_distancia < distancias.get(vecino, float('inf')):
+                    distancias[vecino] = nueva_distancia
+                    previos[vecino] = vertice_actual
+                    heapq.heappush(monticulo, (nueva_distancia, contador, vecino))
+                    contador += 1
+        
+        return distancias, previos
+    
+    def _dijkstra_por_lotes(self, inicio, destino=None, lote=64):
+        """Dijkstra sobre un proveedor; retorna (distancias, predecesores)
+
+        Cuando hace falta la adyacencia de un vértice se piden también las
+        de los primeros `lote` candidatos del montículo (los próximos en
+        salir), así la cantidad de consultas baja en un factor de hasta `lote`.
+        """
+        proveedor = self.proveedor
+        adyacencias = {}  # traídas por adelantado y aún no usadas
+        distancias = {inicio: 0}
+        previos = {inicio: None}
         visitados = set()
+        monticulo = [(0, 0, inicio)]
+        contador = 1
         
-        while len(visitados) < len(self.grafo):
-            no_visitados = {v: distancias[v] for v in self.grafo if v not in visitados}
+        while monticulo:
+            distancia_actual, _, vertice_actual = heapq.heappop(monticulo)
+            if vertice_actual in visitados:
+                continue
+            visitados.add(vertice_actual)
+            if vertice_actual == destino:
+                break
             
-            if not no_visitados:
+            vecinos = adyacencias.pop(vertice_actual, None)
+            if vecinos is None:
+                pendientes = [vertice_actual]
+                for _, _, candidato in monticulo[:lote]:
+                    if candidato not in visitados and candidato not in adyacencias:
+                        pendientes.append(candidato)
+                adyacencias.update(proveedor.vecinos_lote(pendientes))
+                vecinos = adyacencias.pop(vertice_actual, ())
+            for vecino, peso in vecinos:
+                if vecino in visitados:
+                    continue
+                nueva_distancia = distancia_actual + peso
+                if nueva_distancia < distancias.get(vecino, float('inf')):
+                    distancias[vecino] = nueva_distancia
+                    previos[vecino] = vertice_actual
+                    heapq.heappush(monticulo, (nueva_distancia, contador, vecino))
+                    contador += 1
+        
+        return distancias, previos
+    
+    def _dijkstra_con_frontera(self, inicio, destino, frontera):
+        """Dijkstra con decremento de clave sobre frontera(); retorna (distancias, predecesores)
+
+        La frontera debe ofrecer encolar(elemento, prioridad) -> manejador,
+        desencolar(), esta_vacia() y cambiar_prioridad(manejador, prioridad).
+        """
+        # Con destino solo se guardan los alcanzados: la salida temprana no cuesta O(V)
+        distancias = {} if destino is not None else {v: float('inf') for v in self.grafo}
+        distancias[inicio] = 0
+        previos = {inicio: None}
+        fijados = set()
+        cola = frontera()
+        manejadores = {inicio: cola.encolar(inicio, 0)}
+        
+        while not cola.esta_vacia():
+            vertice_actual = cola.desencolar()
+            fijados.add(vertice_actual)
+            if vertice_actual == destino:
                 break
+            distancia_actual = distancias[vertice_actual]
             
-            vertice_actual = min(no_visitados, key=no_visitados.get)
+            for vecino, peso in self.grafo.get(vertice_actual, ()):
+                if vecino in fijados:
+                    continue
+                nueva_distancia = distancia_actual + peso
+                if nueva_distancia < distancias.get(vecino, float('inf')):
+                    distancias[vecino] = nueva_distancia
+                    previos[vecino] = vertice_actual
+                    if vecino in manejadores:
+                        cola.cambiar_prioridad(manejadores[vecino], nueva_distancia)
+                    else:
+                        manejadores[vecino] = cola.encolar(vecino, nueva_distancia)
+        
+        return distancias, previos
+    
+    def _dijkstra_instrumentado(self, inicio, destino, estadisticas):
+        """_dijkstra que además cuenta extracciones, aristas y relajaciones"""
+        medidas, avisar = _preparar_estadisticas(estadisticas, 'dijkstra')
+        comienzo = time.perf_counter()
+        # Con destino solo se guardan los alcanzados: la salida temprana no cuesta O(V)
+        distancias = {} if destino is not None else {v: float('inf') for v in self.grafo}
+        distancias[inicio] = 0
+        previos = {inicio: None}
+        visitados = set()
+        monticulo = [(0, 0, inicio)]
+        contador = 1
+        medidas.tiempos['preparacion'] = time.perf_counter() - comienzo
+        
+        comienzo = time.perf_counter()
+        while monticulo:
+            if len(monticulo) > medidas.frontera_maxima:
+                medidas.frontera_maxima = len(monticulo)
+            distancia_actual, _, vertice_actual = heapq.heappop(monticulo)
+            medidas.extraidos += 1
+            if vertice_actual in visitados:
+                medidas.descartados += 1
+                continue
             visitados.add(vertice_actual)
+            if vertice_actual == destino:
+                break
             
-            for vecino, peso in self.grafo[vertice_actual]:
-                nueva_distancia = distancias[vertice_actual] + peso
-                if nueva_distancia < distancias[vecino]:
+            for vecino, peso in self.grafo.get(vertice_actual, ()):
+                medidas.aristas_examinadas += 1
+                if vecino in visitados:
+                    continue
+                nueva_distancia = distancia_actual + peso
+                if nueva_distancia < distancias.get(vecino, float('inf')):
+                    medidas.relajaciones += 1
                     distancias[vecino] = nueva_distancia
+                    previos[vecino] = vertice_actual
+                    heapq.heappush(monticulo, (nueva_distancia, contador, vecino))
+                    contador += 1
         
-        return distancias
+        medidas.tiempos['busqueda'] = time.perf_counter() - comienzo
+        avisar()
+        return distancias, previos
+    
+    def camino_mas_corto(self, inicio, destino):
+        """Retorna (distancia, camino) de inicio a destino, o (inf, None)"""
+        distancias, previos = self.dijkstra(inicio, destino, predecesores=True)
+        if destino not in previos:
+            return float('inf'), None
+        return distancias[destino], reconstruir_camino(previos, destino)
+    
+    def dijkstra_multifuente(self, origenes, hacia=False):
+        """Distancia de cada vértice a su origen más cercano, en una sola búsqueda
+
+        Todos los orígenes entran al montículo con distancia 0, así el costo
+        es el de un único Dijkstra sin importar cuántos haya. Retorna
+        (distancias, propietario), donde propietario[v] es el origen más
+        cercano a v (una partición de Voronoi del grafo); los empates los
+        gana el origen que aparece primero, porque el montículo y las
+        relajaciones comparan (distancia, posición del origen). Solo incluye
+        vértices alcanzados. En grafos dirigidos, con `hacia=True` se mide la
+        distancia desde cada vértice hasta el origen (aristas invertidas).
+        """
+        adyacencia = self._adyacencia_inversa() if hacia else self.grafo
+        distancias = {}
+        propietario = {}
+        rangos = {}  # posición de cada origen en `origenes`
+        monticulo = []
+        for origen in origenes:
+            if origen not in distancias:
+                distancias[origen] = 0
+                propietario[origen] = origen
+                rangos[origen] = len(rangos)
+                monticulo.append((0, rangos[origen], len(monticulo), origen))
+        contador = len(monticulo)
+        visitados = set()
+        
+        while monticulo:
+            distancia_actual, rango, _, vertice_actual = heapq.heappop(monticulo)
+            if vertice_actual in visitados:
+                continue
+            visitados.add(vertice_actual)
+            dueno = propietario[vertice_actual]
+            
+            for vecino, peso in adyacencia.get(vertice_actual, ()):
+                if vecino in visitados:
+                    continue
+                nueva_distancia = distancia_actual + peso
+                anterior = distancias.get(vecino, float('inf'))
+                if nueva_distancia < anterior or (
+                        nueva_distancia == anterior and rango < rangos[propietario[vecino]]):
+                    distancias[vecino] = nueva_distancia
+                    propietario[vecino] = dueno
+                    heapq.heappush(monticulo, (nueva_distancia, rango, contador, vecino))
+                    contador += 1
+        
+        return distancias, propietario
+    
+    def bfs_multifuente(self, origenes, hacia=False):
+        """Saltos de cada vértice a su origen más cercano, en un solo BFS
+
+        Como dijkstra_multifuente pero sin pesos: retorna (saltos,
+        propietario) recorriendo cada arista una sola vez. Cada nivel queda
+        en la cola ordenado por la posición de su origen, así los empates
+        también los gana el origen que aparece primero.
+        """
+        adyacencia = self._adyacencia_inversa() if hacia else self.grafo
+        saltos = {}
+        propietario = {}
+        cola = deque()
+        for origen in origenes:
+            if origen not in saltos:
+                saltos[origen] = 0
+                propietario[origen] = origen
+                cola.append(origen)
+        
+        while cola:
+            vertice = cola.popleft()
+            siguiente = saltos[vertice] + 1
+            dueno = propietario[vertice]
+            for vecino, _ in adyacencia.get(vertice, ()):
+                if vecino not in saltos:
+                    saltos[vecino] = siguiente
+                    propietario[vecino] = dueno
+                    cola.append(vecino)
+        
+        return saltos, propietario
+    
+    def _adyacencia_inversa(self):
+        """Lista de adyacencia con las aristas invertidas (cacheada por versión)"""
+        if not self.dirigido:
+            return self.grafo
+        if self._inversa is None or self._inversa[0] != self.version:
+            inversa = defaultdict(list)
+            for vertice, vecinos in self.grafo.items():
+                for vecino, peso in vecinos:
+                    inversa[vecino].append((vertice, peso))
+            self._inversa = (self.version, inversa)
+        return self._inversa[1]
+    
+    def camino_bfs_bidireccional(self, inicio, destino):
+        """Camino con menos aristas buscando desde ambos extremos a la vez
+
+        Expande siempre la frontera más pequeña, nivel a nivel, hasta que
+        las dos búsquedas se encuentran. Retorna (camino, expandidos), con
+        camino None si no existe; expandidos cuenta los vértices cuyos
+        vecinos se revisaron.
+        """
+        if inicio == destino:
+            return [inicio], 0
+        adyacencias = (self.grafo, self._adyacencia_inversa())
+        padres = ({inicio: None}, {destino: None})
+        fronteras = ([inicio], [destino])
+        expandidos = 0
+        
+        while fronteras[0] and fronteras[1]:
+            lado = 0 if len(fronteras[0]) <= len(fronteras[1]) else 1
+            propios, ajenos = padres[lado], padres[1 - lado]
+            adyacencia = adyacencias[lado]
+            siguiente = []
+            encuentro = None
+            for vertice in fronteras[lado]:
+                expandidos += 1
+                for vecino, _ in adyacencia.get(vertice, ()):
+                    if vecino in propios:
+                        continue
+                    propios[vecino] = vertice
+                    if vecino in ajenos:
+                        encuentro = vecino
+                        break
+                    siguiente.append(vecino)
+                if encuentro is not None:
+                    break
+            
+            if encuentro is not None:
+                ida = reconstruir_camino(padres[0], encuentro)
+                vuelta = reconstruir_camino(padres[1], encuentro)
+                return ida + vuelta[-2::-1], expandidos
+            fronteras = (siguiente, fronteras[1]) if lado == 0 else (fronteras[0], siguiente)
+        
+        return None, expandidos
+    
+    def a_estrella(self, inicio, destino, heuristica=None):
+        """Búsqueda A* de inicio a destino
+
+        `heuristica(vertice, destino)` debe ser una cota inferior consistente
+        de la distancia restante; sin heurística equivale a Dijkstra con
+        parada temprana. Retorna (distancia, camino, expandidos), con
+        (inf, None, expandidos) si no hay camino.
+        """
+        if heuristica is None:
+            heuristica = lambda vertice, objetivo: 0
+        distancias = {inicio: 0}
+        previos = {inicio: None}
+        cerrados = set()
+        monticulo = [(heuristica(inicio, destino), 0, inicio)]
+        contador = 1
+        
+        while monticulo:
+            _, _, vertice = heapq.heappop(monticulo)
+            if vertice in cerrados:
+                continue
+            if vertice == destino:
+                return distancias[vertice], reconstruir_camino(previos, vertice), len(cerrados)
+            cerrados.add(vertice)
+            
+            for vecino, peso in self.grafo.get(vertice, ()):
+                if vecino in cerrados:
+                    continue
+                nueva = distancias[vertice] + peso
+                if nueva < distancias.get(vecino, float('inf')):
+                    distancias[vecino] = nueva
+                    previos[vecino] = vertice
+                    prioridad = nueva + heuristica(vecino, destino)
+                    heapq.heappush(monticulo, (prioridad, contador, vecino))
+                    contador += 1
+        
+        return float('inf'), None, len(cerrados)
+    
+    def congelar(self):
+        """Retorna una copia inmutable y compacta del grafo (GrafoCompacto)
+
+        Los vértices se numeran en orden de aparición y las aristas se
+        guardan en arreglos planos (formato CSR), unas 12-16 bytes por
+        arista frente a las ~100 de la lista de tuplas. Mientras el grafo no
+        cambie se reutiliza la misma copia.
+        """
+        if self._congelado is not None and self._congelado[0] == self.version:
+            return self._congelado[1]
+        
+        indices = {}
+        adyacencias = {}  # se reutiliza en la segunda pasada (con proveedor, sin reconsultar)
+        for vertice, vecinos in self.grafo.items():
+            adyacencias[vertice] = vecinos
+            indices.setdefault(vertice, len(indices))
+            for vecino, _ in vecinos:
+                indices.setdefault(vecino, len(indices))
+        
+        etiquetas = list(indices)
+        desplazamientos = array('q', [0])
+        vecinos_planos = array(_codigo_vecinos(len(etiquetas)))
+        pesos = array('d')
+        for vertice in etiquetas:
+            for vecino, peso in adyacencias.get(vertice, ()):
+                vecinos_planos.append(indices[vecino])
+                pesos.append(peso)
+            desplazamientos.append(len(vecinos_planos))
+        
+        compacto = GrafoCompacto(etiquetas, desplazamientos, vecinos_planos,
+                                 pesos, self.dirigido)
+        self._congelado = (self.version, compacto)
+        return compacto
+    
+    def pagerank(self, amortiguacion=0.85, tolerancia=1e-6, max_iteraciones=100,
+                 al_iterar=None):
+        """PageRank de cada vértice (ver GrafoCompacto.pagerank)"""
+        return self.congelar().pagerank(amortiguacion, tolerancia, max_iteraciones, al_iterar)
+    
+    def centralidad_grado(self, entrada=False):
+        """Centralidad de grado (ver GrafoCompacto.centralidad_grado)"""
+        return self.congelar().centralidad_grado(entrada)
+    
+    def centralidad_cercania(self, ponderada=False):
+        """Centralidad de cercanía (ver GrafoCompacto.centralidad_cercania)"""
+        return self.congelar().centralidad_cercania(ponderada)
+    
+    def componentes_fuertes(self):
+        """Retorna las componentes fuertemente conexas como listas de vértices"""
+        compacto = self.congelar()
+        componente, cantidad = compacto.componentes_fuertes()
+        grupos = [[] for _ in range(cantidad)]
+        for etiqueta, c in zip(compacto.etiquetas, componente):
+            grupos[c].append(etiqueta)
+        return grupos
+    
+    def alcanzable(self, u, v):
+        """Verifica si hay camino de u a v usando un IndiceAlcanzabilidad
+
+        El índice se construye en la primera consulta y se reconstruye
+        solo cuando el grafo cambió desde entonces.
+        """
+        if self._alcanzabilidad is None or self._alcanzabilidad[0] != self.version:
+            self._alcanzabilidad = (self.version, IndiceAlcanzabilidad(self.congelar()))
+        return self._alcanzabilidad[1].alcanzable(u, v)
+    
+    def preparar_landmarks(self, k=8, semilla=0):
+        """Precalcula un IndiceLandmarks (ALT) para consultas punto a punto
+
+        El índice corresponde a la versión actual; si se agregan aristas
+        hay que volver a prepararlo.
+        """
+        return IndiceLandmarks.construir(self.congelar(), k, semilla)
+    
+    def bfs_por_niveles(self, inicio, como_indices=False):
+        """BFS vectorizado por niveles (ver GrafoCompacto.bfs_por_niveles)"""
+        return self.congelar().bfs_por_niveles(inicio, como_indices)
+    
+    def vecindario(self, vertices, k):
+        """Vecindarios de hasta k saltos (ver GrafoCompacto.vecindario)"""
+        return self.congelar().vecindario(vertices, k)
+    
+    def guardar_binario(self, ruta):
+        """Guarda una instantánea binaria del grafo (ver GrafoCompacto.guardar_binario)"""
+        self.congelar().guardar_binario(ruta)
+    
+    @staticmethod
+    def abrir_binario(ruta):
+        """Abre una instantánea binaria como GrafoCompacto mapeado en memoria"""
+        return GrafoCompacto.abrir_binario(ruta)
+    
+    def matriz_distancias(self, origenes, destinos=None, workers=1):
+        """Matriz de distancias más cortas (ver GrafoCompacto.matriz_distancias)"""
+        return self.congelar().matriz_distancias(origenes, destinos, workers)
     
     def mostrar(self):
         """Muestra la lista de adyacencia del grafo"""
@@ -85,6 +835,1282 @@ class Grafo:
             print(f"{vertice}: [{vecinos}]")
 
 
+class VecinosIndexados:
+    """Adyacencia de un vértice indexada por vecino (diccionario vecino -> peso)
+
+    Se recorre igual que la lista de tuplas (vecino, peso), así los
+    algoritmos no cambian. append de una arista repetida conserva el
+    menor peso, que es el que usan los caminos más cortos.
+    """
+    
+    __slots__ = ('pesos',)
+    
+    def __init__(self, aristas=()):
+        """Crea la adyacencia, opcionalmente a partir de pares (vecino, peso)"""
+        self.pesos = {}
+        for arista in aristas:
+            self.append(arista)
+    
+    def append(self, arista):
+        """Agrega la arista (vecino, peso), fusionándola si ya existe"""
+        vecino, peso = arista
+        actual = self.pesos.get(vecino)
+        if actual is None or peso < actual:
+            self.pesos[vecino] = peso
+    
+    def __iter__(self):
+        return iter(self.pesos.items())
+    
+    def __len__(self):
+        return len(self.pesos)
+    
+    def __contains__(self, vecino):
+        return vecino in self.pesos
+    
+    def __repr__(self):
+        return f"VecinosIndexados({list(self.pesos.items())!r})"
+
+
+class ConjuntosDisjuntos:
+    """Unión-búsqueda con compresión de caminos y unión por rango
+
+    Las operaciones cuestan tiempo amortizado casi constante.
+    """
+    
+    def __init__(self):
+        """Crea una estructura sin elementos"""
+        self.padre = {}
+        self.rango = {}
+        self.tamanos = {}
+        self.cantidad = 0  # número de conjuntos
+    
+    def agregar(self, x):
+        """Agrega x como conjunto propio si no estaba"""
+        if x not in self.padre:
+            self.padre[x] = x
+            self.rango[x] = 0
+            self.tamanos[x] = 1
+            self.cantidad += 1
+    
+    def encontrar(self, x):
+        """Retorna el representante del conjunto de x (x mismo si no existe)"""
+        padre = self.padre
+        if x not in padre:
+            return x
+        raiz = x
+        while padre[raiz] != raiz:
+            raiz = padre[raiz]
+        while padre[x] != raiz:  # compresión de caminos
+            padre[x], x = raiz, padre[x]
+        return raiz
+    
+    def unir(self, a, b):
+        """Une los conjuntos de a y b; retorna False si ya estaban unidos"""
+        self.agregar(a)
+        self.agregar(b)
+        a, b = self.encontrar(a), self.encontrar(b)
+        if a == b:
+            return False
+        if self.rango[a] < self.rango[b]:
+            a, b = b, a
+        self.padre[b] = a
+        self.tamanos[a] += self.tamanos.pop(b)
+        if self.rango[a] == self.rango[b]:
+            self.rango[a] += 1
+        self.cantidad -= 1
+        return True
+    
+    def conectados(self, a, b):
+        """Verifica si a y b pertenecen al mismo conjunto"""
+        return a == b or (a in self.padre and self.encontrar(a) == self.encontrar(b))
+    
+    def tamano(self, x):
+        """Retorna el tamaño del conjunto de x"""
+        return self.tamanos.get(self.encontrar(x), 1)
+
+
+class EstadisticasBusqueda:
+    """Contadores de una ejecución de bfs o dijkstra
+
+    - extraidos: vértices sacados de la frontera (incluye repetidos descartados)
+    - descartados: extracciones de vértices ya fijados (solo dijkstra)
+    - aristas_examinadas: entradas de adyacencia revisadas
+    - relajaciones: mejoras de distancia (solo dijkstra)
+    - frontera_maxima: tamaño máximo de la cola o montículo
+    - tiempos: segundos por fase ('preparacion', 'busqueda')
+    """
+    
+    def __init__(self, algoritmo=None):
+        """Crea contadores en cero"""
+        self.algoritmo = algoritmo
+        self.extraidos = 0
+        self.descartados = 0
+        self.aristas_examinadas = 0
+        self.relajaciones = 0
+        self.frontera_maxima = 0
+        self.tiempos = {}
+    
+    def a_diccionario(self):
+        """Retorna las medidas como diccionario (para registrar o graficar)"""
+        return {
+            'algoritmo': self.algoritmo,
+            'extraidos': self.extraidos,
+            'descartados': self.descartados,
+            'aristas_examinadas': self.aristas_examinadas,
+            'relajaciones': self.relajaciones,
+            'frontera_maxima': self.frontera_maxima,
+            'tiempos': dict(self.tiempos),
+        }
+
+
+def _preparar_estadisticas(estadisticas, algoritmo):
+    """Retorna (EstadisticasBusqueda, avisar) para un parámetro `estadisticas`
+
+    Si se recibió una función, `avisar()` se la entrega al terminar.
+    """
+    if isinstance(estadisticas, EstadisticasBusqueda):
+        estadisticas.algoritmo = algoritmo
+        return estadisticas, lambda: None
+    medidas = EstadisticasBusqueda(algoritmo)
+    return medidas, lambda: estadisticas(medidas)
+
+
+class CacheRutas:
+    """Caché LRU de resultados de Dijkstra por origen, ligada a una versión
+
+    Si la versión del grafo cambia, todas las entradas se descartan antes
+    de responder, así nunca se sirve un resultado obsoleto.
+    """
+    
+    def __init__(self, capacidad=128):
+        """Crea una caché vacía con capacidad máxima de entradas"""
+        self.capacidad = capacidad
+        self.entradas = OrderedDict()
+        self.version = None
+        self.aciertos = 0
+        self.fallos = 0
+        self.desalojos = 0
+        self.invalidaciones = 0
+    
+    def obtener(self, clave, version):
+        """Retorna el valor guardado para clave, o None si no está vigente"""
+        if version != self.version:
+            if self.entradas:
+                self.invalidaciones += 1
+                self.entradas.clear()
+            self.version = version
+        valor = self.entradas.get(clave)
+        if valor is None:
+            self.fallos += 1
+            return None
+        self.entradas.move_to_end(clave)
+        self.aciertos += 1
+        return valor
+    
+    def guardar(self, clave, version, valor):
+        """Guarda un valor calculado con la versión indicada"""
+        if version != self.version:
+            self.entradas.clear()
+            self.version = version
+        self.entradas[clave] = valor
+        self.entradas.move_to_end(clave)
+        while len(self.entradas) > self.capacidad:
+            self.entradas.popitem(last=False)
+            self.desalojos += 1
+    
+    def estadisticas(self):
+        """Retorna un diccionario con aciertos, fallos, desalojos y tamaño"""
+        consultas = self.aciertos + self.fallos
+        return {
+            'aciertos': self.aciertos,
+            'fallos': self.fallos,
+            'desalojos': self.desalojos,
+            'invalidaciones': self.invalidaciones,
+            'entradas': len(self.entradas),
+            'tasa_aciertos': self.aciertos / consultas if consultas else 0.0,
+        }
+
+
+class ProveedorAdyacencia:
+    """Interfaz para grafos cuyas aristas están fuera de memoria
+
+    Las subclases implementan vecinos_lote(vertices), que retorna
+    {vértice: [(vecino, peso), ...]} para todos los vértices pedidos (lista
+    vacía si no tiene aristas) idealmente con una sola consulta, y
+    vertices(), que recorre todos los vértices con aristas de salida.
+    """
+    
+    def vecinos_lote(self, vertices):
+        """Retorna las adyacencias de todos los vértices pedidos"""
+        raise NotImplementedError
+    
+    def vecinos(self, vertice):
+        """Retorna la adyacencia de un solo vértice"""
+        return self.vecinos_lote([vertice]).get(vertice, ())
+    
+    def vertices(self):
+        """Recorre los vértices con aristas de salida"""
+        raise NotImplementedError
+
+
+class ProveedorSQLite(ProveedorAdyacencia):
+    """Adyacencia guardada en una tabla SQLite (origen, destino, peso)
+
+    Cada lote se resuelve con una sola consulta: los vértices viajan como
+    un arreglo JSON y se cruzan con el índice sobre `origen`. Los vértices
+    deben ser números o cadenas.
+    """
+    
+    def __init__(self, ruta, tabla='aristas'):
+        """Abre una base existente creada con ProveedorSQLite.crear"""
+        if not tabla.isidentifier():
+            raise ValueError(f"nombre de tabla inválido: {tabla!r}")
+        self.ruta = ruta
+        self.tabla = tabla
+        self.conexion = sqlite3.connect(ruta)
+        self.consultas = 0
+    
+    @classmethod
+    def crear(cls, ruta, aristas, dirigido=False, tabla='aristas', tamano_bloque=65536):
+        """Guarda aristas (u, v) o (u, v, peso) en una base nueva y la abre
+
+        En grafos no dirigidos cada arista se guarda en ambos sentidos.
+        """
+        if not tabla.isidentifier():
+            raise ValueError(f"nombre de tabla inválido: {tabla!r}")
+        conexion = sqlite3.connect(ruta)
+        try:
+            with conexion:
+                conexion.execute(f"CREATE TABLE {tabla} (origen, destino, peso)")
+                for bloque in _bloques(aristas, tamano_bloque):
+                    filas = []
+                    for arista in bloque:
+                        u, v = arista[0], arista[1]
+                        peso = arista[2] if len(arista) > 2 else 1
+                        filas.append((u, v, peso))
+                        if not dirigido:
+                            filas.append((v, u, peso))
+                    conexion.executemany(f"INSERT INTO {tabla} VALUES (?, ?, ?)", filas)
+                conexion.execute(f"CREATE INDEX {tabla}_origen ON {tabla} (origen)")
+        finally:
+            conexion.close()
+        return cls(ruta, tabla)
+    
+    def vecinos_lote(self, vertices):
+        """Retorna las adyacencias de todos los vértices con una consulta"""
+        resultado = {vertice: [] for vertice in vertices}
+        filas = self.conexion.execute(
+            f"SELECT origen, destino, peso FROM {self.tabla} "
+            f"WHERE origen IN (SELECT value FROM json_each(?)) ORDER BY rowid",
+            (json.dumps(list(resultado)),))
+        self.consultas += 1
+        for origen, destino, peso in filas:
+            resultado[origen].append((destino, peso))
+        return resultado
+    
+    def vertices(self):
+        """Recorre los vértices con aristas de salida"""
+        for (vertice,) in self.conexion.execute(f"SELECT DISTINCT origen FROM {self.tabla}"):
+            yield vertice
+    
+    def cerrar(self):
+        """Cierra la conexión"""
+        self.conexion.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *excepcion):
+        self.cerrar()
+
+
+class CacheVecinos(ProveedorAdyacencia):
+    """Caché LRU de adyacencias delante de otro proveedor
+
+    Guarda hasta `capacidad` vértices; en cada lote solo se piden al
+    proveedor los que faltan, con una única llamada.
+    """
+    
+    def __init__(self, proveedor, capacidad=4096):
+        """Envuelve a proveedor con una caché vacía"""
+        self.proveedor = proveedor
+        self.capacidad = capacidad
+        self.entradas = OrderedDict()
+        self.aciertos = 0
+        self.fallos = 0
+        self.desalojos = 0
+    
+    def vecinos_lote(self, vertices):
+        """Retorna las adyacencias pidiendo al proveedor solo las que faltan"""
+        entradas = self.entradas
+        resultado = {}
+        faltantes = []
+        for vertice in vertices:
+            if vertice in resultado:
+                continue
+            vecinos = entradas.get(vertice)
+            if vecinos is None:
+                faltantes.append(vertice)
+                resultado[vertice] = ()
+            else:
+                entradas.move_to_end(vertice)
+                resultado[vertice] = vecinos
+        self.aciertos += len(resultado) - len(faltantes)
+        self.fallos += len(faltantes)
+        
+        if faltantes:
+            traidos = self.proveedor.vecinos_lote(faltantes)
+            for vertice in faltantes:
+                vecinos = tuple(traidos.get(vertice, ()))
+                resultado[vertice] = vecinos
+                entradas[vertice] = vecinos
+            while len(entradas) > self.capacidad:
+                entradas.popitem(last=False)
+                self.desalojos += 1
+        return resultado
+    
+    def vertices(self):
+        """Recorre los vértices del proveedor envuelto"""
+        return self.proveedor.vertices()
+    
+    def estadisticas(self):
+        """Retorna un diccionario con aciertos, fallos, desalojos y tamaño"""
+        consultas = self.aciertos + self.fallos
+        return {
+            'aciertos': self.aciertos,
+            'fallos': self.fallos,
+            'desalojos': self.desalojos,
+            'entradas': len(self.entradas),
+            'tasa_aciertos': self.aciertos / consultas if consultas else 0.0,
+        }
+
+
+class _AdyacenciaExterna:
+    """Vista de solo lectura con la interfaz de diccionario sobre un proveedor"""
+    
+    def __init__(self, proveedor):
+        self.proveedor = proveedor
+    
+    def get(self, vertice, defecto=None):
+        return self.proveedor.vecinos_lote([vertice]).get(vertice, defecto)
+    
+    def __getitem__(self, vertice):
+        return self.get(vertice, ())
+    
+    def __iter__(self):
+        return iter(self.proveedor.vertices())
+    
+    def keys(self):
+        return self.proveedor.vertices()
+    
+    def items(self):
+        for bloque in _bloques(self.proveedor.vertices(), 1024):
+            lote = self.proveedor.vecinos_lote(bloque)
+            for vertice in bloque:
+                yield vertice, lote.get(vertice, ())
+
+
+class GrafoCompacto:
+    """Vista inmutable de un Grafo en formato CSR (compressed sparse row)
+
+    Los vecinos del vértice i son vecinos[desplazamientos[i]:desplazamientos[i+1]]
+    con sus pesos en la misma franja de `pesos`. Ofrece los mismos recorridos
+    que Grafo, recibiendo y retornando las etiquetas originales.
+    """
+    
+    def __init__(self, etiquetas, desplazamientos, vecinos, pesos, dirigido=False):
+        """Crea la vista a partir de los arreglos ya construidos"""
+        self.etiquetas = etiquetas
+        self.indices = {etiqueta: i for i, etiqueta in enumerate(etiquetas)}
+        self.desplazamientos = desplazamientos
+        self.vecinos = vecinos
+        self.pesos = pesos
+        self.dirigido = dirigido
+        self.ruta = None  # archivo binario mapeado, si lo hay
+        self._mapa = None
+    
+    def __reduce__(self):
+        # Las copias mapeadas se reabren desde el archivo en vez de copiarse
+        if self.ruta is not None:
+            return (GrafoCompacto.abrir_binario, (self.ruta,))
+        return (GrafoCompacto, (self.etiquetas, self.desplazamientos, self.vecinos,
+                                self.pesos, self.dirigido))
+    
+    # Formato binario: cabecera, etiquetas en JSON, desplazamientos (int64),
+    # vecinos (int32 o int64) y pesos (float64), cada sección alineada a 8 bytes
+    MAGIA = b'GRAFOCSR'
+    VERSION_FORMATO = 1
+    _CABECERA = struct.Struct('<8sHccBqqq')
+    
+    def guardar_binario(self, ruta):
+        """Escribe el grafo en un archivo binario versionado
+
+        Las etiquetas deben ser str, int, float o tuplas de ellos.
+        """
+        etiquetas = json.dumps(self.etiquetas, ensure_ascii=False).encode('utf-8')
+        desplazamientos = array('q', self.desplazamientos)
+        vecinos = array(_codigo_vecinos(len(self.etiquetas)), self.vecinos)
+        pesos = array('d', self.pesos)
+        orden = b'<' if sys.byteorder == 'little' else b'>'
+        cabecera = self._CABECERA.pack(
+            self.MAGIA, self.VERSION_FORMATO, orden, vecinos.typecode.encode(),
+            int(self.dirigido), len(self.etiquetas), len(vecinos), len(etiquetas))
+        
+        with open(ruta, 'wb') as archivo:
+            archivo.write(cabecera)
+            archivo.write(etiquetas)
+            archivo.write(bytes(_relleno(len(cabecera) + len(etiquetas))))
+            for arreglo in (desplazamientos, vecinos, pesos):
+                arreglo.tofile(archivo)
+    
+    @classmethod
+    def abrir_binario(cls, ruta):
+        """Abre un archivo de guardar_binario mapeándolo en memoria
+
+        Los arreglos son vistas de solo lectura sobre el archivo (sin copia),
+        así varios procesos comparten las mismas páginas del sistema.
+        """
+        with open(ruta, 'rb') as archivo:
+            mapa = mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ)
+        vista = memoryview(mapa)
+        tamano_cabecera = cls._CABECERA.size
+        if len(vista) < tamano_cabecera:
+            vista.release()
+            mapa.close()
+            raise ValueError(f"{ruta} no es un grafo binario")
+        (magia, version, orden, codigo, dirigido, n, m,
+         largo_etiquetas) = cls._CABECERA.unpack_from(vista)
+        error = None
+        if magia != cls.MAGIA or codigo not in (b'i', b'q'):
+            error = f"{ruta} no es un grafo binario"
+        elif version != cls.VERSION_FORMATO:
+            error = f"Versión de formato no soportada: {version}"
+        elif orden != (b'<' if sys.byteorder == 'little' else b'>'):
+            error = "El archivo se escribió con otro orden de bytes"
+        else:
+            codigo = codigo.decode()
+            datos = tamano_cabecera + largo_etiquetas
+            datos += _relleno(datos)
+            esperado = datos + (n + 1) * 8 + m * (array(codigo).itemsize + 8)
+            if len(vista) != esperado:
+                error = (f"{ruta} está truncado o dañado: tiene {len(vista)} bytes "
+                         f"y se esperaban {esperado}")
+        if error is not None:
+            vista.release()
+            mapa.close()
+            raise ValueError(error)
+        
+        inicio = tamano_cabecera + largo_etiquetas
+        etiquetas = [_a_tupla(e) for e in
+                     json.loads(bytes(vista[tamano_cabecera:inicio]).decode('utf-8'))]
+        inicio += _relleno(inicio)
+        secciones = []
+        for tipo, cantidad in (('q', n + 1), (codigo, m), ('d', m)):
+            fin = inicio + cantidad * array(tipo).itemsize
+            secciones.append(vista[inicio:fin].cast(tipo))
+            inicio = fin
+        
+        compacto = cls(etiquetas, *secciones, dirigido=bool(dirigido))
+        compacto.ruta = ruta
+        compacto._mapa = mapa
+        return compacto
+    
+    def cerrar(self):
+        """Libera el mapeo del archivo (el grafo deja de poder usarse)"""
+        if self._mapa is None:
+            return
+        for vista in (self.desplazamientos, self.vecinos, self.pesos):
+            vista.release()
+        self._mapa.close()
+        self._mapa = None
+    
+    def numero_vertices(self):
+        """Retorna la cantidad de vértices"""
+        return len(self.etiquetas)
+    
+    def numero_aristas(self):
+        """Retorna la cantidad de entradas de adyacencia (2 por arista no dirigida)"""
+        return len(self.vecinos)
+    
+    def vecinos_de(self, vertice):
+        """Retorna la lista de (vecino, peso) de un vértice"""
+        i = self.indices.get(vertice)
+        if i is None:
+            return []
+        a, b = self.desplazamientos[i], self.desplazamientos[i + 1]
+        return [(self.etiquetas[v], p)
+                for v, p in zip(self.vecinos[a:b], self.pesos[a:b])]
+    
+    def bfs(self, inicio):
+        """Búsqueda en Amplitud (BFS)"""
+        return list(self.iter_bfs(inicio))
+    
+    def iter_bfs(self, inicio, profundidad=False):
+        """Genera los vértices en orden BFS; ver Grafo.iter_bfs"""
+        origen = self.indices.get(inicio)
+        if origen is None:
+            yield (inicio, 0) if profundidad else inicio
+            return
+        desplazamientos, vecinos, etiquetas = self.desplazamientos, self.vecinos, self.etiquetas
+        visitados = bytearray(len(etiquetas))
+        visitados[origen] = 1
+        cola = deque([(origen, 0)])
+        
+        while cola:
+            vertice, nivel = cola.popleft()
+            yield (etiquetas[vertice], nivel) if profundidad else etiquetas[vertice]
+            for vecino in vecinos[desplazamientos[vertice]:desplazamientos[vertice + 1]]:
+                if not visitados[vecino]:
+                    visitados[vecino] = 1
+                    cola.append((vecino, nivel + 1))
+    
+    def bfs_por_niveles(self, inicio, como_indices=False):
+        """BFS sincronizado por niveles; retorna (orden, saltos)
+
+        Expande cada nivel completo de una vez: con NumPy usa operaciones
+        vectorizadas sobre los arreglos CSR (sin bucle de Python por
+        arista); sin NumPy recorre el nivel con bytearray. El orden es el
+        mismo que el de bfs. `saltos` es un diccionario etiqueta -> saltos;
+        con `como_indices=True` retorna en cambio índices enteros (orden)
+        y la lista de saltos por índice (-1 si no se alcanzó).
+        """
+        origen = self.indices.get(inicio)
+        if origen is None:
+            return ([], []) if como_indices else ([inicio], {inicio: 0})
+        if np is not None:
+            orden, saltos = self._niveles_numpy(origen)
+        else:
+            orden, saltos = self._niveles_python(origen)
+        if como_indices:
+            return orden, saltos
+        etiquetas = self.etiquetas
+        orden = [etiquetas[i] for i in orden]
+        return orden, {etiqueta: saltos[self.indices[etiqueta]] for etiqueta in orden}
+    
+    def _niveles_python(self, origen):
+        desplazamientos, vecinos = self.desplazamientos, self.vecinos
+        saltos = [-1] * len(self.etiquetas)
+        saltos[origen] = 0
+        orden = [origen]
+        frontera = [origen]
+        nivel = 0
+        while frontera:
+            nivel += 1
+            siguiente = []
+            for vertice in frontera:
+                for vecino in vecinos[desplazamientos[vertice]:desplazamientos[vertice + 1]]:
+                    if saltos[vecino] < 0:
+                        saltos[vecino] = nivel
+                        siguiente.append(vecino)
+            orden.extend(siguiente)
+            frontera = siguiente
+        return orden, saltos
+    
+    def _niveles_numpy(self, origen):
+        desplazamientos = np.frombuffer(self.desplazamientos, dtype=np.int64)
+        vecinos = np.frombuffer(self.vecinos, dtype=np.dtype(f'i{self.vecinos.itemsize}'))
+        saltos = np.full(len(self.etiquetas), -1, dtype=np.int64)
+        saltos[origen] = 0
+        frontera = np.array([origen], dtype=np.int64)
+        partes = [frontera]
+        nivel = 0
+        while frontera.size:
+            inicios = desplazamientos[frontera]
+            cuentas = desplazamientos[frontera + 1] - inicios
+            total = int(cuentas.sum())
+            if total == 0:
+                break
+            # Posición de cada arista del nivel dentro de `vecinos`
+            base = np.repeat(inicios - (np.cumsum(cuentas) - cuentas), cuentas)
+            candidatos = vecinos[base + np.arange(total)].astype(np.int64)
+            candidatos = candidatos[saltos[candidatos] < 0]
+            # Primera aparición de cada vértice, en orden de descubrimiento
+            _, primeras = np.unique(candidatos, return_index=True)
+            frontera = candidatos[np.sort(primeras)]
+            nivel += 1
+            saltos[frontera] = nivel
+            partes.append(frontera)
+        return np.concatenate(partes).tolist(), saltos.tolist()
+    
+    def vecindario(self, vertices, k, como_indices=False):
+        """Vecindarios de hasta k saltos de muchos vértices en una sola llamada
+
+        Retorna una lista con un diccionario {vértice: saltos} por cada
+        vértice pedido (él mismo incluido, con 0). Las consultas comparten
+        un arreglo de marcas: un vértice ya se visitó en la consulta i si su
+        marca vale i, así no hay nada que limpiar entre consultas. Cada
+        consulta cuesta O(suma de grados de los vértices a menos de k
+        saltos), sin importar el tamaño del grafo; el arreglo de marcas, de
+        O(V), se crea una sola vez por llamada.
+        """
+        desplazamientos, vecinos = self.desplazamientos, self.vecinos
+        indices, etiquetas = self.indices, self.etiquetas
+        marcas = array('q', [-1]) * len(etiquetas)
+        resultados = []
+        for consulta, vertice in enumerate(vertices):
+            origen = indices.get(vertice)
+            if origen is None:
+                resultados.append({} if como_indices else {vertice: 0})
+                continue
+            marcas[origen] = consulta
+            saltos = {origen: 0}
+            frontera = [origen]
+            for nivel in range(1, k + 1):
+                siguiente = []
+                for actual in frontera:
+                    for vecino in vecinos[desplazamientos[actual]:desplazamientos[actual + 1]]:
+                        if marcas[vecino] != consulta:
+                            marcas[vecino] = consulta
+                            saltos[vecino] = nivel
+                            siguiente.append(vecino)
+                if not siguiente:
+                    break
+                frontera = siguiente
+            if not como_indices:
+                saltos = {etiquetas[indice]: nivel for indice, nivel in saltos.items()}
+            resultados.append(saltos)
+        return resultados
+    
+    def dfs(self, inicio):
+        """Búsqueda en Profundidad (DFS)"""
+        return list(self.iter_dfs(inicio))
+    
+    def iter_dfs(self, inicio, profundidad=False):
+        """Genera los vértices en orden DFS con pila explícita; ver Grafo.iter_dfs"""
+        origen = self.indices.get(inicio)
+        yield (inicio, 0) if profundidad else inicio
+        if origen is None:
+            return
+        desplazamientos, vecinos, etiquetas = self.desplazamientos, self.vecinos, self.etiquetas
+        visitados = bytearray(len(etiquetas))
+        visitados[origen] = 1
+        # Cada entrada es (vértice, posición del próximo vecino a revisar)
+        pila = [(origen, desplazamientos[origen])]
+        
+        while pila:
+            vertice, k = pila[-1]
+            fin = desplazamientos[vertice + 1]
+            while k < fin and visitados[vecinos[k]]:
+                k += 1
+            if k == fin:
+                pila.pop()
+                continue
+            pila[-1] = (vertice, k + 1)
+            vecino = vecinos[k]
+            visitados[vecino] = 1
+            yield (etiquetas[vecino], len(pila)) if profundidad else etiquetas[vecino]
+            pila.append((vecino, desplazamientos[vecino]))
+    
+    def dijkstra(self, inicio, destino=None, predecesores=False):
+        """Algoritmo de Dijkstra sobre los arreglos compactos
+
+        Mismos parámetros y forma de resultado que Grafo.dijkstra.
+        """
+        etiquetas = self.etiquetas
+        origen = self.indices.get(inicio)
+        if origen is None:
+            distancias = {} if destino is not None else {e: float('inf') for e in etiquetas}
+            distancias[inicio] = 0
+            return (distancias, {inicio: None}) if predecesores else distancias
+        
+        if destino is not None:
+            distancia, previo = self._dijkstra_hasta(origen, self.indices.get(destino, -1))
+            distancias = {etiquetas[i]: d for i, d in distancia.items()}
+            if not predecesores:
+                return distancias
+            previos = {etiquetas[i]: etiquetas[p] for i, p in previo.items()}
+            previos[inicio] = None
+            return distancias, previos
+        
+        distancia, previo = self._dijkstra_indices(origen)
+        
+        distancias = dict(zip(etiquetas, distancia))
+        if not predecesores:
+            return distancias
+        previos = {inicio: None}
+        for i, p in enumerate(previo):
+            if p >= 0:
+                previos[etiquetas[i]] = etiquetas[p]
+        return distancias, previos
+    
+    def _dijkstra_indices(self, origen, objetivo=-1):
+        """Dijkstra con índices enteros; retorna (distancias, previos) en listas"""
+        desplazamientos, vecinos, pesos = self.desplazamientos, self.vecinos, self.pesos
+        infinito = float('inf')
+        distancia = [infinito] * len(self.etiquetas)
+        previo = [-1] * len(self.etiquetas)
+        fijado = bytearray(len(self.etiquetas))
+        distancia[origen] = 0
+        monticulo = [(0, origen)]
+        
+        while monticulo:
+            d, u = heapq.heappop(monticulo)
+            if fijado[u]:
+                continue
+            fijado[u] = 1
+            if u == objetivo:
+                break
+            for k in range(desplazamientos[u], desplazamientos[u + 1]):
+                v = vecinos[k]
+                if fijado[v]:
+                    continue
+                nueva = d + pesos[k]
+                if nueva < distancia[v]:
+                    distancia[v] = nueva
+                    previo[v] = u
+                    heapq.heappush(monticulo, (nueva, v))
+        
+        return distancia, previo
+    
+    def _dijkstra_hasta(self, origen, objetivo):
+        """Dijkstra con salida temprana; retorna diccionarios solo de los alcanzados
+
+        Con `objetivo` cercano el costo depende de la zona explorada, no de V.
+        """
+        desplazamientos, vecinos, pesos = self.desplazamientos, self.vecinos, self.pesos
+        infinito = float('inf')
+        distancia = {origen: 0}
+        previo = {}
+        fijado = set()
+        monticulo = [(0, origen)]
+        
+        while monticulo:
+            d, u = heapq.heappop(monticulo)
+            if u in fijado:
+                continue
+            fijado.add(u)
+            if u == objetivo:
+                break
+            for k in range(desplazamientos[u], desplazamientos[u + 1]):
+                v = vecinos[k]
+                if v in fijado:
+                    continue
+                nueva = d + pesos[k]
+                if nueva < distancia.get(v, infinito):
+                    distancia[v] = nueva
+                    previo[v] = u
+                    heapq.heappush(monticulo, (nueva, v))
+        
+        return distancia, previo
+    
+    def _a_estrella_indices(self, origen, objetivo, heuristica):
+        """A* con índices enteros; heuristica(i) acota la distancia de i a objetivo
+
+        Retorna (distancia, camino de índices o None, vértices expandidos).
+        """
+        desplazamientos, vecinos, pesos = self.desplazamientos, self.vecinos, self.pesos
+        distancia = {origen: 0}
+        previo = {origen: -1}
+        cerrados = set()
+        monticulo = [(heuristica(origen), origen)]
+        
+        while monticulo:
+            _, u = heapq.heappop(monticulo)
+            if u in cerrados:
+                continue
+            if u == objetivo:
+                camino = []
+                while u >= 0:
+                    camino.append(u)
+                    u = previo[u]
+                return distancia[objetivo], camino[::-1], len(cerrados)
+            cerrados.add(u)
+            du = distancia[u]
+            for k in range(desplazamientos[u], desplazamientos[u + 1]):
+                v = vecinos[k]
+                if v in cerrados:
+                    continue
+                nueva = du + pesos[k]
+                if nueva < distancia.get(v, float('inf')):
+                    distancia[v] = nueva
+                    previo[v] = u
+                    heapq.heappush(monticulo, (nueva + heuristica(v), v))
+        
+        return float('inf'), None, len(cerrados)
+    
+    def pagerank(self, amortiguacion=0.85, tolerancia=1e-6, max_iteraciones=100,
+                 al_iterar=None):
+        """PageRank por iteración de potencias; retorna {etiqueta: puntaje}
+
+        Cada vértice reparte su puntaje por igual entre sus aristas de
+        salida; el de los vértices sin salida (colgantes) se reparte entre
+        todos. Termina cuando el cambio total (norma L1) es menor que
+        `tolerancia` o tras `max_iteraciones`. al_iterar(iteracion, cambio,
+        segundos) se llama tras cada iteración. Con NumPy cada iteración
+        es una suma dispersa vectorizada (np.bincount).
+        """
+        n = len(self.etiquetas)
+        if n == 0:
+            return {}
+        if np is not None:
+            puntajes = self._pagerank_numpy(amortiguacion, tolerancia, max_iteraciones, al_iterar)
+        else:
+            puntajes = self._pagerank_python(amortiguacion, tolerancia, max_iteraciones, al_iterar)
+        return dict(zip(self.etiquetas, puntajes))
+    
+    def _pagerank_python(self, amortiguacion, tolerancia, max_iteraciones, al_iterar):
+        n = len(self.etiquetas)
+        desplazamientos, vecinos = self.desplazamientos, self.vecinos
+        grados = [desplazamientos[v + 1] - desplazamientos[v] for v in range(n)]
+        puntajes = [1 / n] * n
+        for iteracion in range(1, max_iteraciones + 1):
+            comienzo = time.perf_counter()
+            nuevos = [0.0] * n
+            colgantes = 0.0
+            for v in range(n):
+                if grados[v] == 0:
+                    colgantes += puntajes[v]
+                    continue
+                aporte = puntajes[v] / grados[v]
+                for w in vecinos[desplazamientos[v]:desplazamientos[v + 1]]:
+                    nuevos[w] += aporte
+            base = (1 - amortiguacion) / n + amortiguacion * colgantes / n
+            nuevos = [base + amortiguacion * x for x in nuevos]
+            cambio = sum(abs(a - b) for a, b in zip(nuevos, puntajes))
+            puntajes = nuevos
+            if al_iterar is not None:
+                al_iterar(iteracion, cambio, time.perf_counter() - comienzo)
+            if cambio < tolerancia:
+                break
+        return puntajes
+    
+    def _pagerank_numpy(self, amortiguacion, tolerancia, max_iteraciones, al_iterar):
+        n = len(self.etiquetas)
+        desplazamientos = np.frombuffer(self.desplazamientos, dtype=np.int64)
+        destinos = np.frombuffer(self.vecinos, dtype=np.dtype(f'i{self.vecinos.itemsize}'))
+        grados = np.diff(desplazamientos)
+        origenes = np.repeat(np.arange(n), grados)
+        factor = 1.0 / grados[origenes]  # fracción del puntaje que lleva cada arista
+        colgantes = grados == 0
+        puntajes = np.full(n, 1.0 / n)
+        for iteracion in range(1, max_iteraciones + 1):
+            comienzo = time.perf_counter()
+            nuevos = np.bincount(destinos, weights=puntajes[origenes] * factor, minlength=n)
+            base = (1 - amortiguacion) / n + amortiguacion * puntajes[colgantes].sum() / n
+            nuevos = base + amortiguacion * nuevos
+            cambio = float(np.abs(nuevos - puntajes).sum())
+            puntajes = nuevos
+            if al_iterar is not None:
+                al_iterar(iteracion, cambio, time.perf_counter() - comienzo)
+            if cambio < tolerancia:
+                break
+        return puntajes.tolist()
+    
+    def centralidad_grado(self, entrada=False):
+        """Grado normalizado por n - 1; con entrada=True cuenta aristas entrantes"""
+        n = len(self.etiquetas)
+        if entrada:
+            grados = [0] * n
+            for w in self.vecinos:
+                grados[w] += 1
+        else:
+            desplazamientos = self.desplazamientos
+            grados = [desplazamientos[v + 1] - desplazamientos[v] for v in range(n)]
+        escala = 1 / (n - 1) if n > 1 else 0.0
+        return {etiqueta: grado * escala for etiqueta, grado in zip(self.etiquetas, grados)}
+    
+    def centralidad_cercania(self, ponderada=False):
+        """Cercanía de cada vértice: inversa de su distancia media a los demás
+
+        Usa saltos (BFS por niveles) o, con ponderada=True, distancias de
+        Dijkstra. Se escala por la fracción de vértices alcanzados para que
+        los grafos desconectados sean comparables. Cuesta un recorrido
+        completo por vértice.
+        """
+        n = len(self.etiquetas)
+        resultado = {}
+        for v, etiqueta in enumerate(self.etiquetas):
+            if ponderada:
+                distancias = [d for d in self._dijkstra_indices(v)[0] if d != float('inf')]
+            else:
+                distancias = [d for d in self.bfs_por_niveles(etiqueta, como_indices=True)[1]
+                              if d >= 0]
+            alcanzados = len(distancias) - 1
+            total = sum(distancias)
+            resultado[etiqueta] = (alcanzados / total) * (alcanzados / (n - 1)) if total > 0 else 0.0
+        return resultado
+    
+    def componentes_fuertes(self):
+        """Componentes fuertemente conexas (Tarjan iterativo)
+
+        Retorna (componente, cantidad): componente[i] es el número de la
+        componente del vértice i. Los números siguen un orden topológico
+        inverso de la condensación: toda arista va de una componente a
+        otra de número menor o igual.
+        """
+        n = len(self.etiquetas)
+        desplazamientos, vecinos = self.desplazamientos, self.vecinos
+        orden = [-1] * n  # orden de descubrimiento
+        bajo = [0] * n
+        en_pila = bytearray(n)
+        pila = []
+        componente = [-1] * n
+        cantidad = 0
+        contador = 0
+        
+        for raiz in range(n):
+            if orden[raiz] != -1:
+                continue
+            orden[raiz] = bajo[raiz] = contador
+            contador += 1
+            pila.append(raiz)
+            en_pila[raiz] = 1
+            llamadas = [(raiz, desplazamientos[raiz])]  # simula la recursión
+            while llamadas:
+                v, k = llamadas[-1]
+                if k < desplazamientos[v + 1]:
+                    llamadas[-1] = (v, k + 1)
+                    w = vecinos[k]
+                    if orden[w] == -1:
+                        orden[w] = bajo[w] = contador
+                        contador += 1
+                        pila.append(w)
+                        en_pila[w] = 1
+                        llamadas.append((w, desplazamientos[w]))
+                    elif en_pila[w] and orden[w] < bajo[v]:
+                        bajo[v] = orden[w]
+                    continue
+                llamadas.pop()
+                if llamadas:
+                    padre = llamadas[-1][0]
+                    if bajo[v] < bajo[padre]:
+                        bajo[padre] = bajo[v]
+                if bajo[v] == orden[v]:
+                    while True:
+                        w = pila.pop()
+                        en_pila[w] = 0
+                        componente[w] = cantidad
+                        if w == v:
+                            break
+                    cantidad += 1
+        
+        return componente, cantidad
+    
+    def invertido(self):
+        """Retorna un GrafoCompacto con todas las aristas invertidas"""
+        if not self.dirigido:
+            return self
+        n = len(self.etiquetas)
+        cuentas = [0] * (n + 1)
+        for v in self.vecinos:
+            cuentas[v + 1] += 1
+        for i in range(n):
+            cuentas[i + 1] += cuentas[i]
+        desplazamientos = array('q', cuentas)
+        posicion = cuentas[:-1]
+        vecinos = array(_codigo_vecinos(n), [0]) * len(self.vecinos)
+        pesos = array('d', [0.0]) * len(self.vecinos)
+        for u in range(n):
+            for k in range(self.desplazamientos[u], self.desplazamientos[u + 1]):
+                v = self.vecinos[k]
+                vecinos[posicion[v]] = u
+                pesos[posicion[v]] = self.pesos[k]
+                posicion[v] += 1
+        return GrafoCompacto(self.etiquetas, desplazamientos, vecinos, pesos, True)
+    
+    def camino_mas_corto(self, inicio, destino):
+        """Retorna (distancia, camino) de inicio a destino, o (inf, None)"""
+        distancias, previos = self.dijkstra(inicio, destino, predecesores=True)
+        if destino not in previos:
+            return float('inf'), None
+        return distancias[destino], reconstruir_camino(previos, destino)
+    
+    def matriz_distancias(self, origenes, destinos=None, workers=1):
+        """Calcula las distancias de cada origen a cada destino
+
+        Ejecuta un Dijkstra por origen; con workers > 1 los reparte en un
+        pool de procesos que recibe el grafo una sola vez al arrancar (por
+        herencia con fork, o una copia por proceso en otras plataformas).
+        Retorna una MatrizDistancias de len(origenes) x len(destinos).
+        """
+        origenes = list(origenes)
+        destinos = origenes if destinos is None else list(destinos)
+        columnas = [self.indices.get(d, -1) for d in destinos]
+        filas = [self.indices.get(o, -1) for o in origenes]
+        
+        if workers <= 1 or len(filas) <= 1:
+            resultados = [self._fila_distancias(i, columnas) for i in filas]
+        else:
+            metodos = multiprocessing.get_all_start_methods()
+            contexto = multiprocessing.get_context('fork' if 'fork' in metodos else None)
+            bloque = max(1, len(filas) // (4 * workers))
+            with contexto.Pool(workers, initializer=_iniciar_trabajador,
+                               initargs=(self, columnas)) as pool:
+                resultados = pool.map(_fila_distancias_trabajador, filas, bloque)
+        
+        datos = array('d')
+        for origen, fila in zip(origenes, resultados):
+            if fila is None:  # origen fuera del grafo
+                fila = array('d', [0 if d == origen else float('inf') for d in destinos])
+            datos.extend(fila)
+        return MatrizDistancias(datos, len(origenes), len(destinos))
+    
+    def _fila_distancias(self, origen, columnas):
+        """Distancias desde el índice origen a cada índice de columnas"""
+        if origen < 0:
+            return None
+        distancia, _ = self._dijkstra_indices(origen)
+        infinito = float('inf')
+        return array('d', [distancia[j] if j >= 0 else infinito for j in columnas])
+
+
+class IndiceAlcanzabilidad:
+    """Responde "¿u alcanza a v?" en tiempo casi constante
+
+    Condensa el grafo en su DAG de componentes fuertemente conexas y
+    guarda, para cada componente, el conjunto de componentes alcanzables
+    como un entero usado de mapa de bits. La memoria crece con el
+    cuadrado de la cantidad de componentes (C² / 8 bytes).
+    """
+    
+    def __init__(self, compacto):
+        """Construye el índice para un GrafoCompacto"""
+        self.compacto = compacto
+        self.componente, self.cantidad = compacto.componentes_fuertes()
+        desplazamientos, vecinos = compacto.desplazamientos, compacto.vecinos
+        miembros = [[] for _ in range(self.cantidad)]
+        for v, c in enumerate(self.componente):
+            miembros[c].append(v)
+        
+        # Las componentes de número menor ya están completas (orden inverso)
+        alcance = []
+        for c in range(self.cantidad):
+            bits = 1 << c
+            vistas = set()
+            for v in miembros[c]:
+                for k in range(desplazamientos[v], desplazamientos[v + 1]):
+                    d = self.componente[vecinos[k]]
+                    if d != c and d not in vistas:
+                        vistas.add(d)
+                        bits |= alcance[d]
+            alcance.append(bits)
+        self.alcance = alcance
+    
+    def alcanzable(self, u, v):
+        """Verifica si existe un camino dirigido de u a v"""
+        if u == v:
+            return True
+        indices = self.compacto.indices
+        if u not in indices or v not in indices:
+            return False
+        cu, cv = self.componente[indices[u]], self.componente[indices[v]]
+        if cv > cu:  # descarte rápido por el orden topológico
+            return False
+        return bool(self.alcance[cu] >> cv & 1)
+
+
+class IndiceLandmarks:
+    """Precálculo ALT (A*, landmarks y desigualdad triangular)
+
+    Guarda las distancias desde (y, en grafos dirigidos, hacia) k vértices
+    de referencia. Para cualquier par (v, t) la desigualdad triangular da
+    la cota inferior d(L, t) - d(L, v) <= d(v, t), que guía A* y evita
+    explorar la mayor parte del grafo en cada consulta.
+    """
+    
+    MAGIA = b'ALTLAND1'
+    
+    def __init__(self, compacto, landmarks, desde, hacia):
+        """Crea el índice a partir de tablas ya calculadas (ver construir)"""
+        self.compacto = compacto
+        self.landmarks = landmarks  # índices de los vértices de referencia
+        self.desde = desde  # desde[l][v] = d(landmark l, v)
+        self.hacia = hacia  # hacia[l][v] = d(v, landmark l)
+    
+    @classmethod
+    def construir(cls, compacto, k=8, semilla=0):
+        """Elige k landmarks por el método del más lejano y calcula sus tablas
+
+        El primero es aleatorio (según semilla); cada siguiente es el vértice
+        alcanzable más lejano de los ya elegidos.
+        """
+        n = compacto.numero_vertices()
+        invertido = compacto.invertido()
+        landmarks, desde, hacia = [], [], []
+        if n == 0:
+            return cls(compacto, landmarks, desde, hacia)
+        cercania = [float('inf')] * n  # distancia al landmark más cercano
+        siguiente = random.Random(semilla).randrange(n)
+        for _ in range(min(k, n)):
+            landmarks.append(siguiente)
+            distancia = array('d', compacto._dijkstra_indices(siguiente)[0])
+            desde.append(distancia)
+            hacia.append(distancia if invertido is compacto
+                         else array('d', invertido._dijkstra_indices(siguiente)[0]))
+            mejor = -1.0
+            for v in range(n):
+                if distancia[v] < cercania[v]:
+                    cercania[v] = distancia[v]
+                if cercania[v] != float('inf') and cercania[v] > mejor and v not in landmarks:
+                    mejor, siguiente = cercania[v], v
+            if mejor <= 0:
+                break
+        return cls(compacto, landmarks, desde, hacia)
+    
+    def cota(self, v, t):
+        """Cota inferior de la distancia del índice v al índice t"""
+        mejor = 0
+        infinito = float('inf')
+        for desde, hacia in zip(self.desde, self.hacia):
+            if desde[v] != infinito:
+                mejor = max(mejor, desde[t] - desde[v])
+            if hacia[t] != infinito:
+                mejor = max(mejor, hacia[v] - hacia[t])
+        return mejor
+    
+    def ruta(self, inicio, destino):
+        """Camino más corto con A* guiado por los landmarks
+
+        Retorna (distancia, camino, expandidos) como Grafo.a_estrella.
+        """
+        indices = self.compacto.indices
+        if inicio not in indices or destino not in indices:
+            return (0, [inicio], 0) if inicio == destino else (float('inf'), None, 0)
+        t = indices[destino]
+        distancia, camino, expandidos = self.compacto._a_estrella_indices(
+            indices[inicio], t, lambda v: self.cota(v, t))
+        if camino is not None:
+            camino = [self.compacto.etiquetas[i] for i in camino]
+        return distancia, camino, expandidos
+    
+    def guardar(self, ruta):
+        """Guarda los landmarks y sus tablas en un archivo binario"""
+        cabecera = json.dumps({
+            'version': 1,
+            'etiquetas': self.compacto.etiquetas,
+            'landmarks': self.landmarks,
+            'simetrico': all(d is h for d, h in zip(self.desde, self.hacia)),
+        }, ensure_ascii=False).encode('utf-8')
+        with open(ruta, 'wb') as archivo:
+            archivo.write(self.MAGIA)
+            archivo.write(struct.pack('<q', len(cabecera)))
+            archivo.write(cabecera)
+            for tabla in self.desde:
+                tabla.tofile(archivo)
+            if not all(d is h for d, h in zip(self.desde, self.hacia)):
+                for tabla in self.hacia:
+                    tabla.tofile(archivo)
+    
+    @classmethod
+    def cargar(cls, ruta, grafo):
+        """Carga un índice guardado para `grafo` (Grafo o GrafoCompacto)
+
+        Lanza ValueError si el archivo no corresponde a los vértices del grafo.
+        """
+        compacto = grafo.congelar() if isinstance(grafo, Grafo) else grafo
+        with open(ruta, 'rb') as archivo:
+            if archivo.read(len(cls.MAGIA)) != cls.MAGIA:
+                raise ValueError(f"{ruta} no es un índice de landmarks")
+            largo, = struct.unpack('<q', archivo.read(8))
+            cabecera = json.loads(archivo.read(largo).decode('utf-8'))
+            if [_a_tupla(e) for e in cabecera['etiquetas']] != compacto.etiquetas:
+                raise ValueError("El índice se calculó para otro grafo")
+            n = len(compacto.etiquetas)
+            tablas = []
+            cantidad = len(cabecera['landmarks']) * (1 if cabecera['simetrico'] else 2)
+            for _ in range(cantidad):
+                tabla = array('d')
+                tabla.fromfile(archivo, n)
+                tablas.append(tabla)
+        k = len(cabecera['landmarks'])
+        desde = tablas[:k]
+        hacia = desde if cabecera['simetrico'] else tablas[k:]
+        return cls(compacto, cabecera['landmarks'], desde, hacia)
+
+
+class MatrizDistancias:
+    """Matriz densa de distancias guardada en un único arreglo de doubles"""
+    
+    def __init__(self, datos, filas, columnas):
+        """Envuelve un array('d') de filas * columnas en orden por filas"""
+        self.datos = datos
+        self.forma = (filas, columnas)
+    
+    def __getitem__(self, posicion):
+        """Retorna la distancia en matriz[i, j]"""
+        i, j = posicion
+        return self.datos[i * self.forma[1] + j]
+    
+    def fila(self, i):
+        """Retorna la fila i como lista"""
+        columnas = self.forma[1]
+        return self.datos[i * columnas:(i + 1) * columnas].tolist()
+    
+    def a_numpy(self):
+        """Retorna la matriz como ndarray 2-D sin copiar los datos (requiere NumPy)"""
+        if np is None:
+            raise ImportError("a_numpy requiere NumPy")
+        return np.frombuffer(self.datos, dtype=np.float64).reshape(self.forma)
+
+
+_trabajador = {}
+
+
+def _iniciar_trabajador(compacto, columnas):
+    """Guarda el grafo y las columnas en el proceso trabajador"""
+    _trabajador['compacto'] = compacto
+    _trabajador['columnas'] = columnas
+
+
+def _fila_distancias_trabajador(origen):
+    return _trabajador['compacto']._fila_distancias(origen, _trabajador['columnas'])
+
+
+def _codigo_vecinos(n):
+    """Tipo de array para índices de vértices: int32 si alcanza, si no int64"""
+    return 'i' if n < 2**31 else 'q'
+
+
+def _relleno(posicion):
+    """Bytes que faltan para alinear posicion a 8"""
+    return -posicion % 8
+
+
+def _a_tupla(valor):
+    """Convierte listas de JSON en tuplas para que sirvan como etiquetas"""
+    if isinstance(valor, list):
+        return tuple(_a_tupla(v) for v in valor)
+    return valor
+
+
+def _bloques(iterable, tamano):
+    """Divide un iterable en listas de hasta `tamano` elementos"""
+    iterador = iter(iterable)
+    while True:
+        bloque = list(islice(iterador, tamano))
+        if not bloque:
+            return
+        yield bloque
+
+
+def _convertir_aristas(filas, tipo_vertice, tipo_peso, etiquetas):
+    """Convierte filas de texto en aristas, reutilizando un único objeto por etiqueta"""
+    internar = etiquetas.setdefault
+    aristas = []
+    for fila in filas:
+        if not fila:
+            continue
+        u = tipo_vertice(fila[0])
+        v = tipo_vertice(fila[1])
+        u, v = internar(u, u), internar(v, v)
+        if len(fila) > 2 and fila[2] != '':
+            aristas.append((u, v, tipo_peso(fila[2])))
+        else:
+            aristas.append((u, v))
+    return aristas
+
+
+def reconstruir_camino(predecesores, destino):
+    """Reconstruye el camino hasta destino a partir del mapa de predecesores"""
+    camino = []
+    vertice = destino
+    while vertice is not None:
+        camino.append(vertice)
+        vertice = predecesores[vertice]
+    camino.reverse()
+    return camino
+
+
 def ejemplo_grafo_basico():
     """Ejemplo 1: Grafo básico no dirigido"""
     print("\n" + "="*60)
@@ -203,9 +2229,22 @@ def ejemplo_red_social():
     amigos = amistades.bfs('Carlos')
     print(f"Red de {amigos[0]}: {amigos[1:]}")
     
+    print("\n--- Amigos de amigos de Carlos y de Pedro (2 saltos) ---")
+    for persona, cercanos in zip(['Carlos', 'Pedro'], amistades.vecindario(['Carlos', 'Pedro'], 2)):
+        segundo_grado = [otro for otro, saltos in cercanos.items() if saltos == 2]
+        print(f"{persona}: {segundo_grado}")
+    
     print("\n--- Todos en la red (DFS) ---")
     red = amistades.dfs('Carlos')
     print(f"Personas en la red: {red}")
+    
+    print("\n--- Personas más influyentes (PageRank) ---")
+    for persona, puntaje in sorted(amistades.pagerank().items(), key=lambda p: -p[1]):
+        print(f"  {persona}: {puntaje:.3f}")
+    
+    print("\n--- ¿Cómo se conectan Carlos y Pedro? (BFS bidireccional) ---")
+    camino, expandidos = amistades.camino_bfs_bidireccional('Carlos', 'Pedro')
+    print(f"Camino: {' → '.join(camino)} ({expandidos} personas revisadas)")
 
 
 def ejemplo_mapa_ciudades():
@@ -235,6 +2274,15 @@ def ejemplo_mapa_ciudades():
     for ciudad, distancia in sorted(distancias.items()):
         if ciudad != 'Madrid':
             print(f"Madrid → {ciudad}: {distancia} km")
+    
+    print("\n--- Ruta Barcelona → Sevilla ---")
+    distancia, ruta = mapa.camino_mas_corto('Barcelona', 'Sevilla')
+    print(f"{' → '.join(ruta)}: {distancia} km")
+    
+    print("\n--- Almacén más cercano (Barcelona o Sevilla) ---")
+    distancias, almacen = mapa.dijkstra_multifuente(['Barcelona', 'Sevilla'])
+    for ciudad in sorted(almacen):
+        print(f"{ciudad} → {almacen[ciudad]}: {distancias[ciudad]} km")
 
 
 def main():
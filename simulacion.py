@@ -0,0 +1,253 @@
+"""
+SIMULACIÓN DE EVENTOS DISCRETOS CON COLAS
+Motor para los escenarios del banco y de la impresora: llegadas aleatorias,
+varios servidores y estadísticas calculadas en línea (sin guardar eventos).
+"""
+
+import heapq
+import math
+import multiprocessing
+import random
+
+from ejercicio import Cola
+
+
+LLEGADA = 0
+SALIDA = 1
+
+
+class EstadisticaEnLinea:
+    """Media, varianza, mínimo y máximo acumulados (algoritmo de Welford)"""
+    
+    def __init__(self):
+        """Inicializa sin observaciones"""
+        self.cantidad = 0
+        self.media = 0.0
+        self._m2 = 0.0
+        self.minimo = math.inf
+        self.maximo = -math.inf
+    
+    def agregar(self, valor):
+        """Incorpora una observación en O(1)"""
+        self.cantidad += 1
+        delta = valor - self.media
+        self.media += delta / self.cantidad
+        self._m2 += delta * (valor - self.media)
+        self.minimo = min(self.minimo, valor)
+        self.maximo = max(self.maximo, valor)
+    
+    def varianza(self):
+        """Retorna la varianza muestral"""
+        return self._m2 / (self.cantidad - 1) if self.cantidad > 1 else 0.0
+
+
+class CuantilP2:
+    """Estimación en línea de un cuantil con el algoritmo P² (Jain y Chlamtac)
+    
+    Usa cinco marcadores, así la memoria no depende de la cantidad de
+    observaciones.
+    """
+    
+    def __init__(self, p):
+        """Crea el estimador para el cuantil p (0 < p < 1)"""
+        self.p = p
+        self._alturas = []
+        self._posiciones = [1, 2, 3, 4, 5]
+        self._deseadas = [1, 1 + 2 * p, 1 + 4 * p, 3 + 2 * p, 5]
+        self._incrementos = [0, p / 2, p, (1 + p) / 2, 1]
+    
+    def agregar(self, valor):
+        """Incorpora una observación en O(1)"""
+        alturas = self._alturas
+        if len(alturas) < 5:
+            alturas.append(valor)
+            alturas.sort()
+            return
+        
+        if valor < alturas[0]:
+            alturas[0] = valor
+            celda = 0
+        elif valor >= alturas[4]:
+            alturas[4] = valor
+            celda = 3
+        else:
+            celda = next(i for i in range(4) if alturas[i] <= valor < alturas[i + 1])
+        
+        posiciones = self._posiciones
+        for i in range(celda + 1, 5):
+            posiciones[i] += 1
+        for i in range(5):
+            self._deseadas[i] += self._incrementos[i]
+        
+        for i in (1, 2, 3):
+            d = self._deseadas[i] - posiciones[i]
+            if ((d >= 1 and posiciones[i + 1] - posiciones[i] > 1)
+                    or (d <= -1 and posiciones[i - 1] - posiciones[i] < -1)):
+                paso = 1 if d > 0 else -1
+                altura = self._parabolica(i, paso)
+                if not alturas[i - 1] < altura < alturas[i + 1]:
+                    altura = alturas[i] + paso * (alturas[i + paso] - alturas[i]) / (
+                        posiciones[i + paso] - posiciones[i])
+                alturas[i] = altura
+                posiciones[i] += paso
+    
+    def _parabolica(self, i, paso):
+        q, n = self._alturas, self._posiciones
+        return q[i] + paso / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + paso) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+            + (n[i + 1] - n[i] - paso) * (q[i] - q[i - 1]) / (n[i] - n[i - 1]))
+    
+    def valor(self):
+        """Retorna la estimación actual del cuantil"""
+        alturas = self._alturas
+        if not alturas:
+            return math.nan
+        if len(alturas) < 5:
+            return alturas[min(len(alturas) - 1, int(self.p * len(alturas)))]
+        return alturas[2]
+
+
+class SimuladorColas:
+    """Simulación de una fila única atendida por varios servidores
+    
+    Las llegadas son un proceso de Poisson de `tasa_llegada` clientes por
+    unidad de tiempo; cada atención dura una exponencial de media
+    1 / tasa_servicio (o exactamente eso con servicio='constante').
+    Los eventos se ordenan en un calendario con montículo y los clientes
+    que esperan se guardan en una Cola.
+    """
+    
+    def __init__(self, servidores=1, tasa_llegada=1.0, tasa_servicio=1.5,
+                 servicio='exponencial', semilla=0):
+        """Configura el escenario; la misma semilla repite la simulación"""
+        self.servidores = servidores
+        self.tasa_llegada = tasa_llegada
+        self.tasa_servicio = tasa_servicio
+        self.servicio = servicio
+        self.semilla = semilla
+    
+    def _duracion_servicio(self, azar):
+        if self.servicio == 'constante':
+            return 1 / self.tasa_servicio
+        return azar.expovariate(self.tasa_servicio)
+    
+    def ejecutar(self, clientes):
+        """Simula la llegada de `clientes` clientes; retorna un diccionario de resultados
+        
+        Con `clientes` <= 0 no hay eventos y todas las métricas valen 0.
+        """
+        azar = random.Random(self.semilla)
+        calendario = [(azar.expovariate(self.tasa_llegada), 0, LLEGADA)] if clientes > 0 else []
+        secuencia = 1
+        fila = Cola()
+        libres = self.servidores
+        llegados = 0
+        ocupado = 0.0  # tiempo total de servicio
+        espera = EstadisticaEnLinea()
+        p99 = CuantilP2(0.99)
+        fila_maxima = 0
+        ahora = 0.0
+        
+        while calendario:
+            ahora, _, tipo = heapq.heappop(calendario)
+            if tipo == LLEGADA:
+                llegados += 1
+                if llegados < clientes:
+                    proxima = ahora + azar.expovariate(self.tasa_llegada)
+                    heapq.heappush(calendario, (proxima, secuencia, LLEGADA))
+                    secuencia += 1
+                if not libres:
+                    fila.encolar(ahora)
+                    fila_maxima = max(fila_maxima, fila.tamano())
+                    continue
+                libres -= 1
+                llegada = ahora
+            elif fila.esta_vacia():
+                libres += 1
+                continue
+            else:
+                llegada = fila.desencolar()
+            
+            # Un servidor empieza a atender al cliente que llegó en `llegada`
+            espera_cliente = ahora - llegada
+            espera.agregar(espera_cliente)
+            p99.agregar(espera_cliente)
+            duracion = self._duracion_servicio(azar)
+            ocupado += duracion
+            heapq.heappush(calendario, (ahora + duracion, secuencia, SALIDA))
+            secuencia += 1
+        
+        atendidos = espera.cantidad
+        return {
+            'clientes': atendidos,
+            'espera_media': espera.media,
+            'espera_p99': p99.valor() if atendidos else 0.0,
+            'espera_maxima': espera.maximo if atendidos else 0.0,
+            'utilizacion': ocupado / (self.servidores * ahora) if ahora else 0.0,
+            'fila_maxima': fila_maxima,
+            'tiempo_total': ahora,
+        }
+
+
+def _ejecutar_replica(argumentos):
+    parametros, clientes, semilla = argumentos
+    return SimuladorColas(semilla=semilla, **parametros).ejecutar(clientes)
+
+
+def replicar(parametros, clientes, replicas=4, workers=None, semilla=0):
+    """Ejecuta replicas independientes (semillas consecutivas) en paralelo
+    
+    `parametros` son los argumentos de SimuladorColas sin la semilla.
+    Retorna (lista de resultados, promedio de cada métrica).
+    """
+    if replicas < 1:
+        raise ValueError("replicas debe ser al menos 1")
+    tareas = [(parametros, clientes, semilla + i) for i in range(replicas)]
+    if workers == 1:
+        resultados = [_ejecutar_replica(tarea) for tarea in tareas]
+    else:
+        with multiprocessing.Pool(workers) as pool:
+            resultados = pool.map(_ejecutar_replica, tareas)
+    promedio = {clave: sum(r[clave] for r in resultados) / len(resultados)
+                for clave in resultados[0]}
+    return resultados, promedio
+
+
+def mostrar_resultados(resultados):
+    """Imprime un resumen de los resultados de una simulación"""
+    print(f"Clientes atendidos: {resultados['clientes']:,.0f}")
+    print(f"Espera media: {resultados['espera_media']:.2f} min")
+    print(f"Espera p99: {resultados['espera_p99']:.2f} min")
+    print(f"Utilización de servidores: {resultados['utilizacion']:.1%}")
+    print(f"Fila máxima: {resultados['fila_maxima']:.0f}")
+
+
+def ejemplo_banco():
+    """Banco con 3 cajeros: 2.5 clientes/min, 1 cliente/min por cajero"""
+    print("\n" + "="*60)
+    print("SIMULACIÓN: Banco con 3 cajeros (100.000 clientes)")
+    print("="*60)
+    banco = SimuladorColas(servidores=3, tasa_llegada=2.5, tasa_servicio=1.0, semilla=1)
+    mostrar_resultados(banco.ejecutar(100_000))
+
+
+def ejemplo_impresora():
+    """Impresora única: 0.8 documentos/min, 1 min exacto por documento"""
+    print("\n" + "="*60)
+    print("SIMULACIÓN: Cola de impresión (4 réplicas en paralelo)")
+    print("="*60)
+    parametros = {'servidores': 1, 'tasa_llegada': 0.8, 'tasa_servicio': 1.0,
+                  'servicio': 'constante'}
+    _, promedio = replicar(parametros, 50_000, replicas=4)
+    mostrar_resultados(promedio)
+
+
+def main():
+    """Función principal - Ejecuta las simulaciones"""
+    ejemplo_banco()
+    ejemplo_impresora()
+    print()
+
+
+if __name__ == "__main__":
+    main()
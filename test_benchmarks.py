@@ -0,0 +1,66 @@
+"""
+TESTS UNITARIOS PARA LA SUITE DE BENCHMARKS
+Valida los generadores sintéticos y la comparación con el baseline
+"""
+
+import io
+import os
+import tempfile
+import time
+import unittest
+from contextlib import redirect_stdout
+from benchmarks import GENERADORES, benchmark_grafo, comparar, main, medir
+
+
+class TestBenchmarks(unittest.TestCase):
+    """Tests para benchmarks.py"""
+    
+    def test_generadores_deterministas(self):
+        """Test: La misma semilla produce las mismas aristas"""
+        for nombre, generador in GENERADORES.items():
+            self.assertEqual(generador(200, semilla=7), generador(200, semilla=7), nombre)
+    
+    def test_generadores_tamano(self):
+        """Test: Los vértices generados están dentro del rango pedido"""
+        for nombre, generador in GENERADORES.items():
+            aristas = generador(100)
+            self.assertTrue(aristas, nombre)
+            self.assertTrue(all(0 <= u < 100 and 0 <= v < 100 for u, v, _ in aristas), nombre)
+    
+    def test_benchmark_grafo_claves(self):
+        """Test: benchmark_grafo mide las cuatro operaciones"""
+        resultados = benchmark_grafo('cadena', 50)
+        self.assertEqual(sorted(clave.rsplit('/', 1)[1] for clave in resultados),
+                         ['agregar_arista', 'bfs', 'dfs', 'dijkstra'])
+    
+    def test_comparar_detecta_regresion(self):
+        """Test: Solo se reportan mediciones más lentas que el umbral"""
+        referencia = {'a': 1.0, 'b': 1.0, 'ruido': 1e-5}
+        resultados = {'a': 1.2, 'b': 1.3, 'ruido': 1.0}
+        self.assertEqual(comparar(resultados, referencia, umbral=0.25), [('b', 1.0, 1.3)])
+        self.assertEqual(comparar({'a': 0.05}, {'a': 0.02}, minimo=0.03), [])
+    
+    def test_medir_toma_la_mas_rapida(self):
+        """Test: medir repite la función y retorna la ejecución más rápida"""
+        duraciones = [0.02, 0.0, 0.01]
+        llamadas = []
+        
+        def variable():
+            llamadas.append(1)
+            time.sleep(duraciones[len(llamadas) - 1])
+        
+        self.assertLess(medir(variable, repeticiones=3), 0.01)
+        self.assertEqual(len(llamadas), 3)
+    
+    def test_baseline_propia_sin_regresiones(self):
+        """Test: Comparar contra una baseline recién generada no falla"""
+        with tempfile.TemporaryDirectory() as directorio:
+            ruta = os.path.join(directorio, 'base.json')
+            argumentos = ['--tamanos', '1000', '--repeticiones', '3', '--umbral', '1.0']
+            with redirect_stdout(io.StringIO()):
+                self.assertEqual(main(argumentos + ['--salida', ruta]), 0)
+                self.assertEqual(main(argumentos + ['--baseline', ruta]), 0)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,391 @@
+"""
+TESTS UNITARIOS PARA LA CLASE COLA
+Valida el comportamiento FIFO y las operaciones en lote
+"""
+
+import asyncio
+import io
+import os
+import random
+import tempfile
+import threading
+import unittest
+from contextlib import redirect_stdout
+from collections import deque
+from ejercicio import (Cola, ColaAsincrona, ColaConcurrente, ColaDisco, ColaPrioridad,
+                       ContadorEventos, imprimir_evento)
+
+
+class TestCola(unittest.TestCase):
+    """Tests para la clase Cola"""
+    
+    def setUp(self):
+        """Se ejecuta antes de cada test"""
+        self.cola = Cola()
+    
+    def test_cola_vacia(self):
+        """Test: Cola nueva está vacía"""
+        self.assertTrue(self.cola.esta_vacia())
+        self.assertEqual(self.cola.tamano(), 0)
+        self.assertIsNone(self.cola.desencolar())
+    
+    def test_orden_fifo(self):
+        """Test: Los elementos salen en el orden en que entraron"""
+        for i in range(5):
+            self.cola.encolar(i)
+        
+        resultado = [self.cola.desencolar() for _ in range(5)]
+        self.assertEqual(resultado, [0, 1, 2, 3, 4])
+    
+    def test_primero_no_elimina(self):
+        """Test: primero() no quita el elemento"""
+        self.cola.encolar('a')
+        self.cola.encolar('b')
+        self.assertEqual(self.cola.primero(), 'a')
+        self.assertEqual(self.cola.tamano(), 2)
+    
+    def test_bufer_circular_da_la_vuelta(self):
+        """Test: Intercalar operaciones mantiene el orden al dar la vuelta"""
+        esperado = []
+        obtenido = []
+        for i in range(100):
+            self.cola.encolar(i)
+            esperado.append(i)
+            if i % 3 == 0:
+                obtenido.append(self.cola.desencolar())
+        while not self.cola.esta_vacia():
+            obtenido.append(self.cola.desencolar())
+        
+        self.assertEqual(obtenido, esperado)
+    
+    def test_elementos_en_orden(self):
+        """Test: elementos refleja el contenido en orden FIFO"""
+        for i in range(10):
+            self.cola.encolar(i)
+        for _ in range(4):
+            self.cola.desencolar()
+        self.cola.encolar(10)
+        self.assertEqual(self.cola.elementos, [4, 5, 6, 7, 8, 9, 10])
+    
+    def test_operaciones_en_lote(self):
+        """Test: encolar_muchos y desencolar_muchos respetan FIFO"""
+        self.cola.encolar('x')
+        self.cola.desencolar()
+        self.assertEqual(self.cola.encolar_muchos(range(20)), 20)
+        
+        self.assertEqual(self.cola.desencolar_muchos(5), [0, 1, 2, 3, 4])
+        self.cola.encolar_muchos(range(20, 25))
+        self.assertEqual(self.cola.desencolar_muchos(100), list(range(5, 25)))
+        self.assertTrue(self.cola.esta_vacia())
+    
+    def test_lote_grande_reduce_el_bufer(self):
+        """Test: Vaciar un lote grande deja el búfer ajustado a lo que queda"""
+        self.cola.encolar_muchos(range(1000))
+        self.assertEqual(len(self.cola._bufer), 1024)
+        self.assertEqual(self.cola.desencolar_muchos(995), list(range(995)))
+        self.assertEqual(len(self.cola._bufer), 16)
+        self.assertEqual(self.cola.elementos, list(range(995, 1000)))
+        self.cola.desencolar_muchos(5)
+        self.assertEqual(len(self.cola._bufer), Cola.CAPACIDAD_INICIAL)
+
+    
+    # Tests de Escuchas
+    
+    def test_silenciosa_por_defecto(self):
+        """Test: Sin escuchas la cola no imprime nada"""
+        salida = io.StringIO()
+        with redirect_stdout(salida):
+            self.cola.encolar(1)
+            self.cola.desencolar()
+            self.cola.desencolar()
+        self.assertEqual(salida.getvalue(), '')
+    
+    def test_contador_eventos(self):
+        """Test: ContadorEventos cuenta cada operación"""
+        contador = ContadorEventos()
+        self.cola.agregar_escucha(contador)
+        self.cola.encolar_muchos([1, 2, 3])
+        self.cola.desencolar()
+        self.cola.desencolar_muchos(5)
+        self.cola.primero()
+        
+        self.assertEqual(contador.conteo['encolar'], 3)
+        self.assertEqual(contador.conteo['desencolar'], 3)
+        self.assertEqual(contador.conteo['vacia'], 1)
+    
+    def test_imprimir_evento_reproduce_mensajes(self):
+        """Test: imprimir_evento reproduce los mensajes clásicos"""
+        self.cola.agregar_escucha(imprimir_evento)
+        salida = io.StringIO()
+        with redirect_stdout(salida):
+            self.cola.encolar('a')
+            self.cola.desencolar()
+        self.assertEqual(salida.getvalue(),
+                         "✓ a encolado. Cola: ['a']\n✓ a desencolado. Cola: []\n")
+    
+    def test_quitar_escucha(self):
+        """Test: Una escucha quitada deja de recibir eventos"""
+        contador = ContadorEventos()
+        self.cola.agregar_escucha(contador)
+        self.cola.encolar(1)
+        self.cola.quitar_escucha(contador)
+        self.cola.encolar(2)
+        self.assertEqual(contador.conteo['encolar'], 1)
+
+
+
+class TestColaPrioridad(unittest.TestCase):
+    """Tests para la cola de prioridad indexada"""
+    
+    def setUp(self):
+        """Se ejecuta antes de cada test"""
+        self.cola = ColaPrioridad()
+    
+    def test_sale_menor_prioridad(self):
+        """Test: Los elementos salen ordenados por prioridad"""
+        for elemento, prioridad in [('c', 3), ('a', 1), ('d', 4), ('b', 2)]:
+            self.cola.encolar(elemento, prioridad)
+        
+        self.assertEqual(self.cola.primero(), 'a')
+        self.assertEqual(self.cola.desencolar_muchos(10), ['a', 'b', 'c', 'd'])
+        self.assertIsNone(self.cola.desencolar())
+    
+    def test_empate_fifo(self):
+        """Test: A igual prioridad sale primero el que entró antes"""
+        self.cola.encolar_muchos([('Ana', 1), ('Pedro', 0), ('Juan', 1), ('María', 1)])
+        self.assertEqual(self.cola.desencolar_muchos(4), ['Pedro', 'Ana', 'Juan', 'María'])
+    
+    def test_cambiar_prioridad(self):
+        """Test: cambiar_prioridad reordena al elemento"""
+        manejadores = self.cola.encolar_muchos([('x', 5), ('y', 6), ('z', 7)])
+        self.cola.cambiar_prioridad(manejadores[2], 1)
+        self.cola.cambiar_prioridad(manejadores[0], 9)
+        
+        self.assertEqual(self.cola.prioridad(manejadores[2]), 1)
+        self.assertEqual(self.cola.elementos, ['z', 'y', 'x'])
+        self.cola.desencolar()
+        self.assertFalse(self.cola.contiene(manejadores[2]))
+        self.assertTrue(self.cola.contiene(manejadores[0]))
+    
+    def test_aleatorio_contra_ordenar(self):
+        """Test: Con operaciones aleatorias coincide con ordenar una lista"""
+        azar = random.Random(3)
+        for aridad in (2, 4):
+            cola = ColaPrioridad(aridad=aridad)
+            referencia = {}
+            salidas, esperadas = [], []
+            for paso in range(2000):
+                accion = azar.random()
+                if accion < 0.5 or not referencia:
+                    prioridad = azar.randint(0, 50)
+                    referencia[cola.encolar(paso, prioridad)] = (prioridad, paso)
+                elif accion < 0.7:
+                    manejador = azar.choice(list(referencia))
+                    prioridad = azar.randint(0, 50)
+                    cola.cambiar_prioridad(manejador, prioridad)
+                    referencia[manejador] = (prioridad, referencia[manejador][1])
+                else:
+                    manejador = min(referencia, key=lambda m: (referencia[m][0], m))
+                    esperadas.append(referencia.pop(manejador)[1])
+                    salidas.append(cola.desencolar())
+            self.assertEqual(salidas, esperadas)
+    
+    def test_escuchas(self):
+        """Test: Comparte el mecanismo de escuchas con Cola"""
+        contador = ContadorEventos()
+        self.cola.agregar_escucha(contador)
+        self.cola.encolar('a', 1)
+        self.cola.desencolar()
+        self.cola.desencolar()
+        self.assertEqual(dict(contador.conteo), {'encolar': 1, 'desencolar': 1, 'vacia': 1})
+
+
+class TestColaDisco(unittest.TestCase):
+    """Tests para la cola que desborda a disco"""
+    
+    def setUp(self):
+        """Crea un directorio temporal para los segmentos"""
+        self.directorio = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directorio.cleanup)
+    
+    def _comparar_con_deque(self, cola, pasos=3000):
+        azar = random.Random(11)
+        referencia = deque()
+        for paso in range(pasos):
+            if azar.random() < 0.55:
+                cola.encolar(paso)
+                referencia.append(paso)
+            else:
+                esperado = referencia.popleft() if referencia else None
+                self.assertEqual(cola.desencolar(), esperado)
+            self.assertLessEqual(cola.en_memoria(), 2 * cola.limite_memoria)
+        self.assertEqual(cola.elementos, list(referencia))
+        while referencia:
+            self.assertEqual(cola.desencolar(), referencia.popleft())
+        self.assertTrue(cola.esta_vacia())
+    
+    def test_fifo_con_desborde(self):
+        """Test: Con memoria limitada se conserva el orden FIFO"""
+        with ColaDisco(self.directorio.name, limite_memoria=16) as cola:
+            self._comparar_con_deque(cola)
+    
+    def test_fifo_durable(self):
+        """Test: El modo durable también conserva el orden FIFO"""
+        with ColaDisco(self.directorio.name, limite_memoria=16, durable=True) as cola:
+            self._comparar_con_deque(cola, pasos=600)
+    
+    def test_segmentos_se_borran(self):
+        """Test: Los segmentos consumidos se eliminan del disco"""
+        cola = ColaDisco(self.directorio.name, limite_memoria=4)
+        for i in range(20):
+            cola.encolar(i)
+        self.assertGreater(len(os.listdir(self.directorio.name)), 0)
+        self.assertEqual([cola.desencolar() for _ in range(20)], list(range(20)))
+        self.assertEqual(os.listdir(self.directorio.name), [])
+        cola.cerrar()
+    
+    def test_durable_sobrevive_reinicio(self):
+        """Test: Al reabrir una cola durable continúa donde quedó"""
+        cola = ColaDisco(self.directorio.name, limite_memoria=4, durable=True)
+        for i in range(10):
+            cola.encolar({'trabajo': i})
+        self.assertEqual(cola.desencolar(), {'trabajo': 0})
+        self.assertEqual(cola.desencolar(), {'trabajo': 1})
+        cola.cerrar()
+        
+        reabierta = ColaDisco(self.directorio.name, limite_memoria=4, durable=True)
+        self.assertEqual(reabierta.tamano(), 8)
+        reabierta.encolar({'trabajo': 10})
+        self.assertEqual([reabierta.desencolar()['trabajo'] for _ in range(9)],
+                         list(range(2, 11)))
+        reabierta.cerrar()
+        
+        # Vaciada por completo: lo encolado tras reabrir no debe perderse
+        vacia = ColaDisco(self.directorio.name, limite_memoria=4, durable=True)
+        self.assertEqual(vacia.tamano(), 0)
+        vacia.encolar('b')
+        vacia.cerrar()
+        otra_vez = ColaDisco(self.directorio.name, limite_memoria=4, durable=True)
+        self.assertEqual(otra_vez.tamano(), 1)
+        self.assertEqual(otra_vez.desencolar(), 'b')
+        otra_vez.cerrar()
+    
+    def test_temporal_se_limpia(self):
+        """Test: Sin directorio se usa uno temporal que se borra al cerrar"""
+        cola = ColaDisco(limite_memoria=2)
+        for i in range(10):
+            cola.encolar(i)
+        directorio = cola.directorio
+        cola.cerrar()
+        self.assertFalse(os.path.exists(directorio))
+
+
+class TestColaConcurrente(unittest.TestCase):
+    """Tests para la cola segura entre hilos"""
+    
+    def test_llena_rechaza_con_timeout(self):
+        """Test: encolar en cola llena espera y retorna False al vencer"""
+        cola = ColaConcurrente(capacidad=2)
+        self.assertTrue(cola.encolar(1))
+        self.assertTrue(cola.encolar(2))
+        self.assertFalse(cola.encolar(3, timeout=0.01))
+        self.assertFalse(cola.encolar(3, bloquear=False))
+        self.assertEqual(cola.tamano(), 2)
+    
+    def test_vacia_retorna_none_con_timeout(self):
+        """Test: desencolar en cola vacía espera y retorna None al vencer"""
+        cola = ColaConcurrente()
+        self.assertIsNone(cola.desencolar(timeout=0.01))
+    
+    def test_productores_consumidores(self):
+        """Test: Con varios hilos no se pierde ni se repite ningún elemento"""
+        cola = ColaConcurrente(capacidad=8)
+        recibidos = []
+        candado = threading.Lock()
+        
+        def producir(base):
+            for i in range(500):
+                cola.encolar(base + i)
+        
+        def consumir():
+            for _ in range(500):
+                elemento = cola.desencolar()
+                with candado:
+                    recibidos.append(elemento)
+        
+        hilos = [threading.Thread(target=producir, args=(k * 1000,)) for k in range(4)]
+        hilos += [threading.Thread(target=consumir) for _ in range(4)]
+        for hilo in hilos:
+            hilo.start()
+        for hilo in hilos:
+            hilo.join()
+        
+        esperado = [k * 1000 + i for k in range(4) for i in range(500)]
+        self.assertEqual(sorted(recibidos), esperado)
+        self.assertTrue(cola.esta_vacia())
+
+
+class TestColaAsincrona(unittest.TestCase):
+    """Tests para la cola de asyncio"""
+    
+    def test_productor_consumidor(self):
+        """Test: El consumidor espera al productor y mantiene el orden FIFO"""
+        async def escenario():
+            cola = ColaAsincrona(capacidad=2)
+            
+            async def producir():
+                for i in range(10):
+                    await cola.encolar(i)
+            
+            tarea = asyncio.create_task(producir())
+            recibidos = [await cola.desencolar() for _ in range(10)]
+            await tarea
+            return recibidos
+        
+        self.assertEqual(asyncio.run(escenario()), list(range(10)))
+    
+    def test_timeouts(self):
+        """Test: Los timeouts retornan False o None"""
+        async def escenario():
+            cola = ColaAsincrona(capacidad=1)
+            await cola.encolar('a')
+            lleno = await cola.encolar('b', timeout=0.01)
+            await cola.desencolar()
+            vacio = await cola.desencolar(timeout=0.01)
+            return lleno, vacio
+        
+        self.assertEqual(asyncio.run(escenario()), (False, None))
+    
+    def test_operaciones_por_lote(self):
+        """Test: Los lotes respetan la capacidad y despiertan a los productores"""
+        async def escenario():
+            cola = ColaAsincrona(capacidad=3)
+            entraron = await cola.encolar_muchos(range(5), timeout=0.01)
+            tarea = asyncio.create_task(cola.encolar_muchos([10, 11]))
+            primeros = await cola.desencolar_muchos(2)
+            await tarea
+            return entraron, primeros, await cola.desencolar_muchos(10)
+        
+        self.assertEqual(asyncio.run(escenario()), (3, [0, 1], [2, 10, 11]))
+    
+    def test_escuchas_y_mostrar(self):
+        """Test: quitar_escucha y mostrar delegan en la cola interna"""
+        contador = ContadorEventos()
+        
+        async def escenario():
+            cola = ColaAsincrona()
+            cola.agregar_escucha(contador)
+            await cola.encolar('a')
+            cola.quitar_escucha(contador)
+            await cola.encolar('b')
+            cola.mostrar()
+        
+        salida = io.StringIO()
+        with redirect_stdout(salida):
+            asyncio.run(escenario())
+        self.assertEqual(contador.conteo['encolar'], 1)
+        self.assertIn("['a', 'b']", salida.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -3,8 +3,14 @@ TESTS UNITARIOS PARA LA CLASE GRAFO
 Valida la implementación de grafos y sus algoritmos
 """
 
+import json
+import os
+import tempfile
 import unittest
-from grafo_ejemplos import Grafo
+from ejercicio import ColaPrioridad
+import random
+from grafo_ejemplos import (EstadisticasBusqueda, Grafo, GrafoCompacto, IndiceLandmarks,
+                            ProveedorSQLite, np)
 
 
 class TestGrafo(unittest.TestCase):
@@ -167,6 +173,56 @@ class TestGrafo(unittest.TestCase):
         self.assertIn('A', distancias)
         self.assertIn('B', distancias)
     
+    def test_dijkstra_predecesores(self):
+        """Test: Dijkstra retorna predecesores para reconstruir la ruta"""
+        self.grafo.agregar_arista('A', 'B', peso=3)
+        self.grafo.agregar_arista('B', 'C', peso=2)
+        self.grafo.agregar_arista('A', 'C', peso=10)
+        
+        distancias, predecesores = self.grafo.dijkstra('A', predecesores=True)
+        
+        self.assertEqual(distancias['C'], 5)
+        self.assertEqual(predecesores['C'], 'B')
+        self.assertIsNone(predecesores['A'])
+    
+    def test_dijkstra_destino_parada_temprana(self):
+        """Test: Dijkstra con destino se detiene al fijarlo"""
+        # Cadena A-B-C-D: al fijar B no se debe haber explorado D
+        for u, v in [('A', 'B'), ('B', 'C'), ('C', 'D')]:
+            self.grafo.agregar_arista(u, v)
+        
+        distancias = self.grafo.dijkstra('A', destino='B')
+        
+        self.assertEqual(distancias['B'], 1)
+        self.assertNotIn('D', distancias)  # con destino solo vienen los alcanzados
+        compacto = self.grafo.congelar()
+        self.assertEqual(compacto.dijkstra('A', destino='B'), distancias)
+        self.assertEqual(compacto.camino_mas_corto('A', 'D'), (3, ['A', 'B', 'C', 'D']))
+        self.assertEqual(self.grafo.dijkstra('A', destino='D', frontera=ColaPrioridad),
+                         {'A': 0, 'B': 1, 'C': 2, 'D': 3})
+    
+    def test_camino_mas_corto(self):
+        """Test: camino_mas_corto retorna distancia y ruta"""
+        self.grafo.agregar_arista('A', 'B', peso=3)
+        self.grafo.agregar_arista('B', 'C', peso=2)
+        self.grafo.agregar_arista('A', 'C', peso=10)
+        self.grafo.agregar_arista('X', 'Y')
+        
+        self.assertEqual(self.grafo.camino_mas_corto('A', 'C'), (5, ['A', 'B', 'C']))
+        self.assertEqual(self.grafo.camino_mas_corto('A', 'X'), (float('inf'), None))
+    
+    def test_dijkstra_con_cola_prioridad(self):
+        """Test: Dijkstra con ColaPrioridad como frontera da el mismo resultado"""
+        aristas = [('A', 'B', 4), ('A', 'C', 2), ('B', 'C', 1), ('B', 'D', 5),
+                   ('C', 'D', 8), ('C', 'E', 10), ('D', 'E', 2)]
+        for u, v, w in aristas:
+            self.grafo.agregar_arista(u, v, w)
+        
+        self.assertEqual(self.grafo.dijkstra('A', frontera=ColaPrioridad),
+                         self.grafo.dijkstra('A'))
+        self.assertEqual(self.grafo.dijkstra('A', destino='E', predecesores=True,
+                                             frontera=ColaPrioridad)[1]['E'], 'D')
+    
     # Tests de Casos Especiales
     
     def test_vertices_no_existentes(self):
@@ -223,6 +279,44 @@ class TestGrafo(unittest.TestCase):
         # Debe alcanzar el final
         self.assertIn(99, resultado)
     
+    def test_dfs_sin_limite_de_recursion(self):
+        """Test: DFS iterativo recorre cadenas más largas que el límite de recursión"""
+        for i in range(5000):
+            self.grafo_dirigido.agregar_arista(i, i+1)
+        
+        resultado = self.grafo_dirigido.dfs(0)
+        self.assertEqual(resultado, list(range(5001)))
+    
+    # Tests de Recorridos Perezosos
+    
+    def test_iter_bfs_con_profundidad(self):
+        """Test: iter_bfs genera pares (vértice, saltos)"""
+        aristas = [('A', 'B'), ('A', 'C'), ('B', 'D'), ('C', 'D')]
+        for u, v in aristas:
+            self.grafo.agregar_arista(u, v)
+        
+        niveles = dict(self.grafo.iter_bfs('A', profundidad=True))
+        self.assertEqual(niveles, {'A': 0, 'B': 1, 'C': 1, 'D': 2})
+    
+    def test_iter_dfs_orden_recursivo(self):
+        """Test: iter_dfs visita en el orden del DFS recursivo clásico"""
+        aristas = [('A', 'B'), ('A', 'C'), ('B', 'D'), ('C', 'D'), ('D', 'E')]
+        for u, v in aristas:
+            self.grafo.agregar_arista(u, v)
+        
+        self.assertEqual(list(self.grafo.iter_dfs('A')), ['A', 'B', 'D', 'C', 'E'])
+        self.assertEqual(list(self.grafo.iter_dfs('A', profundidad=True)),
+                         [('A', 0), ('B', 1), ('D', 2), ('C', 3), ('E', 3)])
+    
+    def test_iter_bfs_parada_temprana(self):
+        """Test: Se puede detener el recorrido sin completarlo"""
+        for i in range(1000):
+            self.grafo.agregar_arista(i, i+1)
+        
+        recorrido = self.grafo.iter_bfs(0)
+        primeros = [next(recorrido) for _ in range(3)]
+        self.assertEqual(primeros, [0, 1, 2])
+    
     # Tests de Correctitud
     
     def test_bfs_dfs_mismos_vertices(self):
@@ -248,6 +342,797 @@ class TestGrafo(unittest.TestCase):
         self.assertEqual(len(resultado), 3)
 
 
+class TestComponentes(unittest.TestCase):
+    """Tests para el índice de componentes conexas (unión-búsqueda)"""
+    
+    def setUp(self):
+        """Crea dos componentes: A-B y C-D"""
+        self.grafo = Grafo(dirigido=False)
+        self.grafo.agregar_arista('A', 'B')
+        self.grafo.agregar_arista('C', 'D')
+    
+    def test_componentes_desconectadas(self):
+        """Test: Igual que BFS, A no alcanza a C ni a D"""
+        self.assertTrue(self.grafo.conectados('A', 'B'))
+        self.assertFalse(self.grafo.conectados('A', 'C'))
+        self.assertEqual(self.grafo.numero_componentes(), 2)
+        self.assertEqual(self.grafo.tamano_componente('A'), 2)
+    
+    def test_actualizacion_incremental(self):
+        """Test: agregar_arista une componentes sin recalcular"""
+        indice = self.grafo.activar_componentes()
+        self.grafo.agregar_arista('B', 'C')
+        self.grafo.agregar_aristas([('E', 'F')])
+        
+        self.assertIs(self.grafo.componentes, indice)
+        self.assertTrue(self.grafo.conectados('A', 'D'))
+        self.assertEqual(self.grafo.componente('A'), self.grafo.componente('D'))
+        self.assertEqual(self.grafo.tamano_componente('D'), 4)
+        self.assertEqual(self.grafo.numero_componentes(), 2)
+    
+    def test_vertice_desconocido(self):
+        """Test: Un vértice inexistente solo está conectado consigo mismo"""
+        self.assertTrue(self.grafo.conectados('Z', 'Z'))
+        self.assertFalse(self.grafo.conectados('Z', 'A'))
+        self.assertEqual(self.grafo.tamano_componente('Z'), 1)
+    
+    def test_coincide_con_bfs(self):
+        """Test: conectados coincide con la alcanzabilidad de BFS"""
+        g = Grafo.desde_aristas([(i, (i * 7) % 50) for i in range(0, 50, 3)])
+        for u in list(g.grafo):
+            alcanzados = set(g.bfs(u))
+            for v in g.grafo:
+                self.assertEqual(g.conectados(u, v), v in alcanzados)
+
+
+class TestEstadisticas(unittest.TestCase):
+    """Tests para los contadores de bfs y dijkstra"""
+    
+    def setUp(self):
+        """Crea un triángulo ponderado"""
+        self.grafo = Grafo(dirigido=False)
+        for u, v, w in [('A', 'B', 3), ('B', 'C', 2), ('A', 'C', 10)]:
+            self.grafo.agregar_arista(u, v, w)
+    
+    def test_bfs_cuenta(self):
+        """Test: BFS instrumentado da el mismo orden y cuenta aristas"""
+        medidas = EstadisticasBusqueda()
+        resultado = self.grafo.bfs('A', estadisticas=medidas)
+        
+        self.assertEqual(resultado, self.grafo.bfs('A'))
+        self.assertEqual(medidas.extraidos, 3)
+        self.assertEqual(medidas.aristas_examinadas, 6)
+        self.assertEqual(medidas.frontera_maxima, 2)
+        self.assertIn('busqueda', medidas.tiempos)
+    
+    def test_dijkstra_cuenta_relajaciones(self):
+        """Test: Dijkstra cuenta la relajación que mejora A-C"""
+        medidas = EstadisticasBusqueda()
+        distancias = self.grafo.dijkstra('A', estadisticas=medidas)
+        
+        self.assertEqual(distancias, self.grafo.dijkstra('A'))
+        self.assertEqual(medidas.relajaciones, 3)  # B, C por 10 y C por 5
+        self.assertEqual(medidas.descartados, 1)
+        self.assertEqual(medidas.extraidos, 4)
+        self.assertEqual(set(medidas.tiempos), {'preparacion', 'busqueda'})
+    
+    def test_callback_recibe_estadisticas(self):
+        """Test: Una función recibe las estadísticas al terminar"""
+        recibidas = []
+        self.grafo.dijkstra('A', destino='B', estadisticas=recibidas.append)
+        
+        self.assertEqual(len(recibidas), 1)
+        self.assertEqual(recibidas[0].a_diccionario()['algoritmo'], 'dijkstra')
+
+
+class TestBusquedaPuntoAPunto(unittest.TestCase):
+    """Tests para BFS bidireccional y A*"""
+    
+    def test_bidireccional_camino_minimo(self):
+        """Test: El camino bidireccional tiene la menor cantidad de aristas"""
+        g = Grafo(dirigido=False)
+        for u, v in [('Carlos', 'María'), ('Carlos', 'Juan'), ('María', 'Ana'),
+                     ('Juan', 'Ana'), ('Juan', 'Pedro'), ('Ana', 'Pedro')]:
+            g.agregar_arista(u, v)
+        
+        camino, expandidos = g.camino_bfs_bidireccional('Carlos', 'Pedro')
+        self.assertEqual(camino, ['Carlos', 'Juan', 'Pedro'])
+        self.assertGreater(expandidos, 0)
+    
+    def test_bidireccional_expande_menos_que_bfs(self):
+        """Test: En una rejilla expande menos vértices que un BFS completo"""
+        g = Grafo(dirigido=False)
+        n = 30
+        for i in range(n):
+            for j in range(n):
+                if i + 1 < n:
+                    g.agregar_arista((i, j), (i + 1, j))
+                if j + 1 < n:
+                    g.agregar_arista((i, j), (i, j + 1))
+        
+        camino, expandidos = g.camino_bfs_bidireccional((0, 0), (3, 3))
+        self.assertEqual(len(camino), 7)
+        self.assertLess(expandidos, len(g.bfs((0, 0))))
+    
+    def test_bidireccional_dirigido(self):
+        """Test: En grafos dirigidos respeta el sentido de las aristas"""
+        g = Grafo(dirigido=True)
+        for u, v in [('A', 'B'), ('B', 'C'), ('D', 'C')]:
+            g.agregar_arista(u, v)
+        
+        self.assertEqual(g.camino_bfs_bidireccional('A', 'C')[0], ['A', 'B', 'C'])
+        self.assertIsNone(g.camino_bfs_bidireccional('C', 'A')[0])
+        self.assertIsNone(g.camino_bfs_bidireccional('A', 'D')[0])
+    
+    def test_a_estrella_coincide_con_dijkstra(self):
+        """Test: A* encuentra la misma distancia que Dijkstra"""
+        g = Grafo(dirigido=False)
+        for u, v, w in [('A', 'B', 4), ('A', 'C', 2), ('B', 'C', 1), ('B', 'D', 5),
+                        ('C', 'D', 8), ('C', 'E', 10), ('D', 'E', 2)]:
+            g.agregar_arista(u, v, w)
+        
+        distancia, camino, _ = g.a_estrella('A', 'E')
+        self.assertEqual(distancia, g.dijkstra('A')['E'])
+        self.assertEqual(camino, ['A', 'C', 'B', 'D', 'E'])
+        self.assertEqual(g.a_estrella('A', 'Z'), (float('inf'), None, 5))
+    
+    def test_a_estrella_heuristica_poda(self):
+        """Test: Una heurística manhattan expande menos que sin heurística"""
+        g = Grafo(dirigido=False)
+        n = 20
+        for i in range(n):
+            for j in range(n):
+                if i + 1 < n:
+                    g.agregar_arista((i, j), (i + 1, j))
+                if j + 1 < n:
+                    g.agregar_arista((i, j), (i, j + 1))
+        
+        manhattan = lambda v, t: abs(v[0] - t[0]) + abs(v[1] - t[1])
+        con_h = g.a_estrella((0, 0), (5, 5), manhattan)
+        sin_h = g.a_estrella((0, 0), (5, 5))
+        
+        self.assertEqual(con_h[0], 10)
+        self.assertEqual(sin_h[0], 10)
+        self.assertLess(con_h[2], sin_h[2])
+
+
+class TestCargaMasiva(unittest.TestCase):
+    """Tests para la construcción de grafos desde listas de aristas"""
+    
+    def setUp(self):
+        """Crea un directorio temporal para los archivos de prueba"""
+        self.directorio = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directorio.cleanup)
+    
+    def _archivo(self, nombre, contenido):
+        ruta = os.path.join(self.directorio.name, nombre)
+        with open(ruta, 'w', encoding='utf-8') as archivo:
+            archivo.write(contenido)
+        return ruta
+    
+    def test_desde_aristas_equivale_a_agregar(self):
+        """Test: desde_aristas produce la misma adyacencia que agregar_arista"""
+        aristas = [('A', 'B', 2), ('B', 'C'), ('C', 'A', 5)]
+        g = Grafo(dirigido=False)
+        for arista in aristas:
+            g.agregar_arista(*arista)
+        
+        cargado = Grafo.desde_aristas(aristas)
+        self.assertEqual(dict(cargado.grafo), dict(g.grafo))
+        self.assertGreater(cargado.version, 0)
+    
+    def test_error_a_mitad_invalida_caches(self):
+        """Test: Si una arista falla, lo ya agregado cambia la versión igual"""
+        g = Grafo.desde_aristas([('A', 'B', 1)])
+        g.activar_cache()
+        self.assertEqual(g.dijkstra('A'), {'A': 0, 'B': 1})
+        with self.assertRaises(IndexError):
+            g.agregar_aristas([('B', 'C', 1), ('C',)])
+        self.assertEqual(g.dijkstra('A')['C'], 2)
+        self.assertEqual(g.congelar().numero_aristas(), 4)
+    
+    def test_desde_csv_y_tsv(self):
+        """Test: Carga CSV con encabezado y TSV sin pesos"""
+        ruta_csv = self._archivo('aristas.csv', 'u,v,peso\nA,B,4\nB,C,1.5\n')
+        g = Grafo.desde_csv(ruta_csv, encabezado=True, tamano_bloque=1)
+        self.assertEqual(g.dijkstra('A')['C'], 5.5)
+        
+        ruta_tsv = self._archivo('aristas.tsv', '1\t2\n2\t3\n')
+        g = Grafo.desde_csv(ruta_tsv, dirigido=True, delimitador='\t', tipo_vertice=int)
+        self.assertEqual(g.bfs(1), [1, 2, 3])
+        self.assertEqual(g.bfs(3), [3])
+    
+    def test_desde_jsonl(self):
+        """Test: Carga JSON-lines en forma de listas y de objetos"""
+        lineas = [json.dumps(['A', 'B', 3]), '',
+                  json.dumps({'origen': 'B', 'destino': 'C'})]
+        ruta = self._archivo('aristas.jsonl', '\n'.join(lineas) + '\n')
+        
+        g = Grafo.desde_jsonl(ruta)
+        self.assertEqual(g.dijkstra('A'), {'A': 0, 'B': 3, 'C': 4})
+    
+    def test_etiquetas_compartidas(self):
+        """Test: Las etiquetas repetidas en el CSV o JSON-lines son el mismo objeto"""
+        ruta_csv = self._archivo('aristas.csv', 'nodo_a,nodo_b\nnodo_b,nodo_c\n')
+        ruta_jsonl = self._archivo('aristas.jsonl', '["nodo_a", "nodo_b"]\n["nodo_b", "nodo_c"]\n')
+        for g in (Grafo.desde_csv(ruta_csv, dirigido=True),
+                  Grafo.desde_jsonl(ruta_jsonl, dirigido=True)):
+            destino = g.grafo['nodo_a'][0][0]
+            origen = next(v for v in g.grafo if v == 'nodo_b')
+            self.assertIs(destino, origen)
+    
+    def test_cargadores_indexados(self):
+        """Test: desde_csv y desde_jsonl aceptan indexado y fusionan repetidas"""
+        ruta_csv = self._archivo('repetidas.csv', 'A,B,4\nA,B,2\n')
+        ruta_jsonl = self._archivo('repetidas.jsonl', '["A", "B", 4]\n["A", "B", 2]\n')
+        for g in (Grafo.desde_csv(ruta_csv, indexado=True),
+                  Grafo.desde_jsonl(ruta_jsonl, indexado=True)):
+            self.assertTrue(g.indexado)
+            self.assertEqual(len(g.grafo['A']), 1)
+            self.assertEqual(g.peso('B', 'A'), 2)
+
+
+class TestCentralidad(unittest.TestCase):
+    """Tests para PageRank y las centralidades"""
+    
+    def test_pagerank_suma_uno_y_es_simetrico(self):
+        """Test: PageRank suma 1 y da igual puntaje a vértices simétricos"""
+        g = Grafo.desde_aristas([('A', 'B'), ('B', 'C'), ('C', 'A'), ('C', 'D')])
+        puntajes = g.pagerank()
+        self.assertAlmostEqual(sum(puntajes.values()), 1.0)
+        self.assertAlmostEqual(puntajes['A'], puntajes['B'])
+        self.assertEqual(max(puntajes, key=puntajes.get), 'C')
+    
+    def test_pagerank_reparte_vertices_colgantes(self):
+        """Test: El puntaje de los vértices sin salida se reparte entre todos"""
+        g = Grafo.desde_aristas([('A', 'B'), ('C', 'B')], dirigido=True)
+        puntajes = g.pagerank(tolerancia=1e-12, max_iteraciones=1000)
+        self.assertAlmostEqual(sum(puntajes.values()), 1.0)
+        # A y C solo reciben la parte aleatoria y la que reparte B (colgante)
+        self.assertAlmostEqual(puntajes['A'], puntajes['C'])
+        self.assertAlmostEqual(puntajes['B'], (1 + 0.85 * 2) * puntajes['A'], places=6)
+    
+    def test_pagerank_informa_cada_iteracion(self):
+        """Test: al_iterar recibe cada iteración hasta converger o al tope"""
+        g = Grafo.desde_aristas([(i, (i + 1) % 10) for i in range(10)] + [(0, 5)])
+        iteraciones = []
+        g.pagerank(tolerancia=1e-9, al_iterar=lambda i, cambio, s: iteraciones.append((i, cambio)))
+        self.assertEqual([i for i, _ in iteraciones], list(range(1, len(iteraciones) + 1)))
+        self.assertLess(iteraciones[-1][1], 1e-9)
+        pasos = []
+        g.pagerank(max_iteraciones=3, al_iterar=lambda *a: pasos.append(a))
+        self.assertEqual(len(pasos), 3)
+    
+    def test_centralidad_grado(self):
+        """Test: Grado de salida y de entrada normalizados por n - 1"""
+        g = Grafo.desde_aristas([('A', 'B'), ('A', 'C'), ('A', 'D')], dirigido=True)
+        self.assertEqual(g.centralidad_grado(), {'A': 1.0, 'B': 0.0, 'C': 0.0, 'D': 0.0})
+        self.assertAlmostEqual(g.centralidad_grado(entrada=True)['B'], 1 / 3)
+    
+    def test_centralidad_cercania(self):
+        """Test: Cercanía por saltos, ponderada y con vértices sin salida"""
+        g = Grafo.desde_aristas([('A', 'B'), ('B', 'C'), ('C', 'D')])
+        cercania = g.centralidad_cercania()
+        self.assertAlmostEqual(cercania['A'], 3 / 6)
+        self.assertAlmostEqual(cercania['B'], 3 / 4)
+        ponderada = Grafo.desde_aristas([('A', 'B', 2), ('B', 'C', 2)]).centralidad_cercania(ponderada=True)
+        self.assertAlmostEqual(ponderada['B'], 2 / 4)
+        # Vértice aislado en un grafo dirigido
+        dirigido = Grafo.desde_aristas([('A', 'B')], dirigido=True)
+        self.assertEqual(dirigido.centralidad_cercania()['B'], 0.0)
+
+
+class TestProveedorAdyacencia(unittest.TestCase):
+    """Tests para grafos con las aristas en SQLite"""
+    
+    def setUp(self):
+        """Crea la misma red en memoria y en una base SQLite temporal"""
+        self.directorio = tempfile.TemporaryDirectory()
+        azar = random.Random(5)
+        self.aristas = [(u, azar.randrange(200), azar.randint(1, 9))
+                        for u in range(200) for _ in range(3)]
+        self.memoria = Grafo.desde_aristas(self.aristas)
+        ruta = os.path.join(self.directorio.name, 'grafo.db')
+        self.sqlite = ProveedorSQLite.crear(ruta, self.aristas)
+        self.disco = Grafo.desde_proveedor(self.sqlite, capacidad_cache=50)
+    
+    def tearDown(self):
+        """Cierra la conexión y borra el directorio temporal"""
+        self.sqlite.cerrar()
+        self.directorio.cleanup()
+    
+    def test_bfs_una_consulta_por_nivel(self):
+        """Test: bfs da el mismo orden con una consulta por nivel"""
+        orden, saltos = self.memoria.bfs_por_niveles(0)
+        self.assertEqual(self.disco.bfs(0), orden)
+        self.assertEqual(self.sqlite.consultas, max(saltos.values()) + 1)
+    
+    def test_dijkstra_igual_que_en_memoria(self):
+        """Test: dijkstra por lotes coincide con el grafo en memoria"""
+        self.assertEqual(self.disco.dijkstra(7), self.memoria.dijkstra(7))
+        self.assertEqual(self.disco.camino_mas_corto(3, 150),
+                         self.memoria.camino_mas_corto(3, 150))
+        self.assertLess(self.sqlite.consultas, 100)
+        with self.assertRaises(ValueError):
+            self.disco.dijkstra(7, estadisticas=EstadisticasBusqueda())
+        with self.assertRaises(ValueError):
+            self.disco.dijkstra(7, frontera=ColaPrioridad)
+        cache = self.disco.activar_cache()
+        self.disco.dijkstra(7)
+        self.assertEqual(cache.estadisticas()['entradas'], 0)
+    
+    def test_cache_lru_acotada(self):
+        """Test: La caché de vecinos no pasa de su capacidad"""
+        cache = self.disco.proveedor
+        self.disco.bfs(0)
+        self.assertEqual(len(cache.entradas), 50)
+        self.assertGreater(cache.estadisticas()['desalojos'], 0)
+        consultas = self.sqlite.consultas
+        self.assertEqual(self.disco.grafo.get(0), tuple(self.memoria.grafo[0]))
+        self.disco.grafo.get(0)
+        self.assertEqual(self.sqlite.consultas, consultas + 1)
+    
+    def test_otros_algoritmos_usan_la_vista(self):
+        """Test: dfs y congelar funcionan sobre la vista del proveedor"""
+        self.assertEqual(self.disco.dfs(0), self.memoria.dfs(0))
+    
+    def test_congelar_consulta_por_lotes(self):
+        """Test: congelar lee cada adyacencia una sola vez, en lotes"""
+        compacto = self.disco.congelar()
+        self.assertEqual(compacto.numero_aristas(), self.memoria.congelar().numero_aristas())
+        self.assertLessEqual(self.sqlite.consultas, 2)
+        with self.assertRaises(ValueError):
+            self.disco.bfs(0, estadisticas=EstadisticasBusqueda())
+    
+    def test_solo_lectura(self):
+        """Test: No se pueden agregar aristas ni usar tablas inválidas"""
+        with self.assertRaises(TypeError):
+            self.disco.agregar_arista(1, 2)
+        with self.assertRaises(ValueError):
+            ProveedorSQLite(':memory:', tabla='aristas; DROP TABLE x')
+
+
+class TestVecindario(unittest.TestCase):
+    """Tests para los vecindarios de k saltos por lotes"""
+    
+    def test_coincide_con_bfs_limitado(self):
+        """Test: Cada vecindario coincide con un BFS cortado en k saltos"""
+        azar = random.Random(11)
+        g = Grafo.desde_aristas([(azar.randrange(300), azar.randrange(300)) for _ in range(600)])
+        consultas = [azar.randrange(300) for _ in range(40)] + [5, 5]
+        for k in (0, 1, 2, 3):
+            for vertice, cercanos in zip(consultas, g.vecindario(consultas, k)):
+                esperado = {v: d for v, d in g.iter_bfs(vertice, profundidad=True) if d <= k}
+                self.assertEqual(cercanos, esperado)
+    
+    def test_dirigido_y_vertice_desconocido(self):
+        """Test: Respeta el sentido de las aristas y acepta vértices ausentes"""
+        g = Grafo.desde_aristas([('A', 'B'), ('B', 'C'), ('C', 'D')], dirigido=True)
+        self.assertEqual(g.vecindario(['B', 'Z', 'A'], 2),
+                         [{'B': 0, 'C': 1, 'D': 2}, {'Z': 0}, {'A': 0, 'B': 1, 'C': 2}])
+        self.assertEqual(g.congelar().vecindario(['D'], 5, como_indices=True), [{3: 0}])
+
+
+class TestAdyacenciaIndexada(unittest.TestCase):
+    """Tests para la adyacencia indexada por vecino"""
+    
+    def setUp(self):
+        """Aristas con una repetida (A-B) de distinto peso"""
+        self.aristas = [('A', 'B', 4), ('A', 'C', 2), ('C', 'B', 1), ('B', 'D', 5),
+                        ('C', 'D', 8), ('A', 'B', 3)]
+    
+    def test_fusiona_repetidas_y_recorre_igual(self):
+        """Test: Fusiona repetidas y bfs, dfs y dijkstra no cambian"""
+        indexado = Grafo.desde_aristas(self.aristas, indexado=True)
+        lista = Grafo.desde_aristas(self.aristas)
+        self.assertEqual(len(indexado.grafo['A']), 2)
+        self.assertEqual(indexado.peso('A', 'B'), 3)
+        self.assertEqual(indexado.bfs('A'), lista.bfs('A'))
+        self.assertEqual(indexado.dfs('A'), lista.dfs('A'))
+        self.assertEqual(indexado.dijkstra('A'), lista.dijkstra('A'))
+        self.assertEqual(indexado.camino_mas_corto('A', 'D'), lista.camino_mas_corto('A', 'D'))
+    
+    def test_consultar_actualizar_y_eliminar(self):
+        """Test: Consultar, actualizar y eliminar aristas en ambos modos"""
+        for indexado in (True, False):
+            g = Grafo.desde_aristas(self.aristas, indexado=indexado)
+            self.assertTrue(g.tiene_arista('B', 'A'))
+            self.assertFalse(g.tiene_arista('A', 'D'))
+            self.assertEqual(g.dijkstra('A')['D'], 8)
+            g.actualizar_peso('C', 'B', 10)
+            self.assertEqual(g.peso('B', 'C'), 10)
+            self.assertEqual(g.dijkstra('A')['D'], 8)
+            g.eliminar_arista('A', 'B')
+            self.assertFalse(g.tiene_arista('B', 'A'))
+            self.assertEqual(g.dijkstra('A')['B'], 12)
+            with self.assertRaises(KeyError):
+                g.eliminar_arista('A', 'B')
+            with self.assertRaises(KeyError):
+                g.peso('A', 'Z')
+    
+    def test_cambios_invalidan_caches(self):
+        """Test: Los cambios invalidan caché de rutas, CSR y componentes"""
+        g = Grafo.desde_aristas(self.aristas, dirigido=True, indexado=True)
+        g.activar_cache()
+        self.assertEqual(g.dijkstra('A')['D'], 8)
+        self.assertEqual(g.congelar().numero_aristas(), 5)
+        g.actualizar_peso('B', 'D', 1)
+        self.assertEqual(g.dijkstra('A')['D'], 4)
+        self.assertTrue(g.conectados('A', 'D'))
+        g.eliminar_arista('B', 'D')
+        g.eliminar_arista('C', 'D')
+        self.assertEqual(g.congelar().numero_aristas(), 3)
+        self.assertFalse(g.conectados('A', 'D'))
+        self.assertFalse(g.alcanzable('A', 'D'))
+
+
+class TestMultifuente(unittest.TestCase):
+    """Tests para las búsquedas con varios orígenes"""
+    
+    def setUp(self):
+        """Grafo dirigido aleatorio con varios orígenes (uno repetido)"""
+        azar = random.Random(21)
+        self.grafo = Grafo.desde_aristas(
+            [(azar.randrange(150), azar.randrange(150), azar.randint(1, 20)) for _ in range(400)],
+            dirigido=True)
+        self.origenes = [3, 40, 77, 3]
+    
+    def _minimo_por_origen(self, busqueda):
+        mejor = {}
+        for origen in self.origenes:
+            for vertice, distancia in busqueda(origen).items():
+                if distancia < mejor.get(vertice, (float('inf'),))[0]:
+                    mejor[vertice] = (distancia, origen)
+        return mejor
+    
+    def _comprobar(self, distancias, propietario, busqueda):
+        mejor = self._minimo_por_origen(busqueda)
+        self.assertEqual(distancias, {v: d for v, (d, _) in mejor.items()})
+        # En empates gana el primer origen de la lista, igual que en `mejor`
+        self.assertEqual(propietario, {v: o for v, (_, o) in mejor.items()})
+    
+    def test_dijkstra_multifuente(self):
+        """Test: Coincide con el mínimo de un Dijkstra por origen"""
+        distancias, propietario = self.grafo.dijkstra_multifuente(self.origenes)
+        self._comprobar(distancias, propietario, lambda o: {
+            v: d for v, d in self.grafo.dijkstra(o).items() if d != float('inf')})
+        self.assertEqual(propietario[40], 40)
+    
+    def test_bfs_multifuente(self):
+        """Test: Coincide con el mínimo de un BFS por origen"""
+        saltos, propietario = self.grafo.bfs_multifuente(self.origenes)
+        self._comprobar(saltos, propietario,
+                        lambda o: dict(self.grafo.iter_bfs(o, profundidad=True)))
+    
+    def test_empate_lo_gana_el_primer_origen(self):
+        """Test: A igual distancia el dueño es el origen listado primero"""
+        g = Grafo.desde_aristas([('s1', 'a', 5), ('a', 'x', 1), ('s2', 'b', 1), ('b', 'x', 5)],
+                                dirigido=True)
+        distancias, propietario = g.dijkstra_multifuente(['s1', 's2'])
+        self.assertEqual(distancias['x'], 6)
+        self.assertEqual(propietario['x'], 's1')
+        self.assertEqual(g.dijkstra_multifuente(['s2', 's1'])[1]['x'], 's2')
+        
+        sin_pesos = Grafo.desde_aristas([('s2', 'b'), ('s1', 'a'), ('b', 'x'), ('a', 'x')],
+                                        dirigido=True)
+        self.assertEqual(sin_pesos.bfs_multifuente(['s1', 's2'])[1]['x'], 's1')
+        self.assertEqual(sin_pesos.bfs_multifuente(['s2', 's1'])[1]['x'], 's2')
+    
+    def test_hacia_los_origenes(self):
+        """Test: hacia=True mide la distancia hasta los orígenes"""
+        g = Grafo.desde_aristas([('A', 'B', 1), ('B', 'C', 1), ('D', 'C', 5)], dirigido=True)
+        self.assertEqual(g.dijkstra_multifuente(['C'])[0], {'C': 0})
+        distancias, propietario = g.dijkstra_multifuente(['C', 'A'], hacia=True)
+        self.assertEqual(distancias, {'C': 0, 'A': 0, 'B': 1, 'D': 5})
+        self.assertEqual(propietario['B'], 'C')
+
+
+class TestAlcanzabilidad(unittest.TestCase):
+    """Tests para componentes fuertes e índice de alcanzabilidad"""
+    
+    def setUp(self):
+        """Usa el grafo dirigido del ejemplo 3 más un vértice aislado F->A"""
+        self.grafo = Grafo(dirigido=True)
+        for u, v in [('A', 'B'), ('A', 'C'), ('B', 'D'), ('C', 'B'),
+                     ('D', 'C'), ('D', 'E'), ('F', 'A')]:
+            self.grafo.agregar_arista(u, v)
+    
+    def test_componentes_fuertes(self):
+        """Test: B, C y D forman un ciclo; el resto está solo"""
+        grupos = sorted(sorted(g) for g in self.grafo.componentes_fuertes())
+        self.assertEqual(grupos, [['A'], ['B', 'C', 'D'], ['E'], ['F']])
+    
+    def test_alcanzable_coincide_con_bfs(self):
+        """Test: alcanzable coincide con BFS para todos los pares"""
+        vertices = ['A', 'B', 'C', 'D', 'E', 'F', 'Z']
+        for u in vertices:
+            alcanzados = set(self.grafo.bfs(u))
+            for v in vertices:
+                self.assertEqual(self.grafo.alcanzable(u, v), v in alcanzados, (u, v))
+    
+    def test_reconstruye_al_agregar(self):
+        """Test: Una arista nueva se refleja en la siguiente consulta"""
+        self.assertFalse(self.grafo.alcanzable('E', 'A'))
+        self.grafo.agregar_arista('E', 'F')
+        self.assertTrue(self.grafo.alcanzable('E', 'A'))
+    
+    def test_cadena_larga_sin_recursion(self):
+        """Test: Tarjan iterativo soporta ciclos más largos que el límite de recursión"""
+        g = Grafo.desde_aristas([(i, (i + 1) % 5000) for i in range(5000)], dirigido=True)
+        self.assertEqual(len(g.componentes_fuertes()), 1)
+        self.assertTrue(g.alcanzable(4999, 0))
+
+
+class TestLandmarks(unittest.TestCase):
+    """Tests para el precálculo ALT con landmarks"""
+    
+    def _rejilla(self, n, dirigido=False):
+        azar = random.Random(4)
+        g = Grafo(dirigido=dirigido)
+        for i in range(n):
+            for j in range(n):
+                if i + 1 < n:
+                    g.agregar_arista((i, j), (i + 1, j), azar.randint(1, 9))
+                if j + 1 < n:
+                    g.agregar_arista((i, j), (i, j + 1), azar.randint(1, 9))
+                if dirigido and i > 0:
+                    g.agregar_arista((i, j), (i - 1, j), azar.randint(1, 9))
+        return g
+    
+    def test_rutas_exactas_y_con_menos_expansiones(self):
+        """Test: ALT da la distancia de Dijkstra expandiendo menos vértices"""
+        g = self._rejilla(15)
+        indice = g.preparar_landmarks(k=4)
+        azar = random.Random(1)
+        vertices = list(g.grafo)
+        expandidos_alt = expandidos_dijkstra = 0
+        for _ in range(20):
+            u, v = azar.choice(vertices), azar.choice(vertices)
+            distancia, camino, expandidos = indice.ruta(u, v)
+            medidas = EstadisticasBusqueda()
+            distancias = g.dijkstra(u, destino=v, estadisticas=medidas)
+            
+            self.assertEqual(distancia, distancias[v])
+            self.assertEqual((camino[0], camino[-1]), (u, v))
+            expandidos_alt += expandidos
+            expandidos_dijkstra += medidas.extraidos - medidas.descartados
+        self.assertLess(expandidos_alt, expandidos_dijkstra)
+    
+    def test_dirigido(self):
+        """Test: En grafos dirigidos las cotas usan ambas tablas"""
+        g = self._rejilla(8, dirigido=True)
+        indice = g.preparar_landmarks(k=3, semilla=2)
+        for u, v in [((0, 0), (7, 7)), ((7, 7), (0, 0)), ((3, 5), (6, 1))]:
+            self.assertEqual(indice.ruta(u, v)[0], g.dijkstra(u)[v])
+        self.assertEqual(indice.ruta((0, 7), (0, 0))[1], None)
+    
+    def test_guardar_y_cargar(self):
+        """Test: El índice guardado se recarga y responde igual"""
+        g = self._rejilla(6, dirigido=True)
+        indice = g.preparar_landmarks(k=2)
+        with tempfile.TemporaryDirectory() as directorio:
+            ruta = os.path.join(directorio, 'alt.bin')
+            indice.guardar(ruta)
+            cargado = IndiceLandmarks.cargar(ruta, g)
+            
+            self.assertEqual(cargado.landmarks, indice.landmarks)
+            self.assertEqual(cargado.ruta((0, 0), (5, 5)), indice.ruta((0, 0), (5, 5)))
+            
+            otro = Grafo()
+            otro.agregar_arista('A', 'B')
+            with self.assertRaises(ValueError):
+                IndiceLandmarks.cargar(ruta, otro)
+
+
+class TestGrafoCompacto(unittest.TestCase):
+    """Tests para la vista congelada (CSR) del grafo"""
+    
+    def setUp(self):
+        """Crea un grafo ponderado y su versión congelada"""
+        self.grafo = Grafo(dirigido=False)
+        aristas = [('A', 'B', 4), ('A', 'C', 2), ('B', 'C', 1), ('B', 'D', 5),
+                   ('C', 'D', 8), ('C', 'E', 10), ('D', 'E', 2)]
+        for u, v, w in aristas:
+            self.grafo.agregar_arista(u, v, w)
+        self.compacto = self.grafo.congelar()
+    
+    def test_congelar_retorna_compacto(self):
+        """Test: congelar crea un GrafoCompacto con los mismos tamaños"""
+        self.assertIsInstance(self.compacto, GrafoCompacto)
+        self.assertEqual(self.compacto.numero_vertices(), 5)
+        self.assertEqual(self.compacto.numero_aristas(), 14)
+        self.assertEqual(self.compacto.vecinos_de('A'), [('B', 4), ('C', 2)])
+    
+    def test_recorridos_iguales(self):
+        """Test: BFS y DFS coinciden con los del grafo original"""
+        self.assertEqual(self.compacto.bfs('A'), self.grafo.bfs('A'))
+        self.assertEqual(self.compacto.dfs('A'), self.grafo.dfs('A'))
+    
+    def test_dijkstra_igual(self):
+        """Test: Dijkstra coincide con el del grafo original"""
+        self.assertEqual(self.compacto.dijkstra('A'), self.grafo.dijkstra('A'))
+        self.assertEqual(self.compacto.camino_mas_corto('A', 'E'),
+                         self.grafo.camino_mas_corto('A', 'E'))
+    
+    def test_dirigido_incluye_destinos_sin_salida(self):
+        """Test: Los vértices solo destino también se numeran"""
+        g = Grafo(dirigido=True)
+        g.agregar_arista('A', 'B')
+        compacto = g.congelar()
+        self.assertEqual(compacto.numero_vertices(), 2)
+        self.assertEqual(compacto.bfs('A'), ['A', 'B'])
+        self.assertEqual(compacto.bfs('B'), ['B'])
+    
+    def test_iteradores_iguales(self):
+        """Test: iter_bfs e iter_dfs con profundidad coinciden con Grafo"""
+        for metodo in ('iter_bfs', 'iter_dfs'):
+            self.assertEqual(list(getattr(self.compacto, metodo)('A', profundidad=True)),
+                             list(getattr(self.grafo, metodo)('A', profundidad=True)))
+    
+    def test_congelar_reutiliza_copia(self):
+        """Test: Sin cambios congelar retorna la misma copia"""
+        self.assertIs(self.grafo.congelar(), self.compacto)
+        self.grafo.agregar_arista('E', 'F')
+        self.assertIsNot(self.grafo.congelar(), self.compacto)
+    
+    def test_matriz_distancias(self):
+        """Test: La matriz coincide con Dijkstra por origen"""
+        origenes, destinos = ['A', 'D'], ['A', 'C', 'E', 'Z']
+        matriz = self.grafo.matriz_distancias(origenes, destinos)
+        
+        self.assertEqual(matriz.forma, (2, 4))
+        for i, origen in enumerate(origenes):
+            distancias = self.grafo.dijkstra(origen)
+            for j, destino in enumerate(destinos):
+                self.assertEqual(matriz[i, j], distancias.get(destino, float('inf')))
+    
+    def test_matriz_distancias_en_paralelo(self):
+        """Test: Con varios procesos el resultado es el mismo"""
+        vertices = ['A', 'B', 'C', 'D', 'E']
+        secuencial = self.grafo.matriz_distancias(vertices)
+        paralela = self.grafo.matriz_distancias(vertices, workers=2)
+        self.assertEqual(paralela.datos, secuencial.datos)
+        self.assertEqual(secuencial.fila(0), [0, 3, 2, 8, 10])
+    
+    def test_binario_ida_y_vuelta(self):
+        """Test: guardar_binario y abrir_binario conservan el grafo"""
+        with tempfile.TemporaryDirectory() as directorio:
+            ruta = os.path.join(directorio, 'grafo.bin')
+            self.grafo.guardar_binario(ruta)
+            abierto = Grafo.abrir_binario(ruta)
+            
+            self.assertEqual(abierto.etiquetas, self.compacto.etiquetas)
+            self.assertEqual(abierto.bfs('A'), self.grafo.bfs('A'))
+            self.assertEqual(abierto.dfs('A'), self.grafo.dfs('A'))
+            self.assertEqual(abierto.dijkstra('A'), self.grafo.dijkstra('A'))
+            self.assertEqual(abierto.vecinos_de('B'), self.compacto.vecinos_de('B'))
+            abierto.cerrar()
+    
+    def test_binario_etiquetas_tupla_y_dirigido(self):
+        """Test: Las etiquetas tupla y la dirección sobreviven al formato"""
+        g = Grafo(dirigido=True)
+        g.agregar_arista((0, 0), (0, 1), peso=2.5)
+        with tempfile.TemporaryDirectory() as directorio:
+            ruta = os.path.join(directorio, 'grafo.bin')
+            g.guardar_binario(ruta)
+            abierto = Grafo.abrir_binario(ruta)
+            
+            self.assertTrue(abierto.dirigido)
+            self.assertEqual(abierto.dijkstra((0, 0)), {(0, 0): 0, (0, 1): 2.5})
+            self.assertEqual(abierto.matriz_distancias([(0, 0)], workers=1).fila(0), [0])
+            abierto.cerrar()
+    
+    def test_binario_rechaza_otro_archivo(self):
+        """Test: abrir_binario rechaza archivos que no son grafos"""
+        with tempfile.TemporaryDirectory() as directorio:
+            ruta = os.path.join(directorio, 'otro.bin')
+            with open(ruta, 'wb') as archivo:
+                archivo.write(b'x' * 64)
+            with self.assertRaises(ValueError):
+                Grafo.abrir_binario(ruta)
+    
+    def test_binario_rechaza_truncado(self):
+        """Test: abrir_binario rechaza archivos recortados o más cortos que la cabecera"""
+        with tempfile.TemporaryDirectory() as directorio:
+            ruta = os.path.join(directorio, 'grafo.bin')
+            self.grafo.guardar_binario(ruta)
+            with open(ruta, 'rb') as archivo:
+                contenido = archivo.read()
+            for largo in (len(contenido) - 16 * 8, len(contenido) - 8, 10):
+                with open(ruta, 'wb') as archivo:
+                    archivo.write(contenido[:largo])
+                with self.assertRaises(ValueError):
+                    Grafo.abrir_binario(ruta)
+            with open(ruta, 'wb') as archivo:
+                archivo.write(contenido + bytes(8))
+            with self.assertRaises(ValueError):
+                Grafo.abrir_binario(ruta)
+    
+    def test_bfs_por_niveles_igual_a_bfs(self):
+        """Test: El BFS por niveles da el mismo orden y los mismos saltos"""
+        g = Grafo.desde_aristas([(i, (i * 7 + 3) % 60) for i in range(60)] +
+                                [(i, i + 1) for i in range(0, 60, 5)])
+        orden, saltos = g.bfs_por_niveles(0)
+        
+        self.assertEqual(orden, g.bfs(0))
+        self.assertEqual(saltos, dict(g.iter_bfs(0, profundidad=True)))
+    
+    def test_bfs_por_niveles_indices(self):
+        """Test: Con como_indices se marcan con -1 los no alcanzados"""
+        self.grafo.agregar_arista('X', 'Y')
+        compacto = self.grafo.congelar()
+        orden, saltos = compacto.bfs_por_niveles('A', como_indices=True)
+        
+        self.assertEqual([compacto.etiquetas[i] for i in orden], self.grafo.bfs('A'))
+        self.assertEqual(saltos[compacto.indices['X']], -1)
+        self.assertEqual(saltos[compacto.indices['E']], 2)
+    
+    @unittest.skipIf(np is None, "requiere NumPy")
+    def test_bfs_por_niveles_numpy_igual_a_python(self):
+        """Test: La versión NumPy coincide con la de Python puro"""
+        g = Grafo.desde_aristas([(i, (i * 13 + 1) % 500) for i in range(500)])
+        compacto = g.congelar()
+        self.assertEqual(compacto._niveles_numpy(0), compacto._niveles_python(0))
+    
+    def test_congelado_no_cambia(self):
+        """Test: Aristas nuevas no afectan a la copia congelada"""
+        self.grafo.agregar_arista('E', 'F')
+        self.assertNotIn('F', self.compacto.bfs('A'))
+
+
+class TestCacheRutas(unittest.TestCase):
+    """Tests para la caché de caminos más cortos"""
+    
+    def setUp(self):
+        """Crea un grafo con caché activa"""
+        self.grafo = Grafo(dirigido=False)
+        self.grafo.agregar_arista('A', 'B', peso=3)
+        self.grafo.agregar_arista('B', 'C', peso=2)
+        self.cache = self.grafo.activar_cache(capacidad=2)
+    
+    def test_acierto_tras_primera_consulta(self):
+        """Test: La segunda consulta al mismo origen es un acierto"""
+        primera = self.grafo.dijkstra('A')
+        segunda = self.grafo.dijkstra('A')
+        
+        self.assertEqual(primera, segunda)
+        self.assertEqual(self.cache.fallos, 1)
+        self.assertEqual(self.cache.aciertos, 1)
+    
+    def test_nueva_arista_invalida(self):
+        """Test: agregar_arista invalida los resultados guardados"""
+        self.assertEqual(self.grafo.dijkstra('A')['C'], 5)
+        self.grafo.agregar_arista('A', 'C', peso=1)
+        
+        self.assertEqual(self.grafo.dijkstra('A')['C'], 1)
+        self.assertEqual(self.cache.aciertos, 0)
+        self.assertEqual(self.cache.invalidaciones, 1)
+    
+    def test_desalojo_lru(self):
+        """Test: Se desaloja el origen usado hace más tiempo"""
+        self.grafo.dijkstra('A')
+        self.grafo.dijkstra('B')
+        self.grafo.dijkstra('A')
+        self.grafo.dijkstra('C')  # desaloja B
+        
+        self.assertEqual(self.cache.desalojos, 1)
+        self.assertIn('A', self.cache.entradas)
+        self.assertNotIn('B', self.cache.entradas)
+    
+    def test_resultado_es_copia(self):
+        """Test: Modificar el resultado no altera la caché"""
+        self.grafo.dijkstra('A')['C'] = -1
+        self.assertEqual(self.grafo.dijkstra('A')['C'], 5)
+        self.grafo.dijkstra('A', predecesores=True)[1]['C'] = 'X'
+        self.assertEqual(self.grafo.dijkstra('A', predecesores=True)[1]['C'], 'B')
+    
+    def test_destino_y_predecesores_desde_cache(self):
+        """Test: Consultas con destino y predecesores usan la caché"""
+        self.grafo.dijkstra('A')
+        self.assertEqual(self.grafo.camino_mas_corto('A', 'C'), (5, ['A', 'B', 'C']))
+        self.assertEqual(self.cache.estadisticas()['aciertos'], 1)
+
+
 class TestIntegracion(unittest.TestCase):
     """Tests de integración"""
     
@@ -0,0 +1,85 @@
+"""
+TESTS UNITARIOS PARA EL MOTOR DE SIMULACIÓN
+Valida las estadísticas en línea y resultados conocidos de teoría de colas
+"""
+
+import random
+import unittest
+from simulacion import CuantilP2, EstadisticaEnLinea, SimuladorColas, replicar
+
+
+class TestEstadisticas(unittest.TestCase):
+    """Tests para las estadísticas en línea"""
+    
+    def test_media_y_varianza(self):
+        """Test: Welford coincide con el cálculo directo"""
+        datos = [2, 4, 4, 4, 5, 5, 7, 9]
+        estadistica = EstadisticaEnLinea()
+        for dato in datos:
+            estadistica.agregar(dato)
+        
+        self.assertAlmostEqual(estadistica.media, 5.0)
+        self.assertAlmostEqual(estadistica.varianza(), 32 / 7)
+        self.assertEqual((estadistica.minimo, estadistica.maximo), (2, 9))
+    
+    def test_cuantil_p2(self):
+        """Test: P² aproxima el percentil 99 de datos uniformes"""
+        azar = random.Random(5)
+        cuantil = CuantilP2(0.99)
+        datos = [azar.random() for _ in range(20_000)]
+        for dato in datos:
+            cuantil.agregar(dato)
+        
+        exacto = sorted(datos)[int(0.99 * len(datos))]
+        self.assertAlmostEqual(cuantil.valor(), exacto, delta=0.01)
+
+
+class TestSimulador(unittest.TestCase):
+    """Tests para SimuladorColas"""
+    
+    def test_mm1_espera_teorica(self):
+        """Test: En M/M/1 con λ=1 y μ=2 la espera media tiende a 0.5"""
+        resultados = SimuladorColas(1, tasa_llegada=1.0, tasa_servicio=2.0,
+                                    semilla=3).ejecutar(100_000)
+        
+        self.assertEqual(resultados['clientes'], 100_000)
+        self.assertAlmostEqual(resultados['espera_media'], 0.5, delta=0.05)
+        self.assertAlmostEqual(resultados['utilizacion'], 0.5, delta=0.02)
+        self.assertGreater(resultados['espera_p99'], resultados['espera_media'])
+    
+    def test_servidores_suficientes_sin_espera(self):
+        """Test: Servicio constante más corto que toda llegada nunca espera"""
+        resultados = SimuladorColas(2, tasa_llegada=0.001, tasa_servicio=1000.0,
+                                    servicio='constante').ejecutar(1000)
+        self.assertEqual(resultados['espera_maxima'], 0.0)
+        self.assertEqual(resultados['fila_maxima'], 0)
+    
+    def test_misma_semilla_mismo_resultado(self):
+        """Test: La simulación es reproducible con la misma semilla"""
+        a = SimuladorColas(2, 1.5, 1.0, semilla=9).ejecutar(5000)
+        b = SimuladorColas(2, 1.5, 1.0, semilla=9).ejecutar(5000)
+        self.assertEqual(a, b)
+    
+    def test_replicas_en_paralelo(self):
+        """Test: Las réplicas en procesos coinciden con las secuenciales"""
+        parametros = {'servidores': 2, 'tasa_llegada': 1.5, 'tasa_servicio': 1.0}
+        secuencial, _ = replicar(parametros, 2000, replicas=3, workers=1)
+        paralelo, promedio = replicar(parametros, 2000, replicas=3, workers=2)
+        
+        self.assertEqual(secuencial, paralelo)
+        self.assertNotEqual(paralelo[0], paralelo[1])
+        self.assertEqual(promedio['clientes'], 2000)
+    
+    def test_sin_clientes_ni_replicas(self):
+        """Test: Cero clientes da métricas en cero y cero réplicas es un error"""
+        resultados = SimuladorColas(2, 1.5, 1.0).ejecutar(0)
+        self.assertEqual(resultados, {'clientes': 0, 'espera_media': 0.0, 'espera_p99': 0.0,
+                                      'espera_maxima': 0.0, 'utilizacion': 0.0,
+                                      'fila_maxima': 0, 'tiempo_total': 0.0})
+        self.assertEqual(SimuladorColas().ejecutar(-3)['clientes'], 0)
+        with self.assertRaises(ValueError):
+            replicar({'servidores': 1}, 100, replicas=0, workers=1)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)